@@ -1,29 +1,22 @@
 # Dependencies
 import re
 
-import PyPDF2
 import numpy as np
 import streamlit as st
 import pandas as pd
 
 from catalog.teams import NAMES
-from scouter import (
-    parse_page_one,
-    parse_page_two,
-    parse_page_three,
-    parse_page_four,
-    parse_page_five,
-    parse_last_pages,
-)
+from page_cache import hash_pdf
+from patterns import REGISTRY
+from scouter import extract_text_from_pdf, parse_gamebook
 
 # Const
-PARSERS = [
-    parse_page_one,
-    parse_page_two,
-    parse_page_three,
-    parse_page_four,
-    parse_page_five,
-]
+CACHE_MAX_ENTRIES = 32  # Anzahl gecachter Gamebooks (LRU)
+CACHE_TTL_SECONDS = 60 * 60  # Lebensdauer eines Cache-Eintrags
+# Seiten im Prozess-Pool extrahieren. Aus, da der Streamlit-Server mehrere
+# Threads hat (fork ist dort unsicher) und ein Gamebook mit 10-20 Seiten
+# seriell schneller ist als der Start des Pools.
+EXTRACT_PARALLEL = False
 
 # Column names
 COLUMN_PLAY_NUMBER = "PLAY #"
@@ -41,6 +34,8 @@ COLUMN_PENALTY = "PENALTY"
 COLUMN_SCORE_DIFF = "SCORE DIFF"
 COLUMN_SCORE_SCOUT = "SCORE SCOUT"
 COLUMN_SCORE_OPP = "SCORE OPP"
+COLUMN_POINTS_SCOUT = "POINTS SCOUT"
+COLUMN_POINTS_OPP = "POINTS OPP"
 COLUMN_CAUGHT_ON = "CAUGHT ON"
 COLUMN_KICK_YARDS = "KICK YARDS"
 COLUMN_RET_YARDS = "RET YARDS"
@@ -114,13 +109,71 @@ VIEW_TARGET = [
 ]
 
 
+# Player roles
+## Spalte -> (Patterns, Stichwörter). Ein Pattern kann nur treffen, wenn eines
+## der Stichwörter in "Details" vorkommt; die Patterns werden der Reihe nach
+## versucht, der erste Treffer gilt (Kicker vor Punter).
+PATTERN_NAME = r"([A-Z]\. ?[A-Z][a-z]+)"
+RE_ROLE_PASSER = REGISTRY.register(
+    "role_passer", r"([A-Z]\.?\s[A-Z][a-z]+)\s(?:pass|gets sacked)"
+)
+RE_ROLE_RUSHER = REGISTRY.register("role_rusher", r"([A-Z]\.?\s[A-Z][a-z]+)\s(?:rush)")
+RE_ROLE_RECEIVER = REGISTRY.register(
+    "role_receiver", r"complete to ([A-Z]\.?\s[A-Z][a-z]+)\sfor"
+)
+RE_ROLE_TACKLER = REGISTRY.register(
+    "role_tackler", r"tackled by ([A-Z]\.?\s[A-Z][a-z]+)"
+)
+RE_ROLE_TACKLER2 = REGISTRY.register(
+    "role_tackler2", rf"tackled by [A-Z]\. ?[A-Z][a-z]+ and {PATTERN_NAME}"
+)
+RE_ROLE_KICKER = REGISTRY.register(
+    "role_kicker",
+    rf"{PATTERN_NAME}\s(?:attempts an extra point"
+    r"|attempts a \d+\s+yards field goal|kickoff)",
+)
+RE_ROLE_PUNTER = REGISTRY.register("role_punter", rf"{PATTERN_NAME}\s+punt")
+RE_ROLE_RETURNER = REGISTRY.register("role_returner", rf"returned by {PATTERN_NAME}")
+RE_ROLE_RECOVERED = REGISTRY.register(
+    "role_recovered", rf"Recovered by team [A-Za-z ]+ by {PATTERN_NAME}"
+)
+RE_ROLE_INTERCEPTED = REGISTRY.register(
+    "role_intercepted", rf"pass intercepted by {PATTERN_NAME}"
+)
+
+PLAYER_ROLES = {
+    "Passer": ([RE_ROLE_PASSER], ("pass", "gets sacked")),
+    "Rusher": ([RE_ROLE_RUSHER], ("rush",)),
+    "Receiver": ([RE_ROLE_RECEIVER], ("complete to",)),
+    "Tackler": ([RE_ROLE_TACKLER], ("tackled by",)),
+    "Tackler 2": ([RE_ROLE_TACKLER2], ("tackled by",)),
+    "Kicker": ([RE_ROLE_KICKER, RE_ROLE_PUNTER], ("attempts a", "kickoff", "punt")),
+    "Returner": ([RE_ROLE_RETURNER], ("returned by",)),
+    "Recovered": ([RE_ROLE_RECOVERED], ("Recovered by team",)),
+    "Intercepted": ([RE_ROLE_INTERCEPTED], ("pass intercepted by",)),
+}
+
+
 # Func
-def extract_text_from_pdf(uploaded_file):
-    if uploaded_file is not None:
-        reader = PyPDF2.PdfReader(uploaded_file)
-        text_per_page = [page.extract_text() for page in reader.pages]
-        return text_per_page
-    return None
+@st.cache_data(
+    max_entries=CACHE_MAX_ENTRIES,
+    ttl=CACHE_TTL_SECONDS,
+    show_spinner="Gamebook wird extrahiert ...",
+)
+def extract_doc(pdf_hash: str, _pdf_bytes: bytes) -> dict:
+    """
+    Extrahiert und parst ein Gamebook, gecacht über den Hash des PDF-Inhalts.
+
+    Streamlit hasht nur `pdf_hash`; `_pdf_bytes` ist durch den Unterstrich vom
+    Hashing ausgenommen, damit bei jedem Rerun nicht das ganze PDF gehasht wird.
+
+    :param pdf_hash: SHA-256 des PDF-Inhalts (siehe `hash_pdf`)
+    :param _pdf_bytes: Inhalt der PDF-Datei
+    :return: Dictionary mit allen extrahierten Abschnitten
+    """
+    pages = extract_text_from_pdf(_pdf_bytes, parallel=EXTRACT_PARALLEL)
+    # Tabellen spaltenweise, damit sie direkt an pd.DataFrame gehen
+    return parse_gamebook(pages, columnar=True)
 
 
 def dict_to_dataframe(data: dict) -> pd.DataFrame:
@@ -247,6 +300,89 @@ def add_play_column(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
+def categorize_play(details):
+    """Spielzugtyp eines Plays aus "Details"; die erste zutreffende Regel gewinnt."""
+    details_lower = details.lower()
+    if "rush" in details_lower:
+        return "Run"
+    elif "pass" in details_lower or "sacked" in details_lower:
+        return "Pass"
+    elif "field goal" in details_lower:
+        return "FG"
+    elif "punt" in details_lower:
+        return "Punt"
+    elif "timeout" in details_lower:
+        return None
+    elif "knee" in details_lower:
+        return "Run"
+    elif "kickoff" in details_lower:
+        return "KO"
+    elif "extra point" in details_lower:
+        return "Extra Pt."
+    return None
+
+
+def categorize_result(details):
+    """Ausgang eines Plays aus "Details"; die erste zutreffende Regel gewinnt."""
+    details_lower = details.lower()
+    if "no-play" in details_lower:
+        return "Penalty"  # TODO: write function to add row
+    elif "safety" in details_lower:
+        # TODO: Changed from Penalty (Pending) to "Safety" because of +2
+        return "Safety"
+    # elif "penalty" in details_lower:
+    #     return "Penalty (Pending)"
+    elif "rush" in details_lower or "knee" in details_lower:
+        if "fumbles" in details_lower:
+            return "Fumble"  # TODO: check if possesion changed
+        elif "touchdown" in details_lower:
+            return "Rush, TD"
+        elif "two-point-conversion" in details_lower:
+            return "Rush, TPC"  # TODO: added two-point-conversion as TPC check
+        return "Rush"
+    elif "incomplete" in details_lower:
+        return "Incomplete"
+    elif "complete" in details_lower:
+        if "fumbles" in details_lower:
+            return "Complete, Fumble"  # TODO: check if possesion changed
+        elif "touchdown" in details_lower:
+            return "Complete, TD"
+        elif "two-point-conversion" in details_lower:
+            return "Complete, TPC"  # TODO: added two-point-conversion as TPC check
+        return "Complete"
+    elif "sacked" in details_lower:
+        if "fumbles" in details_lower:
+            return "Sack, Fumble"  # TODO: check if possesion changed
+        return "Sack"
+    elif "intercepted" in details_lower:
+        if "touchdown" in details_lower:
+            return "Interception, TD"
+        return "Interception"
+    elif "succeeds" in details_lower:
+        return "Good"
+    elif "is good" in details_lower:
+        return "Good"
+    elif "misses" in details_lower:
+        return "No good"
+    elif "no good" in details_lower:
+        return "No good"
+    elif "returned" in details_lower:
+        return "Return"
+    elif "fair catch" in details_lower:
+        return "Fair Catch"
+    elif "timeout" in details_lower:
+        return "Timeout"
+    elif "end of game" in details_lower:
+        return "COP"
+    elif "out-of-bounds" in details_lower:
+        return "Out of Bounds"
+    elif "touchback" in details_lower:
+        return "Touchback"  # TODO: touchback/major touchback
+    elif "downed" in details_lower:
+        return "Downed"
+    return "Other"
+
+
 def add_play_type(df: pd.DataFrame) -> pd.DataFrame:
     """
     Fügt eine neue Spalte "Play Type" hinzu, die basierend auf dem Inhalt der "Details"-Spalte den Spielzugtyp bestimmt.
@@ -254,27 +390,6 @@ def add_play_type(df: pd.DataFrame) -> pd.DataFrame:
     :param df: Pandas DataFrame mit einer "Details"-Spalte
     :return: DataFrame mit der neuen "Play Type"-Spalte
     """
-
-    def categorize_play(details):
-        details_lower = details.lower()
-        if "rush" in details_lower:
-            return "Run"
-        elif "pass" in details_lower or "sacked" in details_lower:
-            return "Pass"
-        elif "field goal" in details_lower:
-            return "FG"
-        elif "punt" in details_lower:
-            return "Punt"
-        elif "timeout" in details_lower:
-            return None
-        elif "knee" in details_lower:
-            return "Run"
-        elif "kickoff" in details_lower:
-            return "KO"
-        elif "extra point" in details_lower:
-            return "Extra Pt."
-        return None
-
     df[COLUMN_PLAY_TYPE] = df["Details"].apply(categorize_play)
     return df
 
@@ -286,65 +401,6 @@ def add_result_column(df: pd.DataFrame) -> pd.DataFrame:
     :param df: Pandas DataFrame mit einer "Details"-Spalte
     :return: DataFrame mit der neuen "Result"-Spalte
     """
-
-    def categorize_result(details):
-        details_lower = details.lower()
-        if "no-play" in details_lower:
-            return "Penalty"  # TODO: write function to add row
-        elif "safety" in details_lower:
-            return "Safety"  # TODO: Changed from Penalty (Pending) to "Safety" because of +2
-        # elif "penalty" in details_lower:
-        #     return "Penalty (Pending)"
-        elif "rush" in details_lower or "knee" in details_lower:
-            if "fumbles" in details_lower:
-                return "Fumble"  # TODO: check if possesion changed
-            elif "touchdown" in details_lower:
-                return "Rush, TD"
-            elif "two-point-conversion" in details_lower:
-                return "Rush, TPC"  # TODO: added two-point-conversion as TPC check
-            return "Rush"
-        elif "incomplete" in details_lower:
-            return "Incomplete"
-        elif "complete" in details_lower:
-            if "fumbles" in details_lower:
-                return "Complete, Fumble"  # TODO: check if possesion changed
-            elif "touchdown" in details_lower:
-                return "Complete, TD"
-            elif "two-point-conversion" in details_lower:
-                return "Complete, TPC"  # TODO: added two-point-conversion as TPC check
-            return "Complete"
-        elif "sacked" in details_lower:
-            if "fumbles" in details_lower:
-                return "Sack, Fumble"  # TODO: check if possesion changed
-            return "Sack"
-        elif "intercepted" in details_lower:
-            if "touchdown" in details_lower:
-                return "Interception, TD"
-            return "Interception"
-        elif "succeeds" in details_lower:
-            return "Good"
-        elif "is good" in details_lower:
-            return "Good"
-        elif "misses" in details_lower:
-            return "No good"
-        elif "no good" in details_lower:
-            return "No good"
-        elif "returned" in details_lower:
-            return "Return"
-        elif "fair catch" in details_lower:
-            return "Fair Catch"
-        elif "timeout" in details_lower:
-            return "Timeout"
-        elif "end of game" in details_lower:
-            return "COP"
-        elif "out-of-bounds" in details_lower:
-            return "Out of Bounds"
-        elif "touchback" in details_lower:
-            return "Touchback"  # TODO: touchback/major touchback
-        elif "downed" in details_lower:
-            return "Downed"
-        return "Other"
-
     df[COLUMN_RESULT] = df["Details"].apply(categorize_result)
     return df
 
@@ -369,21 +425,24 @@ def verify_fumble(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Der modifizierte DataFrame mit aktualisierten Werten in der "RESULT"-Spalte.
     """
-    for index, row in df.iterrows():
-        current_result = row["RESULT"].lower()
-        if "fumble" in current_result:
-            current_poss = row["POSS"]
-            next_poss = df["POSS"].shift(-1).iloc[index]
-            print(f"{current_poss = }")
-            print(f"{next_poss = }")
-            if current_poss == next_poss:
-                if "sack" in current_result:
-                    new_result = "Sack"
-                elif "complete" in current_result:
-                    new_result = "Complete"
-                else:
-                    new_result = "Rush"
-                df.at[index, "RESULT"] = new_result
+    result = df[COLUMN_RESULT].str.lower()
+    # Ballbesitz im nächsten Play; für den letzten Play füllt shift mit
+    # NaN bzw. bei object-Spalten mit None. Vergleich über die Werte wie mit
+    # `==` in Python (None == None), genau wie in der früheren Zeilenschleife
+    next_poss = df["POSS"].shift(-1)
+    same_poss = df["POSS"].to_numpy(dtype=object) == next_poss.to_numpy(dtype=object)
+    kept = result.str.contains("fumble", regex=False) & same_poss
+
+    # Fumble ohne Ballbesitzwechsel: Ergebnis ohne Fumble
+    kept_result = result[kept]
+    df.loc[kept, COLUMN_RESULT] = np.select(
+        [
+            kept_result.str.contains("sack", regex=False),
+            kept_result.str.contains("complete", regex=False),
+        ],
+        ["Sack", "Complete"],
+        default="Rush",
+    )
     return df
 
 
@@ -565,193 +624,105 @@ def split_penalty_rows(df: pd.DataFrame) -> pd.DataFrame:
     return new_df
 
 
-def add_passer_column(df: pd.DataFrame) -> pd.DataFrame:
+def extract_players(details, roles: list | None = None) -> list:
     """
-    Fügt eine neue Spalte "Passer" hinzu, die den Namen des Passgebers extrahiert.
+    Extrahiert die Namen der Spieler-Rollen (siehe `PLAYER_ROLES`) aus "Details".
 
-    :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit der neuen "Passer"-Spalte
+    :param details: String aus der "Details"-Spalte
+    :param roles: Rollen, deren Patterns geprüft werden (Default: alle aus `PLAYER_ROLES`)
+    :return: Name oder None pro Rolle, in der Reihenfolge von `roles`
     """
-
-    def extract_passer(details):
-        match = re.search(r"([A-Z]\.?\s[A-Z][a-z]+)\s(?:pass|gets sacked)", details)
-        return match.group(1) if match else None
-
-    df["Passer"] = df["Details"].apply(extract_passer)
-    return df
+    if roles is None:
+        roles = list(PLAYER_ROLES)
+    if not isinstance(details, str):
+        return [None] * len(roles)
+
+    names = []
+    for role in roles:
+        patterns, keywords = PLAYER_ROLES[role]
+        name = None
+        for keyword in keywords:
+            # Ohne Stichwort kann keines der Patterns treffen
+            if keyword not in details:
+                continue
+            for pattern in patterns:
+                match = pattern.search(details)
+                if match:
+                    name = match.group(1)
+                    break
+            break
+        names.append(name)
+    return names
 
 
-def add_rusher_column(df: pd.DataFrame) -> pd.DataFrame:
+def add_player_columns(df: pd.DataFrame, roles: list | None = None) -> pd.DataFrame:
     """
-    Fügt eine neue Spalte "Rusher" hinzu, die den Namen des Ballträgers extrahiert.
+    Fügt für jede Spieler-Rolle eine Spalte mit dem Namen des Spielers hinzu.
+
+    Alle Rollen werden in einem Durchlauf über die "Details"-Spalte extrahiert.
 
     :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit der neuen "Rusher"-Spalte
+    :param roles: Spalten, die hinzugefügt werden (Default: alle aus `PLAYER_ROLES`)
+    :return: DataFrame mit den neuen Spalten
     """
-
-    def extract_rusher(details):
-        match = re.search(r"([A-Z]\.?\s[A-Z][a-z]+)\s(?:rush)", details)
-        return match.group(1) if match else None
-
-    df["Rusher"] = df["Details"].apply(extract_rusher)
+    # Nur die Patterns der angeforderten Rollen laufen lassen
+    selected = [role for role in PLAYER_ROLES if roles is None or role in roles]
+    names = [extract_players(details, selected) for details in df["Details"]]
+    for position, role in enumerate(selected):
+        df[role] = pd.Series(
+            [row[position] for row in names], index=df.index, dtype=object
+        )
     return df
 
 
-def add_receiver_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte "Receiver" hinzu, die den Namen des Passempfängers extrahiert.
+def add_passer_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Fügt die Spalte "Passer" hinzu (siehe `add_player_columns`)."""
+    return add_player_columns(df, ["Passer"])
 
-    :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit der neuen "Receiver"-Spalte
-    """
 
-    def extract_receiver(details):
-        """
-        Extrahiert den Namen des Receivers aus der "Details"-Spalte, wenn "complete to" vorkommt.
+def add_rusher_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Fügt die Spalte "Rusher" hinzu (siehe `add_player_columns`)."""
+    return add_player_columns(df, ["Rusher"])
 
-        :param details: String aus der "Details"-Spalte
-        :return: Name des Receivers oder None
-        """
-        match = re.search(r"complete to ([A-Z]\.?\s[A-Z][a-z]+)\sfor", details)
-        return match.group(1) if match else None
 
-    df["Receiver"] = df["Details"].apply(extract_receiver)
-    return df
+def add_receiver_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Fügt die Spalte "Receiver" hinzu (siehe `add_player_columns`)."""
+    return add_player_columns(df, ["Receiver"])
 
 
 def add_tackler_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte "Tackler" hinzu, die den Namen des Tacklers extrahiert.
-
-    :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit der neuen "Tackler"-Spalte
-    """
-
-    def extract_tackler(details):
-        """
-        Extrahiert den Namen des Tacklers aus der "Details"-Spalte, wenn "tackled by" vorkommt.
-
-        :param details: String aus der "Details"-Spalte
-        :return: Name des Tacklers oder None
-        """
-        match = re.search(r"tackled by ([A-Z]\.?\s[A-Z][a-z]+)", details)
-        return match.group(1) if match else None
-
-    df["Tackler"] = df["Details"].apply(extract_tackler)
-    return df
+    """Fügt die Spalte "Tackler" hinzu (siehe `add_player_columns`)."""
+    return add_player_columns(df, ["Tackler"])
 
 
 def add_kicker_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte "Kicker" hinzu, die den Namen des Kickers aus der "Details"-Spalte extrahiert.
-
-    Mögliche Phrasen:
-    - "<Initial>. <Nachname> attempts an extra point..."
-    - "<Initial>. <Nachname> attempts a <xx> yards field goal..."
-    - "<Initial>. <Nachname> kickoff for <xx> yards..."
-
-    :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit neuer Spalte "Kicker"
-    """
-
-    def extract_kicker_or_punter(details):
-        if not isinstance(details, str):
-            return None
-
-        kicker_match = re.search(
-            r"([A-Z]\. ?[A-Z][a-z]+)\s(?:attempts an extra point|attempts a \d+\s+yards field goal|kickoff)",
-            details,
-        )
-
-        punter_match = re.search(r"([A-Z]\. ?[A-Z][a-z]+)\s+punt", details)
-
-        if kicker_match:
-            return kicker_match.group(1)
-        elif punter_match:
-            return punter_match.group(1)
-
-        return None
-
+    """Fügt die Spalte "Kicker" (Kicker oder Punter) hinzu, siehe `add_player_columns`."""
     df = df.copy()
-    df["Kicker"] = df["Details"].apply(extract_kicker_or_punter)
-    return df
+    return add_player_columns(df, ["Kicker"])
 
 
 def add_recovered_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte "Recovered" hinzu, die den Namen des Spielers extrahiert,
-    der den Fumble recovered hat, basierend auf dem Muster:
-    'Recovered by team XYZ by <Initial>. <Nachname>'
-
-    :param df: Pandas DataFrame mit einer "Details"-Spalte
-    :return: DataFrame mit neuer Spalte "Recovered"
-    """
-
-    def extract_recovered(details):
-        if not isinstance(details, str):
-            return None
-        match = re.search(
-            r"Recovered by team [A-Za-z ]+ by ([A-Z]\. ?[A-Z][a-z]+)", details
-        )
-        return match.group(1) if match else None
-
+    """Fügt die Spalte "Recovered" hinzu (siehe `add_player_columns`)."""
     df = df.copy()
-    df["Recovered"] = df["Details"].apply(extract_recovered)
-    return df
+    return add_player_columns(df, ["Recovered"])
 
 
 def add_intercepted_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte 'Intercepted' hinzu, die den Namen des Spielers extrahiert,
-    der eine Interception gemacht hat, basierend auf dem Muster:
-    'pass intercepted by <Initial>. <Nachname>'
-    """
-
-    def extract_intercepted(details):
-        if not isinstance(details, str):
-            return None
-        match = re.search(r"pass intercepted by ([A-Z]\. ?[A-Z][a-z]+)", details)
-        return match.group(1) if match else None
-
+    """Fügt die Spalte "Intercepted" hinzu (siehe `add_player_columns`)."""
     df = df.copy()
-    df["Intercepted"] = df["Details"].apply(extract_intercepted)
-    return df
+    return add_player_columns(df, ["Intercepted"])
 
 
 def add_tackler2_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte 'Tackler 2' hinzu, die den zweiten Tackler extrahiert,
-    basierend auf dem Muster: 'tackled by X. Name and Y. Name'
-    """
-
-    def extract_tackler2(details):
-        if not isinstance(details, str):
-            return None
-        match = re.search(
-            r"tackled by [A-Z]\. ?[A-Z][a-z]+ and ([A-Z]\. ?[A-Z][a-z]+)", details
-        )
-        return match.group(1) if match else None
-
+    """Fügt die Spalte "Tackler 2" hinzu (siehe `add_player_columns`)."""
     df = df.copy()
-    df["Tackler 2"] = df["Details"].apply(extract_tackler2)
-    return df
+    return add_player_columns(df, ["Tackler 2"])
 
 
 def add_returner_column(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Fügt eine neue Spalte 'Returner' hinzu, die den Namen des Kickoff- oder Punt-Returners extrahiert,
-    basierend auf dem Muster: 'returned by <Initial>. <Nachname>'
-    """
-
-    def extract_returner(details):
-        if not isinstance(details, str):
-            return None
-        match = re.search(r"returned by ([A-Z]\. ?[A-Z][a-z]+)", details)
-        return match.group(1) if match else None
-
+    """Fügt die Spalte "Returner" hinzu (siehe `add_player_columns`)."""
     df = df.copy()
-    df["Returner"] = df["Details"].apply(extract_returner)
-    return df
+    return add_player_columns(df, ["Returner"])
 
 
 def add_odk_column(df, expected_letter, invert=False):
@@ -834,54 +805,70 @@ def add_adjusted_yardline(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def add_score_column(
+def score_timeline(
     df: pd.DataFrame, scout_team: str, opponent_team: str
 ) -> pd.DataFrame:
-    # Neue Spalten mit 0 initialisieren
-    df[COLUMN_SCORE_DIFF] = 0
-    df[COLUMN_SCORE_OPP] = 0
-    df[COLUMN_SCORE_SCOUT] = 0  # Neue Spalte für die Differenz
-
-    # Score erhöhen
-    score_scout = 0
-    score_opp = 0
-    for index, row in df.iterrows():
-        if "TD" in row[COLUMN_RESULT]:
-            if row["POSS"] == scout_team:
-                score_scout += 6
-            elif row["POSS"] == opponent_team:
-                score_opp += 6
-
-        if "Good" in row[COLUMN_RESULT]:
-            if row["POSS"] == scout_team:
-                if row["PLAY TYPE"] == "FG":  # Überprüfung auf Field Goal
-                    score_scout += 3
-                else:
-                    score_scout += 1
-            elif row["POSS"] == opponent_team:
-                if row["PLAY TYPE"] == "FG":  # Überprüfung auf Field Goal
-                    score_opp += 3
-                else:
-                    score_opp += 1
-
-        if "Safety" in row[COLUMN_RESULT]:
-            if row["POSS"] == scout_team:
-                score_scout += 2
-            elif row["POSS"] == opponent_team:
-                score_opp += 2
-
-        if "TPC" in row[COLUMN_RESULT]:  # Überprüfung auf Two-Point Conversion
-            if row["POSS"] == scout_team:
-                score_scout += 2
-            elif row["POSS"] == opponent_team:
-                score_opp += 2
-
-        # Punkte für 'TD', 'GOOD', 'SAFETY' und 'TPC' zusammenfassen
-        df.at[index, COLUMN_SCORE_SCOUT] = score_scout
-        df.at[index, COLUMN_SCORE_OPP] = score_opp
-
-        # SCORE_DIFF berechnen
-        df.at[index, COLUMN_SCORE_DIFF] = score_scout - score_opp
+    """
+    Punkte und Spielstand nach jedem Play aus Sicht des gescouteten Teams.
+
+    Die Punkte eines Plays ergeben sich aus dem RESULT ('TD' 6, 'Good' 3 bei
+    Field Goal sonst 1, 'Safety' 2, 'TPC' 2) und werden dem Team in POSS
+    gutgeschrieben; der Spielstand ist die kumulierte Summe. Die Tabelle hat
+    denselben Index wie `df` und kann von weiteren Auswertungen (z.B. Spielstand
+    vor einem Play: `timeline[COLUMN_SCORE_DIFF].shift(fill_value=0)`)
+    wiederverwendet werden, ohne die Punkte neu zu bestimmen.
+
+    :param df: DataFrame mit den Spalten RESULT, POSS und PLAY TYPE
+    :param scout_team: Kürzel des gescouteten Teams
+    :param opponent_team: Kürzel des Gegners
+    :return: DataFrame mit den Spalten POINTS SCOUT, POINTS OPP, SCORE SCOUT,
+        SCORE OPP und SCORE DIFF
+    """
+    result = df[COLUMN_RESULT].astype(str)
+    points = (
+        result.str.contains("TD", regex=False).to_numpy(dtype=bool) * 6
+        + result.str.contains("Good", regex=False).to_numpy(dtype=bool)
+        * np.where(df[COLUMN_PLAY_TYPE] == "FG", 3, 1)
+        + result.str.contains("Safety", regex=False).to_numpy(dtype=bool) * 2
+        + result.str.contains("TPC", regex=False).to_numpy(dtype=bool) * 2
+    ).astype(np.int64)
+
+    is_scout = (df["POSS"] == scout_team).to_numpy()
+    is_opp = (df["POSS"] == opponent_team).to_numpy() & ~is_scout
+    points_scout = np.where(is_scout, points, 0)
+    points_opp = np.where(is_opp, points, 0)
+    score_scout = points_scout.cumsum()
+    score_opp = points_opp.cumsum()
+
+    return pd.DataFrame(
+        {
+            COLUMN_POINTS_SCOUT: points_scout,
+            COLUMN_POINTS_OPP: points_opp,
+            COLUMN_SCORE_SCOUT: score_scout,
+            COLUMN_SCORE_OPP: score_opp,
+            COLUMN_SCORE_DIFF: score_scout - score_opp,
+        },
+        index=df.index,
+    )
+
+
+def add_score_column(
+    df: pd.DataFrame,
+    scout_team: str,
+    opponent_team: str,
+    timeline: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """
+    Ergänzt SCORE DIFF, SCORE OPP und SCORE SCOUT (Spielstand nach dem Play).
+
+    :param timeline: Bereits berechnete `score_timeline` für `df`
+    """
+    if timeline is None:
+        timeline = score_timeline(df, scout_team, opponent_team)
+
+    df[COLUMN_SCORE_DIFF] = timeline[COLUMN_SCORE_DIFF]
+    df[COLUMN_SCORE_OPP] = timeline[COLUMN_SCORE_OPP]
+    df[COLUMN_SCORE_SCOUT] = timeline[COLUMN_SCORE_SCOUT]
 
     return df
 
@@ -991,25 +978,28 @@ def create_team_dataframe(game_data: dict, team: str) -> pd.DataFrame:
     """
     if game_data is None:
         return None
-    all_players = []
+    frames = []
 
     team_data = game_data
     for group in ["starter", "bench"]:
-        players = team_data.get(group, [])
-        for player in players:
-            first_name = player.get("Index", "").strip()
-            last_name = player.get("Last Name", "")
-            player_entry = {
-                "First Name": first_name,
-                "Last Name": last_name,
-                "Position": player.get("Position", ""),
-                "#": player.get("#", ""),
-                "Starter": "Starter" if group == "starter" else "Bench",
-                "Team": team,
-            }
-            all_players.append(player_entry)
+        # Spaltenweise Tabelle aus parse_table_data(columnar=True)
+        columns = team_data.get(group, {})
+        players = pd.DataFrame(columns, columns=["Index", "Last Name", "Position", "#"])
+        players = players.fillna("")
+        frames.append(
+            pd.DataFrame(
+                {
+                    "First Name": players["Index"].str.strip(),
+                    "Last Name": players["Last Name"],
+                    "Position": players["Position"],
+                    "#": players["#"],
+                    "Starter": "Starter" if group == "starter" else "Bench",
+                    "Team": team,
+                }
+            )
+        )
 
-    df = pd.DataFrame(all_players)
+    df = pd.concat(frames, ignore_index=True)
 
     # Index setzen: erster Buchstabe von First Name + ' ' + Last Name
     df.index = df["First Name"].str[0] + " " + df["Last Name"]
@@ -1017,13 +1007,59 @@ def create_team_dataframe(game_data: dict, team: str) -> pd.DataFrame:
     return df
 
 
+def _last_name_part(name) -> str | None:
+    """Nachname aus "F. Name", oder None, wenn der Eintrag nicht diese Form hat."""
+    if pd.isna(name):
+        return None
+    try:
+        first_initial, last_name_part = name.split(". ")
+    except ValueError:
+        return None
+    return last_name_part.strip()
+
+
+def build_jersey_lookup(
+    df_players: pd.DataFrame, last_names, lookup: dict | None = None
+) -> dict:
+    """
+    Tabelle Nachname -> Trikotnummer für die weiche Nachnamenssuche.
+
+    Jeder Nachname wird genau einmal gegen den ganzen Kader gesucht
+    (erster Spieler, dessen 'Last Name' ihn enthält, ohne Groß-/
+    Kleinschreibung); ohne Treffer steht None in der Tabelle.
+
+    :param df_players: Kader aus `create_team_dataframe`
+    :param last_names: Gesuchte Nachnamen, Duplikate werden übersprungen
+    :param lookup: Bereits aufgebaute Tabelle, die ergänzt wird
+    :return: Dictionary Nachname -> Nummer oder None
+    """
+    lookup = {} if lookup is None else lookup
+    roster_names = df_players["Last Name"]
+    for last_name in set(last_names) - lookup.keys():
+        if last_name is None:
+            continue
+        # TODO: Achtung Gleiche Namen könnten Probleme machen
+        positions = np.flatnonzero(
+            roster_names.str.contains(last_name, case=False, na=False).to_numpy()
+        )
+        lookup[last_name] = (
+            int(df_players["#"].iloc[positions[0]]) if len(positions) else None
+        )
+    return lookup
+
+
 def enrich_player_numbers(
-    df_drive: pd.DataFrame, df_players: pd.DataFrame
+    df_drive: pd.DataFrame, df_players: pd.DataFrame, lookup: dict | None = None
 ) -> pd.DataFrame:
     """
     Ergänzt die Drive-Tabelle um Nummernspalten für Passer, Rusher, Receiver, Tackler.
     Verwendet weiche Nachnamenssuche: prüft, ob der Nachname aus der Drive-Tabelle
     im 'Last Name' des Spieler-DF enthalten ist.
+
+    Die Suche läuft einmal pro verschiedenem Nachnamen (`build_jersey_lookup`),
+    danach wird jede Rollenspalte nur noch über die Tabelle abgebildet. Wird
+    `lookup` übergeben, wird die Tabelle über mehrere Aufrufe (z.B. Heim- und
+    Gast-Ansicht) weiterverwendet.
     """
 
     roles = {
@@ -1038,46 +1074,33 @@ def enrich_player_numbers(
         "Returner": "Returner Number",
     }
 
-    enriched_columns = {new_col: [] for new_col in roles.values()}
-
-    for _, row in df_drive.iterrows():
-        team = row.get("POSS")
-
-        for role_col, new_col in roles.items():
-            name = row.get(role_col)
-
-            if pd.isna(name) or pd.isna(team):
-                enriched_columns[new_col].append(None)
-                continue
-
-            try:
-                first_initial, last_name_part = name.split(". ")
-                last_name_part = last_name_part.strip()
-            except ValueError:
-                enriched_columns[new_col].append(None)
-                continue
-
-            # Weiche Suche im Nachnamen
-            if df_players is None:
-                enriched_columns[new_col].append(None)
-            else:
-                matches = df_players[
-                    (
-                        df_players["Last Name"].str.contains(
-                            last_name_part, case=False, na=False
-                        )
-                    )  # TODO: Achtung Gleiche Namen könnten Probleme machen
-                ]
-
-                if not matches.empty:
-                    enriched_columns[new_col].append(int(matches.iloc[0]["#"]))
-                else:
-                    enriched_columns[new_col].append(None)
+    rows = len(df_drive)
+    if "POSS" in df_drive:
+        has_team = df_drive["POSS"].notna().to_numpy()
+    else:
+        has_team = np.zeros(rows, dtype=bool)
+
+    last_names = {}
+    for role_col, new_col in roles.items():
+        if role_col in df_drive and df_players is not None:
+            last_names[new_col] = [
+                _last_name_part(name) if team else None
+                for name, team in zip(df_drive[role_col], has_team)
+            ]
+        else:
+            last_names[new_col] = [None] * rows
+
+    if df_players is not None:
+        lookup = build_jersey_lookup(
+            df_players,
+            (name for names in last_names.values() for name in names),
+            lookup,
+        )
 
     # Neue Spalten anhängen
     df_drive = df_drive.copy()
-    for col, values in enriched_columns.items():
-        df_drive[col] = values
+    for col, names in last_names.items():
+        df_drive[col] = [None if name is None else lookup[name] for name in names]
 
     return df_drive
 
@@ -1147,15 +1170,9 @@ def main():
         if st.button("Extract"):
             st.session_state["extract_button"] = True
 
-    if st.session_state["extract_button"]:
-        pages = extract_text_from_pdf(uploaded_file)
-
-        doc = {}
-
-        for i, parser in enumerate(PARSERS):
-            doc = parser(pages[i], doc)
-
-        doc = parse_last_pages(pages[5:], doc)
+    if st.session_state["extract_button"] and uploaded_file is not None:
+        pdf_bytes = uploaded_file.getvalue()
+        doc = extract_doc(hash_pdf(pdf_bytes), pdf_bytes)
 
         st.write("---")
         st.subheader("Results")
@@ -1181,15 +1198,7 @@ def main():
                 .pipe(add_return_yards_column)
                 .pipe(split_penalty_rows)
                 .pipe(add_penalty_columns)
-                .pipe(add_passer_column)
-                .pipe(add_rusher_column)
-                .pipe(add_receiver_column)
-                .pipe(add_tackler_column)
-                .pipe(add_tackler2_column)
-                .pipe(add_kicker_column)
-                .pipe(add_returner_column)
-                .pipe(add_recovered_column)
-                .pipe(add_intercepted_column)
+                .pipe(add_player_columns)
                 .pipe(add_adjusted_yardline)
                 .pipe(transform_adjusted_yardline)
             )
@@ -1218,6 +1227,8 @@ def main():
                 players = pd.concat([players_home, players_visitors], axis=0)
             else:
                 players = None
+            # Nachname -> Nummer, gemeinsam für beide Ansichten
+            jersey_lookup = {}
 
             tab1, tab2 = st.tabs([home, visitors])
 
@@ -1228,7 +1239,7 @@ def main():
                 df_home = add_scout_depended_columns(
                     df_home, short_home, short_visitors, "HOME"
                 )
-                df_home = enrich_player_numbers(df_home, players)
+                df_home = enrich_player_numbers(df_home, players, jersey_lookup)
                 df_home = rename_player_columns(df_home)
                 df_home = add_score_column(df_home, short_home, short_visitors)
                 df_home = transform_to_short_team_code(df_home, short_team_map)
@@ -1241,7 +1252,7 @@ def main():
                 df_away = add_scout_depended_columns(
                     df_away, short_visitors, short_home, "AWAY"
                 )
-                df_away = enrich_player_numbers(df_away, players)
+                df_away = enrich_player_numbers(df_away, players, jersey_lookup)
                 df_away = rename_player_columns(df_away)
                 df_away = add_score_column(df_away, short_visitors, short_home)
                 df_away = transform_to_short_team_code(df_away, short_team_map)
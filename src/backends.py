@@ -0,0 +1,164 @@
+# Dependencies
+from abc import ABC, abstractmethod
+from importlib import metadata, util
+import io
+
+import PyPDF2
+
+# Const. Vars
+DEFAULT_BACKEND = "pypdf2"
+
+
+class ExtractionBackend(ABC):
+    """
+    Schnittstelle für einen Textextraktor.
+
+    Ein Backend öffnet ein PDF aus Bytes und liefert ein Dokument-Objekt mit
+    `len(document)` und `document.page_text(index)`. Die Seiten werden erst bei
+    `page_text` extrahiert, so dass ein Dokument auch für einzelne Seiten
+    geöffnet werden kann.
+
+    Unterklassen setzen `name` (Schlüssel in `BACKENDS`), `module`
+    (importierbares Modul, für `is_available`) und `distribution`
+    (Paketname, für `version`).
+    """
+
+    name = ""
+    module = ""
+    distribution = ""
+
+    def is_available(self) -> bool:
+        return util.find_spec(self.module) is not None
+
+    @property
+    def version(self) -> str:
+        """Name und Paketversion, z.B. als Teil von Cache-Schlüsseln."""
+        return f"{self.name}-{metadata.version(self.distribution)}"
+
+    @abstractmethod
+    def open(self, pdf_bytes: bytes):
+        """Öffnet das PDF und liefert das Dokument-Objekt."""
+
+    def extract_pages(self, pdf_bytes: bytes, start: int = 0, stop: int | None = None):
+        """Extrahiert die Seiten [start, stop) – öffnet das PDF dafür genau einmal."""
+        document = self.open(pdf_bytes)
+        if stop is None:
+            stop = len(document)
+        return [document.page_text(index) for index in range(start, stop)]
+
+
+class PyPDF2Backend(ExtractionBackend):
+    name = "pypdf2"
+    module = "PyPDF2"
+    distribution = "PyPDF2"
+
+    def open(self, pdf_bytes: bytes):
+        return _PyPDF2Document(pdf_bytes)
+
+
+class _PyPDF2Document:
+    def __init__(self, pdf_bytes: bytes):
+        self._reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+
+    def __len__(self) -> int:
+        return len(self._reader.pages)
+
+    def page_text(self, index: int) -> str:
+        return self._reader.pages[index].extract_text()
+
+
+class PdfiumBackend(ExtractionBackend):
+    name = "pypdfium2"
+    module = "pypdfium2"
+    distribution = "pypdfium2"
+
+    def open(self, pdf_bytes: bytes):
+        return _PdfiumDocument(pdf_bytes)
+
+
+class _PdfiumDocument:
+    def __init__(self, pdf_bytes: bytes):
+        import pypdfium2
+
+        self._pdf = pypdfium2.PdfDocument(pdf_bytes)
+
+    def __len__(self) -> int:
+        return len(self._pdf)
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf[index]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+
+
+class PdfminerBackend(ExtractionBackend):
+    """pdfminer.six im Layout-Modus (LAParams)."""
+
+    name = "pdfminer"
+    module = "pdfminer"
+    distribution = "pdfminer.six"
+
+    def open(self, pdf_bytes: bytes):
+        return _PdfminerDocument(pdf_bytes)
+
+
+class _PdfminerDocument:
+    def __init__(self, pdf_bytes: bytes):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        self._stream = io.BytesIO(pdf_bytes)
+        document = PDFDocument(PDFParser(self._stream))
+        self._pages = list(PDFPage.create_pages(document))
+        self._resources = PDFResourceManager()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def page_text(self, index: int) -> str:
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter
+
+        output = io.StringIO()
+        device = TextConverter(self._resources, output, laparams=LAParams())
+        try:
+            PDFPageInterpreter(self._resources, device).process_page(self._pages[index])
+        finally:
+            device.close()
+        return output.getvalue()
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PyPDF2Backend(), PdfiumBackend(), PdfminerBackend())
+}
+
+
+def available_backends() -> list:
+    """Namen aller Backends, deren Abhängigkeiten installiert sind."""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> ExtractionBackend:
+    """
+    Liefert das Backend mit dem gegebenen Namen.
+
+    :raises ValueError: Wenn das Backend unbekannt oder nicht installiert ist
+    """
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(
+            f"Unbekanntes Backend: {name} (verfügbar: {', '.join(BACKENDS)})"
+        )
+    if not backend.is_available():
+        raise ValueError(
+            f"Backend {name} ist nicht installiert ({backend.distribution})"
+        )
+    return backend
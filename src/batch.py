@@ -0,0 +1,359 @@
+# Dependencies
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from rich import print
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from rich.table import Table
+
+from backends import BACKENDS, DEFAULT_BACKEND
+from incremental import parse_gamebook_incremental
+from page_cache import PageCache
+from patterns import REGISTRY
+from scouter import LazyPages, extract_text_from_pdf, parse_gamebook
+from streaming import JsonLinesSink, stream_gamebook
+from tracing import TRACER, init_worker
+
+
+# Funcs
+def expand_inputs(patterns: list) -> list:
+    """
+    Löst Glob-Muster und Verzeichnisse zu einer Liste von PDF-Pfaden auf.
+
+    Verzeichnisse werden rekursiv nach `*.pdf` durchsucht. Doppelte Pfade
+    werden entfernt, die Reihenfolge bleibt erhalten.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*.pdf")
+        paths.extend(sorted(glob.glob(pattern, recursive=True)))
+    return list(dict.fromkeys(paths))
+
+
+def output_path_for(pdf_path: str, output_dir: str, extension: str = ".json") -> str:
+    stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(output_dir, stem + extension)
+
+
+def output_collisions(paths: list, output_dir: str) -> dict:
+    """
+    Gamebooks, die in dieselbe Ausgabedatei schreiben würden.
+
+    Die Ausgabe wird nur nach dem Dateinamen benannt; `2023/week1.pdf` und
+    `2024/week1.pdf` würden sich also gegenseitig überschreiben.
+
+    :return: Dictionary Ausgabedatei -> Liste der PDF-Pfade (nur Kollisionen)
+    """
+    targets = {}
+    for path in paths:
+        targets.setdefault(output_path_for(path, output_dir), []).append(path)
+    return {target: paths for target, paths in targets.items() if len(paths) > 1}
+
+
+def _load_json(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as json_file:
+        return json.load(json_file)
+
+
+def _dump_json(data, path: str, indent: int | None = 4):
+    with open(path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=indent, ensure_ascii=False)
+
+
+def process_gamebook(
+    pdf_path: str,
+    output_dir: str,
+    backend: str = DEFAULT_BACKEND,
+    cache_path: str | None = None,
+    incremental: bool = False,
+    stream: bool = False,
+) -> dict:
+    """
+    Extrahiert, parst und speichert ein einzelnes Gamebook.
+
+    Im inkrementellen Modus wird neben der JSON-Datei ein Manifest
+    (`<name>.manifest.json`) mit Seiten- und Quarter-Hashes abgelegt. Bei
+    einer korrigierten Neuauflage des Gamebooks werden dann nur die
+    geänderten Abschnitte neu geparst.
+
+    Im Streaming-Modus wird jeder Abschnitt und jeder Drive sofort nach dem
+    Parsen als Zeile in `<name>.jsonl` geschrieben, statt das ganze Dokument
+    aufzubauen.
+
+    :return: Dictionary mit Pfad, Ausgabedatei, Seitenanzahl und Laufzeit
+    """
+    started = time.perf_counter()
+    cache = PageCache(cache_path) if cache_path else None
+
+    if stream:
+        pages = LazyPages(pdf_path, cache=cache, backend=backend)
+        output_path = output_path_for(pdf_path, output_dir, ".jsonl")
+        with JsonLinesSink(output_path) as sink:
+            records = stream_gamebook(pages, sink)
+        return {
+            "path": pdf_path,
+            "output": output_path,
+            "pages": len(pages.extracted),
+            "records": records,
+            "seconds": time.perf_counter() - started,
+        }
+
+    pages = extract_text_from_pdf(pdf_path, cache=cache, backend=backend)
+    output_path = output_path_for(pdf_path, output_dir)
+    result = {"path": pdf_path, "output": output_path, "pages": len(pages)}
+
+    if incremental:
+        manifest_path = output_path_for(pdf_path, output_dir, ".manifest.json")
+        doc, manifest = parse_gamebook_incremental(
+            pages, _load_json(output_path), _load_json(manifest_path)
+        )
+        _dump_json(manifest, manifest_path, indent=None)
+        result["changed"] = manifest["changed"]
+    else:
+        doc = parse_gamebook(pages)
+
+    _dump_json(doc, output_path)
+
+    integrity = doc.get("integrity")
+    if integrity is not None:
+        result["mismatched_drives"] = integrity["mismatched_drives"]
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _process_isolated(pdf_path: str, *args) -> dict:
+    """Wie `process_gamebook`, liefert Fehler aber als Ergebnis statt sie zu werfen."""
+    REGISTRY.reset_stats()
+    try:
+        result = process_gamebook(pdf_path, *args)
+    except Exception as error:
+        result = {"path": pdf_path, "error": f"{type(error).__name__}: {error}"}
+    if REGISTRY.stats_enabled:
+        result["regex_stats"] = REGISTRY.stats()
+    return result
+
+
+def _init_worker(regex_stats: bool = False, trace_config: tuple | None = None):
+    # Die Parser geben Debug-Ausgaben per print aus; im Batch würden sie die
+    # Fortschrittsanzeige überschreiben.
+    sys.stdout = open(os.devnull, "w")
+    if regex_stats:
+        REGISTRY.enable_stats()
+    init_worker(trace_config)
+
+
+def run_batch(
+    paths: list,
+    output_dir: str,
+    workers: int | None = None,
+    backend: str = DEFAULT_BACKEND,
+    cache_path: str | None = None,
+    incremental: bool = False,
+    stream: bool = False,
+    regex_stats: bool = False,
+) -> list:
+    """
+    Verarbeitet alle Gamebooks in einem Prozess-Pool.
+
+    Jedes Gamebook ist ein eigener Task; schlägt eines fehl, wird der Fehler im
+    Ergebnis vermerkt und der Lauf fortgesetzt.
+
+    :return: Liste der Ergebnisse in Reihenfolge der Fertigstellung
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+    )
+    with (
+        progress,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(regex_stats, TRACER.worker_config()),
+        ) as executor,
+    ):
+        task = progress.add_task("Gamebooks", total=len(paths))
+        futures = {
+            executor.submit(
+                _process_isolated,
+                path,
+                output_dir,
+                backend,
+                cache_path,
+                incremental,
+                stream,
+            ): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # z.B. ein abgestürzter Worker (BrokenProcessPool)
+                result = {
+                    "path": futures[future],
+                    "error": f"{type(error).__name__}: {error}",
+                }
+            results.append(result)
+
+            if "error" in result:
+                progress.console.print(f"[red]✗ {result['path']}: {result['error']}")
+            progress.advance(task)
+
+    return results
+
+
+def print_summary(results: list, seconds: float):
+    failures = [result for result in results if "error" in result]
+    succeeded = len(results) - len(failures)
+    pages = sum(result.get("pages", 0) for result in results)
+
+    summary = Table(title="Zusammenfassung", show_header=False)
+    summary.add_row("Gamebooks", str(len(results)))
+    summary.add_row("Erfolgreich", str(succeeded))
+    summary.add_row("Fehlgeschlagen", str(len(failures)))
+    summary.add_row("Seiten", str(pages))
+    if any("changed" in result for result in results):
+        unchanged = sum(result.get("changed") == [] for result in results)
+        summary.add_row("Unverändert", str(unchanged))
+    mismatches = [result for result in results if result.get("mismatched_drives")]
+    if mismatches:
+        summary.add_row("Abweichende Plays", str(len(mismatches)))
+    summary.add_row("Laufzeit", f"{seconds:.1f} s")
+    if seconds > 0:
+        summary.add_row("Gamebooks/s", f"{succeeded / seconds:.2f}")
+        summary.add_row("Seiten/s", f"{pages / seconds:.1f}")
+    print(summary)
+
+    if failures:
+        table = Table(title="Fehler")
+        table.add_column("Gamebook")
+        table.add_column("Fehler")
+        for failure in sorted(failures, key=lambda result: result["path"]):
+            table.add_row(failure["path"], failure["error"])
+        print(table)
+
+    if mismatches:
+        # Drives, deren Summary eine andere Anzahl Plays angibt als geparst wurde
+        table = Table(title="Abweichende Plays")
+        table.add_column("Gamebook")
+        table.add_column("Drives")
+        for result in sorted(mismatches, key=lambda result: result["path"]):
+            table.add_row(result["path"], ", ".join(result["mismatched_drives"]))
+        print(table)
+
+    regex_stats = REGISTRY.merge_stats(
+        *(result["regex_stats"] for result in results if "regex_stats" in result)
+    )
+    if regex_stats:
+        REGISTRY.print_stats(regex_stats)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="batch",
+        description="Verarbeitet ganze Verzeichnisse von Gamebooks zu JSON-Dateien.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="PDF-Dateien, Verzeichnisse oder Glob-Muster"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", required=True, help="Zielverzeichnis für die JSON-Dateien"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Anzahl paralleler Prozesse (Default: Anzahl CPUs)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help=f"Extraktions-Backend (Default: {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Persistenter Seiten-Cache (SQLite), z.B. data/cache/pages.sqlite",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Nur geänderte Abschnitte neu parsen (Manifest neben der JSON-Datei)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Abschnitte und Drives direkt als JSON Lines schreiben (konstanter Speicher)",
+    )
+    parser.add_argument(
+        "--regex-stats",
+        action="store_true",
+        help="Aufrufe, Trefferquote und Laufzeit pro Regex-Pattern ausgeben",
+    )
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.stream and args.incremental:
+        parser.error("--stream und --incremental schließen sich aus")
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("[red]Keine Gamebooks gefunden.[/red]")
+        return 1
+
+    collisions = output_collisions(paths, args.output_dir)
+    if collisions:
+        table = Table(title="Gleiche Ausgabedatei")
+        table.add_column("Ausgabe")
+        table.add_column("Gamebooks")
+        for target, sources in collisions.items():
+            table.add_row(target, "\n".join(sources))
+        print(table)
+        print("[red]Gleiche Dateinamen: bitte getrennt verarbeiten.[/red]")
+        return 1
+
+    started = time.perf_counter()
+    results = run_batch(
+        paths,
+        args.output_dir,
+        args.workers,
+        args.backend,
+        args.cache,
+        args.incremental,
+        args.stream,
+        args.regex_stats,
+    )
+    print_summary(results, time.perf_counter() - started)
+
+    return 1 if any("error" in result for result in results) else 0
+
+
+# Program
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,860 @@
+# Dependencies
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import ast
+import contextlib
+import gc
+import glob
+import hashlib
+import inspect
+import json
+import math
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import textwrap
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from rich import print
+from rich.table import Table
+
+from backends import DEFAULT_BACKEND, available_backends, get_backend
+from lexer import RE_PLAY, iter_plays
+from models.Play import compact_drives, expand_drives
+from models.PlayStore import PlayStore
+from models.PlayEvent import GameEvent, validate_events
+from scouter import drive_event_fields, parse_gamebook
+
+
+# Funcs
+def _find_pdfs(corpus: str) -> list:
+    """Alle PDFs eines Verzeichnisses (rekursiv) oder eines Glob-Musters."""
+    if os.path.isdir(corpus):
+        corpus = os.path.join(corpus, "**", "*.pdf")
+    return sorted(glob.glob(corpus, recursive=True))
+
+
+def _peak_rss_mb() -> float:
+    """Maximaler Resident Set Size des aktuellen Prozesses in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux liefert KiB, macOS Bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _section_digests(doc: dict) -> dict:
+    """SHA-256 pro Top-Level-Abschnitt des geparsten Dokuments."""
+    return {
+        key: hashlib.sha256(
+            json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        for key, value in doc.items()
+    }
+
+
+#######################################################
+#########              Backends               #########
+#######################################################
+
+
+def _run_backend(name: str, paths: list) -> dict:
+    """
+    Läuft in einem frischen Prozess: extrahiert den Korpus mit einem Backend
+    und parst das Ergebnis. Der Peak-RSS wird direkt nach der Extraktion
+    gemessen, damit er nicht vom Parsen verfälscht wird.
+    """
+    backend = get_backend(name)
+
+    texts = {}
+    started = time.perf_counter()
+    for path in paths:
+        with open(path, "rb") as file:
+            texts[path] = backend.extract_pages(file.read())
+    seconds = time.perf_counter() - started
+    peak_rss_mb = _peak_rss_mb()
+
+    digests = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for path, pages in texts.items():
+            try:
+                digests[path] = _section_digests(parse_gamebook(pages))
+            except Exception as error:
+                digests[path] = {"error": f"{type(error).__name__}: {error}"}
+
+    return {
+        "version": backend.version,
+        "pages": sum(len(pages) for pages in texts.values()),
+        "seconds": seconds,
+        "peak_rss_mb": peak_rss_mb,
+        "digests": digests,
+    }
+
+
+def benchmark_backends(args: argparse.Namespace) -> int:
+    """
+    Vergleicht alle installierten Extraktions-Backends auf einem lokalen Korpus.
+
+    Jedes Backend läuft in einem eigenen, frisch gestarteten Prozess, damit
+    Laufzeit und Peak-RSS nicht voneinander beeinflusst werden. Für die
+    Äquivalenz wird pro PDF und Abschnitt (meta, score_board, ..., drives)
+    der Hash des Parser-Ergebnisses mit dem Referenz-Backend verglichen.
+    """
+    paths = _find_pdfs(args.corpus)
+    if not paths:
+        print(f"[red]Keine PDFs gefunden: {args.corpus}[/red]")
+        return 1
+
+    names = args.backends or available_backends()
+    if args.reference not in names and args.reference in available_backends():
+        names = [args.reference, *names]
+    context = multiprocessing.get_context("spawn")
+
+    results = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(_run_backend, name, paths).result()
+
+    reference = results.get(args.reference)
+
+    table = Table(title=f"Extraktions-Backends ({len(paths)} PDFs)")
+    table.add_column("Backend")
+    table.add_column("Version")
+    table.add_column("Seiten", justify="right")
+    table.add_column("Seiten/s", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column(f"Äquivalent zu {args.reference}", justify="right")
+    table.add_column("Abweichende Abschnitte")
+
+    for name, result in results.items():
+        pages_per_second = (
+            result["pages"] / result["seconds"] if result["seconds"] else 0
+        )
+
+        if reference is None:
+            equivalent, sections = "-", "-"
+        else:
+            equal_files = 0
+            differing = set()
+            for path, digests in result["digests"].items():
+                expected = reference["digests"][path]
+                if digests == expected:
+                    equal_files += 1
+                    continue
+                differing.update(
+                    key
+                    for key in digests.keys() | expected.keys()
+                    if digests.get(key) != expected.get(key)
+                )
+            equivalent = f"{equal_files}/{len(paths)}"
+            sections = ", ".join(sorted(differing)) or "-"
+
+        table.add_row(
+            name,
+            result["version"],
+            str(result["pages"]),
+            f"{pages_per_second:.1f}",
+            f"{result['peak_rss_mb']:.1f}",
+            equivalent,
+            sections,
+        )
+
+    print(table)
+    return 0
+
+
+#######################################################
+#########          Plays (Worst Case)         #########
+#######################################################
+
+# Eingaben, die die Länge eines Drives in Leerraum bzw. Plays skalieren.
+# Die ersten beiden bringen PATTERN_PLAY zum Backtracking über den Leerraum.
+LONG_DRIVE_PLAY = " RF 1&10 @VV12 J.Doe pass to M.Roe for 7 yards\n"
+WORST_CASES = {
+    "Leerraum": lambda n: " RF 1&10 @VV12" + " " * n + "abcd @" + "x" * 40,
+    "Ohne @": lambda n: " RF" + " " * n + "x" * 40,
+    "Langer Drive": lambda n: (LONG_DRIVE_PLAY * n)[:n],
+}
+
+
+def _best_time(function, text: str, repeat: int) -> tuple:
+    """Schnellste von `repeat` Laufzeiten und das Ergebnis des letzten Laufs."""
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(text)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _regex_plays(text: str) -> list:
+    return [(m.start(), m.end(), m.groups()) for m in RE_PLAY.finditer(text)]
+
+
+def _scanner_plays(text: str) -> list:
+    return list(iter_plays(text))
+
+
+def benchmark_plays(args: argparse.Namespace) -> int:
+    """
+    Misst den Play-Scanner (`lexer.iter_plays`) gegen PATTERN_PLAY auf
+    Worst-Case-Eingaben mit wachsender Länge.
+
+    Pro Verdopplung der Eingabe wird der Wachstumsexponent
+    log2(t(2n) / t(n)) ausgegeben; linear heißt ≈ 1. Das Regex wird pro Fall
+    nicht weiter vergrößert, sobald ein Lauf das Zeitbudget überschreitet.
+    Beide Ergebnisse werden verglichen, solange das Regex läuft.
+
+    :return: 1, wenn der Scanner superlinear wächst oder vom Regex abweicht
+    """
+    sizes = []
+    size = args.min_size
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 2
+
+    table = Table(title="Play-Scanner vs. PATTERN_PLAY")
+    table.add_column("Fall")
+    table.add_column("Zeichen", justify="right")
+    table.add_column("Regex (ms)", justify="right")
+    table.add_column("Exponent", justify="right")
+    table.add_column("Scanner (ms)", justify="right")
+    table.add_column("Exponent", justify="right")
+    table.add_column("Identisch", justify="right")
+
+    failed = False
+    for name, build in WORST_CASES.items():
+        regex_previous = scanner_previous = None
+        regex_running = True
+        for size in sizes:
+            text = build(size)
+            scanner_seconds, scanner_result = _best_time(
+                _scanner_plays, text, args.repeat
+            )
+            scanner_exponent = "-"
+            if scanner_previous:
+                exponent = math.log2(max(scanner_seconds, 1e-9) / scanner_previous)
+                scanner_exponent = f"{exponent:.2f}"
+                # Unterhalb von 1 ms dominiert Rauschen
+                if exponent > args.max_exponent and scanner_seconds > 1e-3:
+                    failed = True
+            scanner_previous = max(scanner_seconds, 1e-9)
+
+            regex_ms, regex_exponent, identical = "übersprungen", "-", "-"
+            if regex_running:
+                regex_seconds, regex_result = _best_time(_regex_plays, text, 1)
+                regex_ms = f"{regex_seconds * 1000:.2f}"
+                if regex_previous:
+                    regex_exponent = (
+                        f"{math.log2(max(regex_seconds, 1e-9) / regex_previous):.2f}"
+                    )
+                regex_previous = max(regex_seconds, 1e-9)
+                regex_running = regex_seconds < args.regex_budget
+
+                identical = regex_result == scanner_result
+                failed = failed or not identical
+                identical = "ja" if identical else "[red]nein[/red]"
+
+            table.add_row(
+                name,
+                str(len(text)),
+                regex_ms,
+                regex_exponent,
+                f"{scanner_seconds * 1000:.2f}",
+                scanner_exponent,
+                identical,
+            )
+
+    print(table)
+    if failed:
+        print("[red]Scanner wächst superlinear oder weicht vom Regex ab.[/red]")
+    return 1 if failed else 0
+
+
+#######################################################
+#########               Events                #########
+#######################################################
+
+# Ein Play im Format von parse_from_str_to_drive
+EVENT_PLAY = " RF 1&10 @ VV12 j.doe pass complete to m.roe for 7 yards"
+
+
+def _per_object_events(fields: list) -> list:
+    """Bisheriger Weg: ein GameEvent pro Play."""
+    return [GameEvent(**event).dump_model() for event in fields]
+
+
+def _batched_events(fields: list) -> list:
+    return [event.dump_model() for event in validate_events(fields)]
+
+
+def benchmark_events(args: argparse.Namespace) -> int:
+    """
+    Misst die Validierung der Plays eines Drives: ein `GameEvent` pro Play
+    gegen `validate_events` über alle Plays auf einmal.
+
+    Gemessen wird nur die Validierung; die Felder werden vorab einmal mit
+    `drive_event_fields` extrahiert.
+
+    :return: 1, wenn die Ergebnisse abweichen
+    """
+    table = Table(title="GameEvent-Validierung")
+    table.add_column("Plays", justify="right")
+    table.add_column("Pro Objekt (ms)", justify="right")
+    table.add_column("Batch (ms)", justify="right")
+    table.add_column("Faktor", justify="right")
+    table.add_column("Identisch", justify="right")
+
+    failed = False
+    for plays in args.plays:
+        # Ohne führendes Wort fehlt dem ersten Play der Leerraum davor
+        fields = drive_event_fields("Drive" + EVENT_PLAY * plays)
+        single_seconds, single_result = _best_time(
+            _per_object_events, fields, args.repeat
+        )
+        batch_seconds, batch_result = _best_time(_batched_events, fields, args.repeat)
+
+        identical = single_result == batch_result
+        failed = failed or not identical
+        table.add_row(
+            str(len(fields)),
+            f"{single_seconds * 1000:.3f}",
+            f"{batch_seconds * 1000:.3f}",
+            f"{single_seconds / max(batch_seconds, 1e-9):.1f}x",
+            "ja" if identical else "[red]nein[/red]",
+        )
+
+    print(table)
+    return 1 if failed else 0
+
+
+#######################################################
+#########               Memory                #########
+#######################################################
+
+
+def _find_json(corpus: str) -> list:
+    """Alle JSON-Dokumente eines Verzeichnisses (rekursiv) oder eines Glob-Musters."""
+    if os.path.isdir(corpus):
+        corpus = os.path.join(corpus, "**", "*.json")
+    paths = sorted(glob.glob(corpus, recursive=True))
+    return [path for path in paths if not path.endswith(".manifest.json")]
+
+
+def _load_season(paths: list, copies: int) -> list:
+    """`doc["drives"]` aller Dokumente, `copies`-mal hintereinander geladen."""
+    season = []
+    for _ in range(copies):
+        for path in paths:
+            with open(path, encoding="utf-8") as json_file:
+                season.append(json.load(json_file).get("drives", {}))
+    return season
+
+
+def benchmark_memory(args: argparse.Namespace) -> int:
+    """
+    Misst den Speicher einer geladenen Saison: Plays als Dictionaries (wie im
+    JSON) gegen `models.Play.Play` und `models.PlayStore.PlayStore`.
+
+    Geladen wird `doc["drives"]` aus den JSON-Dateien von `batch.py`; mit
+    `--copies` lässt sich aus wenigen Spielen eine ganze Saison hochrechnen.
+    Gemessen wird mit `tracemalloc` der belegte Speicher nach dem Laden bzw.
+    nach der Umwandlung. Vorab wird geprüft, dass beide Formate jedes
+    Dokument unverändert wiederherstellen.
+
+    :return: 1, wenn keine Dokumente gefunden werden oder die Umwandlung nicht verlustfrei ist
+    """
+    paths = _find_json(args.corpus)
+    if not paths:
+        print(f"[red]Keine JSON-Dokumente in {args.corpus} gefunden.[/red]")
+        return 1
+
+    store = PlayStore()
+    lossless = True
+    for game, drives in enumerate(_load_season(paths, 1)):
+        store.add(game, drives)
+        lossless = lossless and expand_drives(compact_drives(drives)) == drives
+        lossless = lossless and store.drives(game) == drives
+    del store
+
+    gc.collect()
+    tracemalloc.start()
+    season = _load_season(paths, args.copies)
+    gc.collect()
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    plays = sum(len(drive) for drives in season for drive in drives.values())
+
+    season = [compact_drives(drives) for drives in season]
+    gc.collect()
+    play_bytes = tracemalloc.get_traced_memory()[0]
+    del season
+
+    store = PlayStore()
+    for game, drives in enumerate(_load_season(paths, args.copies)):
+        store.add(game, drives)
+    gc.collect()
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    table = Table(title=f"Speicher für {len(store.games)} Spiele, {plays} Plays")
+    table.add_column("Format")
+    table.add_column("MB", justify="right")
+    table.add_column("Bytes/Play", justify="right")
+    table.add_column("Ersparnis", justify="right")
+    for name, size in (
+        ("dict", dict_bytes),
+        ("Play", play_bytes),
+        ("PlayStore", store_bytes),
+    ):
+        table.add_row(
+            name,
+            f"{size / 1024**2:.2f}",
+            f"{size / max(plays, 1):.0f}",
+            f"{1 - size / max(dict_bytes, 1):.0%}",
+        )
+    print(table)
+    print(f"Verlustfrei: {'ja' if lossless else '[red]nein[/red]'}")
+    return 0 if lossless else 1
+
+
+#######################################################
+#########           Klassifikation            #########
+#######################################################
+
+# Typische "Details" aus dem Play-by-Play, decken alle Zweige der Klassifikation ab
+DETAIL_SAMPLES = [
+    "J. Doe rush left for 4 yards to the RF34, tackled by M. Roe.",
+    "J. Doe rush up the middle for 12 yards, TOUCHDOWN.",
+    "J. Doe rush right for 2 yards, fumbles, recovered by VV.",
+    "J. Doe pass complete to A. Smith for 15 yards to the VV40.",
+    "J. Doe pass complete to A. Smith for 30 yards, TOUCHDOWN.",
+    "J. Doe pass incomplete intended for A. Smith.",
+    "J. Doe pass intercepted by M. Roe at the RF45, returned for 10 yards.",
+    "J. Doe sacked for loss of 7 yards at the RF20.",
+    "K. Kick field goal attempt from 32 yards is good.",
+    "K. Kick field goal attempt from 48 yards no good.",
+    "P. Punt punt 40 yards to the VV10, fair catch by A. Smith.",
+    "P. Punt punt 35 yards to the VV5, downed.",
+    "K. Kick kickoff 60 yards to the VV5, returned by A. Smith for 20 yards.",
+    "K. Kick kickoff 65 yards to the VV0, touchback.",
+    "K. Kick extra point is good.",
+    "Two-point-conversion attempt, J. Doe rush, attempt succeeds.",
+    "Timeout Rhein Fire.",
+    "J. Doe takes a knee for loss of 1 yard.",
+    "PENALTY RF false start 5 yards, no-play.",
+    "J. Doe rush left for 1 yard, out-of-bounds.",
+    "End of game.",
+]
+
+
+def _keywords(test: ast.expr) -> tuple:
+    """Stichwörter einer Bedingung `"a" in details_lower or "b" in details_lower`."""
+    compares = test.values if isinstance(test, ast.BoolOp) else [test]
+    keywords = []
+    for compare in compares:
+        if not (
+            isinstance(compare, ast.Compare) and isinstance(compare.ops[0], ast.In)
+        ):
+            raise ValueError(f"Bedingung nicht unterstützt: {ast.unparse(compare)}")
+        keywords.append(ast.literal_eval(compare.left))
+    return tuple(keywords)
+
+
+def _chain_rules(statements: list, groups: tuple = ()) -> list:
+    """
+    Regeln einer if/elif-Kette in derselben Reihenfolge. Verschachtelte ifs
+    stehen als zusätzliche Bedingung hinter der ihres äußeren Zweigs.
+    """
+    rules = []
+    for statement in statements:
+        if isinstance(statement, ast.Return):
+            rules.append((groups, ast.literal_eval(statement.value)))
+            break
+        branch = statement if isinstance(statement, ast.If) else None
+        while branch is not None:
+            rules += _chain_rules(branch.body, groups + (_keywords(branch.test),))
+            orelse = branch.orelse
+            branch = (
+                orelse[0]
+                if len(orelse) == 1 and isinstance(orelse[0], ast.If)
+                else None
+            )
+            if branch is None:
+                rules += _chain_rules(orelse, groups)
+    return rules
+
+
+def _rules_from(categorize) -> tuple:
+    """
+    Regel-Tabelle für `_select_classify` aus dem Quelltext einer der
+    if/elif-Ketten der App (`app.categorize_play`, `app.categorize_result`),
+    damit die Tabelle nicht getrennt gepflegt werden muss.
+
+    :return: `(Regeln, Ergebnis ohne Treffer)`
+    """
+    function = ast.parse(textwrap.dedent(inspect.getsource(categorize))).body[0]
+    *rules, (groups, default) = _chain_rules(function.body)
+    if groups:
+        raise ValueError(f"{categorize.__name__}: Kette endet nicht mit return")
+    return rules, default
+
+
+def _select_classify(details: pd.Series, rules: list, default) -> pd.Series:
+    """
+    Vektorisierte Klassifikation mit einer Regel-Tabelle.
+
+    Der Text wird einmal in Kleinbuchstaben umgewandelt, jedes Stichwort
+    einmal per `str.contains` gesucht. `np.select` wählt pro Zeile die erste
+    zutreffende Regel, genau wie die `if/elif`-Kette.
+
+    :param details: Spalte "Details"
+    :param rules: Liste von `(Bedingungen, Ergebnis)`; jede Bedingung ist ein
+        Tupel von Stichwörtern, von denen mindestens eines vorkommen muss
+    :param default: Ergebnis, wenn keine Regel zutrifft
+    :return: Series mit dem Ergebnis pro Zeile
+    """
+    lower = details.str.lower()
+    masks = {}
+
+    def contains(keyword):
+        if keyword not in masks:
+            found = lower.str.contains(keyword, regex=False, na=False)
+            masks[keyword] = found.to_numpy(dtype=bool)
+        return masks[keyword]
+
+    conditions = []
+    for groups, _ in rules:
+        condition = np.ones(len(details), dtype=bool)
+        for keywords in groups:
+            condition &= np.logical_or.reduce([contains(word) for word in keywords])
+        conditions.append(condition)
+
+    # Als object-Arrays, damit np.select auch None als Ergebnis zulässt
+    choices = [np.full(len(details), result, dtype=object) for _, result in rules]
+    selected = np.select(conditions, choices, default=default)
+    return pd.Series(selected, index=details.index, dtype=object)
+
+
+def _season_details(rows: int, seed: int = 0) -> pd.Series:
+    """Spalte "Details" einer Saison aus zufällig gezogenen Beispielen."""
+    generator = random.Random(seed)
+    return pd.Series(
+        [generator.choice(DETAIL_SAMPLES) for _ in range(rows)], dtype=object
+    )
+
+
+def benchmark_classify(args: argparse.Namespace) -> int:
+    """
+    Misst die Klassifikation von Spielzugtyp und Ergebnis auf einer Saison:
+    `Series.apply` mit den if/elif-Ketten (`app.categorize_*`, so in der App
+    verwendet) gegen eine vektorisierte Variante mit `str.contains`-Masken
+    und `np.select` (`_select_classify`). Deren Regeln werden aus dem
+    Quelltext der Ketten abgeleitet (`_rules_from`).
+
+    Die vektorisierte Variante muss jedes Stichwort in jeder Zeile suchen,
+    die Ketten brechen beim ersten Treffer ab; bei den Datenmengen einer
+    Saison ist `apply` daher schneller.
+
+    :return: 1, wenn die Ergebnisse abweichen
+    """
+    # app importiert Streamlit; nur für diesen Benchmark laden
+    import app
+
+    details = _season_details(args.rows)
+    cases = {"Play Type": app.categorize_play, "Result": app.categorize_result}
+
+    table = Table(title=f"Klassifikation, {args.rows} Plays")
+    table.add_column("Spalte")
+    table.add_column("apply (ms)", justify="right")
+    table.add_column("np.select (ms)", justify="right")
+    table.add_column("Faktor", justify="right")
+    table.add_column("Identisch", justify="right")
+
+    failed = False
+    for name, categorize in cases.items():
+        rules, default = _rules_from(categorize)
+        apply_seconds, expected = _best_time(
+            lambda column: column.apply(categorize), details, args.repeat
+        )
+        select_seconds, result = _best_time(
+            lambda column: _select_classify(column, rules, default),
+            details,
+            args.repeat,
+        )
+        identical = expected.equals(result)
+        failed = failed or not identical
+        table.add_row(
+            name,
+            f"{apply_seconds * 1000:.2f}",
+            f"{select_seconds * 1000:.2f}",
+            f"{apply_seconds / max(select_seconds, 1e-9):.2f}x",
+            "ja" if identical else "[red]nein[/red]",
+        )
+
+    print(table)
+    return 1 if failed else 0
+
+
+#######################################################
+#########               Fumble                #########
+#######################################################
+
+# Ergebnisse und Ballbesitz eines Spiels; Fumbles mit und ohne Wechsel
+FUMBLE_RESULTS = [
+    "Rush",
+    "Complete",
+    "Incomplete",
+    "Fumble",
+    "Complete, Fumble",
+    "Sack, Fumble",
+    "Rush, TD",
+    "Punt",
+]
+PLAYS_PER_GAME = 150
+
+
+def _iterrows_verify_fumble(df: pd.DataFrame) -> pd.DataFrame:
+    """Frühere Zeilenschleife von `app.verify_fumble` (ohne Ausgaben) als Referenz."""
+    for index, row in df.iterrows():
+        current_result = row["RESULT"].lower()
+        if "fumble" in current_result:
+            current_poss = row["POSS"]
+            next_poss = df["POSS"].shift(-1).iloc[index]
+            if current_poss == next_poss:
+                if "sack" in current_result:
+                    new_result = "Sack"
+                elif "complete" in current_result:
+                    new_result = "Complete"
+                else:
+                    new_result = "Rush"
+                df.at[index, "RESULT"] = new_result
+    return df
+
+
+def _fumble_frame(games: int, seed: int = 0) -> pd.DataFrame:
+    """Spalten RESULT und POSS mehrerer Spiele hintereinander."""
+    generator = random.Random(seed)
+    rows = games * PLAYS_PER_GAME
+    return pd.DataFrame(
+        {
+            "RESULT": [generator.choice(FUMBLE_RESULTS) for _ in range(rows)],
+            "POSS": [generator.choice(("HOM", "VIS")) for _ in range(rows)],
+        }
+    )
+
+
+def benchmark_fumble(args: argparse.Namespace) -> int:
+    """
+    Misst `app.verify_fumble` gegen die frühere Zeilenschleife auf Tabellen
+    aus mehreren Spielen.
+
+    Die Zeilenschleife berechnet pro Fumble `shift(-1)` über die ganze
+    Spalte und wächst damit quadratisch. Pro Verdopplung der Spiele wird der
+    Wachstumsexponent log2(t(2n) / t(n)) ausgegeben; linear heißt ≈ 1. Die
+    Schleife wird nicht weiter vergrößert, sobald ein Lauf das Zeitbudget
+    überschreitet.
+
+    :return: 1, wenn `verify_fumble` superlinear wächst oder abweicht
+    """
+    # app importiert Streamlit; nur für diesen Benchmark laden
+    import app
+
+    games = []
+    count = 1
+    while count <= args.max_games:
+        games.append(count)
+        count *= 2
+
+    table = Table(title="verify_fumble")
+    table.add_column("Spiele", justify="right")
+    table.add_column("Plays", justify="right")
+    table.add_column("Schleife (ms)", justify="right")
+    table.add_column("Exponent", justify="right")
+    table.add_column("Vektorisiert (ms)", justify="right")
+    table.add_column("Exponent", justify="right")
+    table.add_column("Identisch", justify="right")
+
+    failed = False
+    loop_previous = vector_previous = None
+    loop_running = True
+    for count in games:
+        df = _fumble_frame(count)
+        vector_seconds, result = _best_time(
+            lambda frame: app.verify_fumble(frame.copy()), df, args.repeat
+        )
+        vector_exponent = "-"
+        if vector_previous:
+            exponent = math.log2(max(vector_seconds, 1e-9) / vector_previous)
+            vector_exponent = f"{exponent:.2f}"
+            # Unterhalb von 1 ms dominiert Rauschen
+            if exponent > args.max_exponent and vector_seconds > 1e-3:
+                failed = True
+        vector_previous = max(vector_seconds, 1e-9)
+
+        loop_ms, loop_exponent, identical = "übersprungen", "-", "-"
+        if loop_running:
+            loop_seconds, expected = _best_time(
+                lambda frame: _iterrows_verify_fumble(frame.copy()), df, 1
+            )
+            loop_ms = f"{loop_seconds * 1000:.2f}"
+            if loop_previous:
+                loop_exponent = (
+                    f"{math.log2(max(loop_seconds, 1e-9) / loop_previous):.2f}"
+                )
+            loop_previous = max(loop_seconds, 1e-9)
+            loop_running = loop_seconds < args.loop_budget
+
+            identical = expected.equals(result)
+            failed = failed or not identical
+            identical = "ja" if identical else "[red]nein[/red]"
+
+        table.add_row(
+            str(count),
+            str(len(df)),
+            loop_ms,
+            loop_exponent,
+            f"{vector_seconds * 1000:.2f}",
+            vector_exponent,
+            identical,
+        )
+
+    print(table)
+    if failed:
+        print("[red]verify_fumble wächst superlinear oder weicht ab.[/red]")
+    return 1 if failed else 0
+
+
+#######################################################
+#########                 CLI                 #########
+#######################################################
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="benchmark", description="Benchmarks für den Gamebook-Extractor"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backends = subparsers.add_parser(
+        "backends", help="Extraktions-Backends auf einem lokalen Korpus vergleichen"
+    )
+    backends.add_argument("corpus", help="Verzeichnis oder Glob-Muster mit PDFs")
+    backends.add_argument(
+        "--backend",
+        dest="backends",
+        action="append",
+        help="Nur dieses Backend messen (mehrfach möglich, Default: alle installierten)",
+    )
+    backends.add_argument(
+        "--reference",
+        default=DEFAULT_BACKEND,
+        help=f"Referenz für die Äquivalenzprüfung (Default: {DEFAULT_BACKEND})",
+    )
+    backends.set_defaults(func=benchmark_backends)
+
+    plays = subparsers.add_parser(
+        "plays", help="Play-Scanner gegen PATTERN_PLAY auf Worst-Case-Eingaben messen"
+    )
+    plays.add_argument(
+        "--min-size", type=int, default=64, help="Kleinste Länge (Zeichen)"
+    )
+    plays.add_argument(
+        "--max-size", type=int, default=1 << 20, help="Größte Länge (Zeichen)"
+    )
+    plays.add_argument(
+        "--repeat", type=int, default=3, help="Wiederholungen pro Messung"
+    )
+    plays.add_argument(
+        "--regex-budget",
+        type=float,
+        default=1.0,
+        help="Sekunden, ab denen das Regex nicht weiter vergrößert wird",
+    )
+    plays.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.5,
+        help="Größter zulässiger Wachstumsexponent des Scanners",
+    )
+    plays.set_defaults(func=benchmark_plays)
+
+    events = subparsers.add_parser(
+        "events", help="GameEvent-Validierung pro Objekt gegen Batch messen"
+    )
+    events.add_argument(
+        "--plays",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000],
+        help="Anzahl Plays pro Drive (mehrere Werte möglich)",
+    )
+    events.add_argument(
+        "--repeat", type=int, default=5, help="Wiederholungen pro Messung"
+    )
+    events.set_defaults(func=benchmark_events)
+
+    memory = subparsers.add_parser(
+        "memory", help="Speicher einer Saison: Play-Dictionaries gegen models.Play"
+    )
+    memory.add_argument(
+        "corpus", help="Verzeichnis oder Glob-Muster mit JSON-Dateien aus batch.py"
+    )
+    memory.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help="Jedes Dokument so oft laden (Saison aus wenigen Spielen hochrechnen)",
+    )
+    memory.set_defaults(func=benchmark_memory)
+
+    classify = subparsers.add_parser(
+        "classify", help="Spielzugtyp und Ergebnis: apply gegen np.select"
+    )
+    classify.add_argument(
+        "--rows",
+        type=int,
+        default=15000,
+        help="Anzahl Plays (Default: etwa eine Saison, 100 Spiele à 150 Plays)",
+    )
+    classify.add_argument(
+        "--repeat", type=int, default=3, help="Wiederholungen pro Messung"
+    )
+    classify.set_defaults(func=benchmark_classify)
+
+    fumble = subparsers.add_parser(
+        "fumble", help="verify_fumble auf mehreren Spielen: Skalierung messen"
+    )
+    fumble.add_argument(
+        "--max-games", type=int, default=256, help="Größte Anzahl Spiele"
+    )
+    fumble.add_argument(
+        "--repeat", type=int, default=3, help="Wiederholungen pro Messung"
+    )
+    fumble.add_argument(
+        "--loop-budget",
+        type=float,
+        default=2.0,
+        help="Sekunden, ab denen die Zeilenschleife nicht weiter vergrößert wird",
+    )
+    fumble.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.5,
+        help="Größter zulässiger Wachstumsexponent von verify_fumble",
+    )
+    fumble.set_defaults(func=benchmark_fumble)
+
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+# Program
+if __name__ == "__main__":
+    sys.exit(main())
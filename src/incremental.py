@@ -0,0 +1,156 @@
+# Dependencies
+import hashlib
+
+from scouter import (
+    SECTION_PARSERS,
+    integrity_report,
+    parse_participation,
+    parse_quarter,
+    participation_report_parts,
+    play_by_play_text,
+    split_quarters,
+    stitch_drives,
+)
+from sections import (
+    DRIVE_SUMMARY,
+    PARTICIPATION,
+    PLAY_BY_PLAY,
+    SECTIONS,
+    index_sections,
+)
+
+# Const. Vars
+# Bei Änderungen an den Parsern erhöhen, damit alte Manifeste verworfen werden
+MANIFEST_VERSION = 3
+
+
+# Funcs
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _section_pages(index: dict, name: str) -> list:
+    """Seiten, von denen das Ergebnis eines Abschnitts abhängt."""
+    pages = list(index.get(name, range(0)))
+    if name == PLAY_BY_PLAY and PARTICIPATION in index:
+        # Das Play-by-Play endet auf der ersten Seite des Participation Reports
+        pages.append(index[PARTICIPATION].start)
+    return pages
+
+
+def changed_sections(page_hashes: list, index: dict, manifest: dict) -> list:
+    """
+    Ermittelt die Abschnitte, deren Seiten sich gegenüber dem Manifest geändert haben.
+
+    Verglichen wird die Folge der Seiten-Hashes pro Abschnitt, d.h. ein Abschnitt
+    gilt auch dann als unverändert, wenn er durch eingefügte Seiten verschoben wurde.
+    """
+    old_hashes = manifest["page_hashes"]
+    old_index = {
+        name: range(start, stop) for name, (start, stop) in manifest["sections"].items()
+    }
+
+    changed = []
+    for name in SECTIONS:
+        new = [page_hashes[i] for i in _section_pages(index, name)]
+        old = [old_hashes[i] for i in _section_pages(old_index, name)]
+        if new != old:
+            changed.append(name)
+    return changed
+
+
+def parse_gamebook_incremental(
+    pages, previous_doc: dict | None = None, manifest: dict | None = None
+) -> tuple:
+    """
+    Parst ein (neu veröffentlichtes) Gamebook und verwendet dabei möglichst viel
+    vom vorherigen Ergebnis wieder.
+
+    Über Seiten-Hashes werden die geänderten Abschnitte bestimmt; nur deren
+    Parser laufen erneut und ihre Ergebnisse werden in `previous_doc`
+    übernommen. Im Play-by-Play wird pro Quarter gehasht, so dass nur
+    geänderte Quarter neu geparst werden; das Zusammensetzen der Drives
+    (`stitch_drives`) läuft immer über alle Quarter, ist aber billig.
+
+    Ohne vorheriges Ergebnis oder bei veraltetem Manifest wird vollständig geparst.
+    Das Ergebnis ist in jedem Fall identisch zu `parse_gamebook(pages)`.
+
+    Parameters
+    ----------
+    pages : Sequence[str]
+        Text pro Seite der neuen Version.
+    previous_doc : dict, optional
+        Ergebnis für die vorherige Version.
+    manifest : dict, optional
+        Manifest der vorherigen Version (zweiter Rückgabewert dieser Funktion).
+
+    Returns
+    -------
+    tuple
+        `(doc, manifest)`; das Manifest ist JSON-serialisierbar und enthält unter
+        `changed` bzw. `reparsed_quarters` die neu geparsten Abschnitte und Quarter.
+    """
+    page_hashes = [hash_text(pages[i]) for i in range(len(pages))]
+    index = index_sections(pages)
+
+    full = (
+        previous_doc is None
+        or manifest is None
+        or manifest.get("version") != MANIFEST_VERSION
+    )
+    changed = list(SECTIONS) if full else changed_sections(page_hashes, index, manifest)
+    doc = {} if full else dict(previous_doc)
+
+    for name, parser in SECTION_PARSERS.items():
+        if name in changed:
+            page_range = index[name]
+            doc = parser("\n".join(pages[page_range.start : page_range.stop]), doc)
+
+    if PARTICIPATION in changed:
+        report_parts = participation_report_parts(pages, index)
+        if len(report_parts) == 2:
+            doc = parse_participation(*report_parts, doc)
+        else:
+            doc.pop("participation", None)
+
+    quarters = [] if full else manifest["quarters"]
+    reparsed_quarters = []
+    if PLAY_BY_PLAY in changed:
+        cached = {quarter["hash"]: quarter["segments"] for quarter in quarters}
+        quarters = []
+        drives = play_by_play_text(pages, index)
+        for quarter_no, quarter_str in enumerate(split_quarters(drives), start=1):
+            # Die Quarter-Nummer fließt in das Parsen ein (Drive-Nummern, "Quarter")
+            key = hash_text(f"{quarter_no}\n{quarter_str}")
+            segments = cached.get(key)
+            if segments is None:
+                segments = parse_quarter(quarter_no, quarter_str)
+                reparsed_quarters.append(quarter_no)
+            quarters.append({"hash": key, "segments": segments})
+
+    if PLAY_BY_PLAY in changed or DRIVE_SUMMARY in changed:
+        # parse_page_five schreibt ebenfalls doc["drives"]
+        integrity = {}
+        doc["drives"] = stitch_drives(
+            [quarter["segments"] for quarter in quarters], integrity
+        )
+        doc["integrity"] = integrity_report(integrity)
+
+    # Neu hinzugekommene Schlüssel stehen sonst hinter "integrity"; Reihenfolge
+    # wie in parse_gamebook: Participation Report, danach die Integrität
+    for key in ("participation", "integrity"):
+        if key in doc:
+            doc[key] = doc.pop(key)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "page_hashes": page_hashes,
+        "sections": {
+            name: [page_range.start, page_range.stop]
+            for name, page_range in index.items()
+        },
+        "quarters": quarters,
+        "changed": changed,
+        "reparsed_quarters": reparsed_quarters,
+    }
+    return doc, manifest
@@ -0,0 +1,244 @@
+# Dependencies
+import re
+from typing import NamedTuple
+
+from patterns import REGISTRY
+from sections import MARKER_PARTICIPATION
+
+# Const. Vars
+## Token-Arten
+QUARTER = "quarter"  # Überschrift "Play-by-Play Summary (n Quarter)", value: n
+DRIVE = "drive"  # Drive-Header "Spot: .. Clock: .. Drive:"
+SEGMENT = "segment"  # Text bis zum nächsten Header, value: Drive-Text vor "Plays"
+PLAY = "play"  # Ein Play im Drive-Text, value: (Team, Down&Distance, YardLine, Details)
+SUMMARY = "summary"  # Drive-Summary "Plays n Yards .. TOP .. SCORE", value: n
+PARTICIPATION = "participation"  # Block nach einer Report-Überschrift, value: Text
+
+## Patterns
+PATTERN_SPLIT_DRIVE = r"Spot:\s+\w+\s+Clock:\s+\d{2}:\d{2}\s+Drive:\s+"
+PATTERN_SPLIT_QUARTER = r"Play-by-Play Summary \([1-5] Quarter\)"
+PATTERN_SUMMARY = (
+    r"\s*Plays\s+\d+\s+Yards\s+[-]?\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
+)
+PATTERN_PLAYS_COUNT = (
+    r"\s*Plays\s+(\d+)\s+Yards\s+[-]?\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
+)
+
+## Play-Pattern für extract_entries
+PATTERN_PART_TEAM = r"([A-Za-z]{2,3})"
+PATTERN_PART_DOWN_DISTANCE = r"([0-9]{1,2}&[0-9]{1,2})?"
+PATTERN_PART_YARDLINE = r"(@\s*[A-Za-z]+\d+)"
+PATTERN_PART_DETAILS = r"([^@]*)?"
+# "{pattern_drive_summary}" steht hier wörtlich (kein f-String) und wird von
+# `re` als Literal gelesen; bewusst unverändert übernommen, damit das
+# Ergebnis identisch bleibt.
+PATTERN_PART_LOOKAHEAD = (
+    r"(?=\s+[A-Za-z]{2,3}\s|$|(?=.{0,29}$)|(?={pattern_drive_summary}))"
+)
+# Referenz für `iter_plays`; wegen der verschachtelten `\s*` vor und nach den
+# Details wächst die Laufzeit bei langen Leerraum-Folgen polynomiell.
+PATTERN_PLAY = rf"(?<=\s){PATTERN_PART_TEAM}\s*{PATTERN_PART_DOWN_DISTANCE}\s*{PATTERN_PART_YARDLINE}\s*{PATTERN_PART_DETAILS}\s*{PATTERN_PART_LOOKAHEAD}"
+
+## Zweistufiger Play-Scanner (iter_plays)
+# Stufe 1: Kopf eines Plays bis einschließlich YardLine. Anders als in
+# PATTERN_PLAY kann Leerraum nur von genau einem `\s*` erfasst werden, daher
+# ist jeder Fehlversuch linear in der Länge des Leerraums.
+PATTERN_PLAY_HEAD = (
+    rf"(?<=\s){PATTERN_PART_TEAM}\s*(?:([0-9]{{1,2}}&[0-9]{{1,2}})\s*)?"
+    rf"{PATTERN_PART_YARDLINE}"
+)
+# Stufe 2: Erste Alternative des Lookaheads ("\s+Team\s"), verankert am
+# letzten Leerzeichen vor dem nächsten Team-Kürzel
+PATTERN_NEXT_TEAM = r"\s[A-Za-z]{2,3}(?=\s)"
+LITERAL_DRIVE_SUMMARY = "{pattern_drive_summary}"
+
+# Alle Stellen, an denen sich die Struktur des Play-by-Play ändert, in einem
+# Pattern. Keine der Alternativen kann innerhalb einer anderen beginnen,
+# daher liefert ein Durchlauf dieselben Grenzen wie die früheren
+# verschachtelten `split`-Aufrufe.
+PATTERN_MARKER = (
+    rf"(?P<{QUARTER}>Play-by-Play Summary \(([1-5]) Quarter\))"
+    rf"|(?P<{DRIVE}>{PATTERN_SPLIT_DRIVE})"
+    r"|(?P<plays>Plays)"
+    rf"|(?P<{PARTICIPATION}>{MARKER_PARTICIPATION})"
+)
+
+RE_SPLIT_QUARTER = REGISTRY.register("split_quarter", PATTERN_SPLIT_QUARTER)
+RE_SUMMARY = REGISTRY.register("drive_summary", PATTERN_SUMMARY)
+RE_PLAYS_COUNT = REGISTRY.register("plays_count", PATTERN_PLAYS_COUNT)
+RE_PLAY = REGISTRY.register("play", PATTERN_PLAY, re.DOTALL)
+RE_PLAY_HEAD = REGISTRY.register("play_head", PATTERN_PLAY_HEAD)
+RE_NEXT_TEAM = REGISTRY.register("next_team", PATTERN_NEXT_TEAM)
+RE_WHITESPACE = REGISTRY.register("whitespace", r"\s*")
+RE_MARKER = REGISTRY.register("pbp_marker", PATTERN_MARKER)
+
+
+# Classes
+class Token(NamedTuple):
+    kind: str
+    start: int
+    end: int
+    value: object = None
+
+
+# Funcs
+def _play_end(text: str, yardline_end: int, details_start: int) -> int:
+    """
+    Ende eines Plays, wie es PATTERN_PLAY bestimmt, oder -1.
+
+    PATTERN_PLAY erweitert die Details gierig bis vor das nächste "@" und
+    gibt dann so lange Zeichen zurück, bis der Lookahead passt. Das Ende ist
+    damit die größte Position bis zum nächsten "@", an der der Lookahead
+    gilt. Statt jede Position zu prüfen, werden die Alternativen des
+    Lookaheads direkt gesucht.
+    """
+    at = text.find("@", yardline_end)
+    if at == -1:
+        at = len(text)
+
+    # `$` bzw. `.{0,29}$`: gilt an allen Positionen nahe dem Textende, also
+    # auch an der größten möglichen
+    tail = 30 if text.endswith("\n") else 29
+    if at >= len(text) - tail:
+        return at
+
+    end = text.rfind(LITERAL_DRIVE_SUMMARY, details_start, at)
+    for match in RE_NEXT_TEAM.finditer(text, details_start, at):
+        end = max(end, match.start())
+    if end != -1:
+        return end
+
+    # Vor den Details kann nur noch der Leerraum nach der YardLine enden
+    if details_start > yardline_end and RE_NEXT_TEAM.match(text, details_start - 1):
+        return details_start - 1
+    return -1
+
+
+def iter_plays(text: str):
+    """
+    Findet die Plays eines Drive-Texts in linearer Zeit.
+
+    Liefert dieselben Treffer wie `RE_PLAY.finditer(text)`: Zuerst wird der
+    Kopf (Team, Down&Distance, YardLine) mit einem eindeutigen Pattern
+    gesucht, danach das Ende der Details über `_play_end` bestimmt. Jedes
+    Zeichen wird dabei nur konstant oft betrachtet.
+
+    :param text: Drive-Text
+    :return: Generator über `(start, end, (Team, Down&Distance, YardLine, Details))`
+    """
+    position = 0
+    while True:
+        head = RE_PLAY_HEAD.search(text, position)
+        if head is None:
+            return
+
+        yardline_end = head.end()
+        details_start = RE_WHITESPACE.match(text, yardline_end).end()
+        end = _play_end(text, yardline_end, details_start)
+        if end == -1:
+            position = head.start() + 1
+            continue
+
+        team, down_distance, yardline = head.groups()
+        details = text[details_start:end] if end >= details_start else ""
+        yield head.start(), end, (team, down_distance, yardline, details)
+        position = end
+
+
+def _segment_tokens(text: str, start: int, end: int, plays_at, drive_header):
+    """
+    Token eines Segments (Text zwischen zwei Headern).
+
+    Der Drive-Text vor dem ersten "Plays" wird hier einmal als String
+    erzeugt; darauf laufen die Plays, alle anderen Prüfungen arbeiten mit
+    Offsets.
+    """
+    if drive_header is not None:
+        yield Token(DRIVE, drive_header.start(), drive_header.end())
+
+    body_end = plays_at[0] if plays_at else end
+    body = text[start:body_end]
+    yield Token(SEGMENT, start, end, body)
+
+    for play_start, play_end, groups in iter_plays(body):
+        yield Token(PLAY, start + play_start, start + play_end, groups)
+
+    # Die Summary beginnt immer an einem "Plays"; ihr Pflichtteil kann keinen
+    # Marker enthalten und endet daher vor dem nächsten Header
+    for position in plays_at:
+        summary = RE_PLAYS_COUNT.match(text, position, end)
+        if summary is not None:
+            yield Token(SUMMARY, position, summary.end(), int(summary.group(1)))
+            break
+
+
+def tokenize(text: str, in_quarter: bool = False, participation: bool = True):
+    """
+    Zerlegt Play-by-Play (und ggf. Participation Report) in einem Durchlauf in Token.
+
+    Der Text wird einmal nach allen Strukturmarken durchsucht (Quarter-,
+    Drive-Überschriften, "Plays", Participation Report). Aus den Offsets
+    ergeben sich die Segmente; nur deren Drive-Text wird als String erzeugt
+    und nach Plays durchsucht. Text vor dem ersten Quarter wird ignoriert.
+
+    Parameters
+    ----------
+    text : str
+        Play-by-Play-Text, optional gefolgt vom Participation Report.
+    in_quarter : bool
+        Der Text beginnt bereits innerhalb eines Quarters (z.B. ein einzelnes
+        Quarter aus `split_quarters`).
+    participation : bool
+        Ab der ersten Überschrift "Participation Report" folgen die Reports.
+        Mit `False` gilt der ganze Text als Play-by-Play.
+
+    Returns
+    -------
+    Generator[Token]
+        Token in Textreihenfolge: QUARTER, dann pro Segment ggf. DRIVE,
+        SEGMENT, PLAY..., ggf. SUMMARY; am Ende die PARTICIPATION-Blöcke.
+    """
+    segment_start = 0 if in_quarter else None
+    drive_header = None
+    plays_at = []
+    participation_at = None
+
+    for match in RE_MARKER.finditer(text):
+        kind = match.lastgroup
+        if kind == "plays":
+            if segment_start is not None:
+                plays_at.append(match.start())
+            continue
+        if kind == PARTICIPATION:
+            if not participation:
+                continue
+            participation_at = match
+            break
+
+        if segment_start is not None:
+            yield from _segment_tokens(
+                text, segment_start, match.start(), plays_at, drive_header
+            )
+        plays_at = []
+
+        if kind == QUARTER:
+            yield Token(QUARTER, match.start(), match.end(), int(match.group(2)))
+            drive_header = None
+            segment_start = match.end()
+        elif segment_start is not None:
+            drive_header = match
+            segment_start = match.end()
+
+    end = participation_at.start() if participation_at else len(text)
+    if segment_start is not None:
+        yield from _segment_tokens(text, segment_start, end, plays_at, drive_header)
+
+    if participation_at is not None:
+        start = participation_at.end()
+        while True:
+            next_marker = text.find(MARKER_PARTICIPATION, start)
+            stop = len(text) if next_marker == -1 else next_marker
+            yield Token(PARTICIPATION, start, stop, text[start:stop])
+            if next_marker == -1:
+                break
+            start = next_marker + len(MARKER_PARTICIPATION)
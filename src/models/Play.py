@@ -0,0 +1,102 @@
+# Dependencies
+import sys
+
+# Const. Vars
+# Schlüssel und Reihenfolge eines Plays im JSON (siehe scouter.play_entry)
+KEYS = ("Quarter", "Series", "Index", "Down&Distance", "YardLine", "Details")
+
+
+# Funcs
+def _encode_series(series) -> tuple:
+    """
+    Drive-Nummer als `(series_no, width)`.
+
+    Im JSON steht die Drive-Nummer mal als int (0, 99, ...), mal als String
+    aus dem Text ("03"). Ziffern-Strings werden als int mit ihrer Länge
+    gespeichert, damit `"03"` und `3` beim Zurückwandeln unterscheidbar
+    bleiben; alles andere bleibt unverändert mit Länge -1.
+    """
+    if isinstance(series, str):
+        if series.isascii() and series.isdigit():
+            return int(series), len(series)
+        return sys.intern(series), -1
+    return series, 0
+
+
+# Classes
+class Play:
+    """
+    Kompakter Datensatz eines Plays.
+
+    Ersetzt das Dictionary aus `scouter.play_entry` beim Laden vieler Spiele:
+    keine Schlüssel pro Play, Quarter und Drive-Nummer als int, Team-Kürzel,
+    Down&Distance und YardLine interniert (wenige verschiedene Werte).
+    `to_dict` liefert wieder exakt das Dictionary, aus dem der Play erzeugt wurde.
+    """
+
+    __slots__ = (
+        "quarter",
+        "series_no",
+        "_series_width",
+        "team",
+        "down_distance",
+        "yardline",
+        "details",
+    )
+
+    def __init__(
+        self,
+        quarter: int,
+        series,
+        team: str,
+        down_distance: str,
+        yardline: str,
+        details: str,
+    ):
+        self.quarter = quarter
+        self.series_no, self._series_width = _encode_series(series)
+        self.team = sys.intern(team)
+        self.down_distance = sys.intern(down_distance)
+        self.yardline = sys.intern(yardline)
+        self.details = details
+
+    @property
+    def series(self):
+        """Drive-Nummer wie im JSON (int oder String)."""
+        if self._series_width <= 0:
+            return self.series_no
+        return str(self.series_no).zfill(self._series_width)
+
+    @classmethod
+    def from_dict(cls, play: dict) -> "Play":
+        return cls(*(play[key] for key in KEYS))
+
+    def to_dict(self) -> dict:
+        return {
+            "Quarter": self.quarter,
+            "Series": self.series,
+            "Index": self.team,
+            "Down&Distance": self.down_distance,
+            "YardLine": self.yardline,
+            "Details": self.details,
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Play):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Play({self.to_dict()!r})"
+
+
+def compact_drives(drives: dict) -> dict:
+    """`doc["drives"]` mit `Play` statt Dictionaries."""
+    return {
+        key: [Play.from_dict(play) for play in plays] for key, plays in drives.items()
+    }
+
+
+def expand_drives(drives: dict) -> dict:
+    """Umkehrung von `compact_drives`; liefert die JSON-Form von `doc["drives"]`."""
+    return {key: [play.to_dict() for play in plays] for key, plays in drives.items()}
@@ -1,7 +1,14 @@
 # Dependencies
-import re
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
 
-from pydantic import BaseModel, field_validator
+from patterns import REGISTRY
+
+# Const. Vars
+RE_POSSESSION = REGISTRY.register("event_possession", r"^[A-Z]{2}$")
+RE_DOWN_AND_DISTANCE = REGISTRY.register("event_down_and_distance", r"^\d+&\d+$")
+RE_YARDLINE = REGISTRY.register("event_yardline", r"^@ [A-Z]+\d+$")
+
+MAX_REPORTED_ERRORS = 10  # Anzahl der Fehler, die validate_events meldet
 
 
 class GameEvent(BaseModel):
@@ -12,19 +19,19 @@ class GameEvent(BaseModel):
 
     @field_validator("possession")
     def validate_possession(cls, v):
-        if not re.match(r"^[A-Z]{2}$", v):
+        if not RE_POSSESSION.match(v):
             raise ValueError("Possession must be two uppercase letters")
         return v
 
     @field_validator("downanddistance")
     def validate_down_and_distance(cls, v):
-        if v and not re.match(r"^\d+&\d+$", v):
+        if v and not RE_DOWN_AND_DISTANCE.match(v):
             raise ValueError('Down and distance must be in the format "X&Y"')
         return v
 
     @field_validator("yardline")
     def validate_yardline(cls, v):
-        if v and not re.match(r"^@ [A-Z]+\d+$", v):
+        if v and not RE_YARDLINE.match(v):
             raise ValueError(
                 'Yardline must start with "@" followed by a team and number'
             )
@@ -37,3 +44,26 @@ class GameEvent(BaseModel):
             "YardLine": self.yardline,
             "Details": self.details,
         }
+
+
+GAME_EVENTS = TypeAdapter(list[GameEvent])
+
+
+def validate_events(events: list, max_errors: int = MAX_REPORTED_ERRORS) -> list:
+    """
+    Validiert alle Events eines Drives in einem Aufruf.
+
+    Statt pro Event ein `GameEvent` zu konstruieren, läuft die ganze Liste
+    einmal durch `GAME_EVENTS`. Ungültige Events brechen nicht beim ersten
+    Fehler ab: der `ValidationError` enthält die ersten `max_errors` Fehler
+    mit dem Index des Events in `loc`.
+
+    :param events: Dictionaries mit den Feldern von `GameEvent`
+    :param max_errors: Maximale Anzahl gemeldeter Fehler
+    :return: Liste von `GameEvent`
+    """
+    try:
+        return GAME_EVENTS.validate_python(events)
+    except ValidationError as error:
+        details = error.errors(include_url=False)[:max_errors]
+        raise ValidationError.from_exception_data(error.title, details) from None
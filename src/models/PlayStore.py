@@ -0,0 +1,119 @@
+# Dependencies
+from array import array
+
+from models.Play import KEYS
+
+# Const. Vars
+# Felder mit wenigen verschiedenen Werten, die als Codes gespeichert werden
+ENCODED_KEYS = KEYS[:-1]  # alle außer "Details"
+TYPECODE = "I"  # vorzeichenlose 32-Bit-Codes
+
+
+# Classes
+class SymbolTable:
+    """
+    Bildet Werte auf fortlaufende int-Codes ab und zurück.
+
+    Jeder Wert wird genau einmal gespeichert, egal wie oft er vorkommt.
+    Werte werden nach Typ und Wert unterschieden, d.h. die Drive-Nummer 3
+    und der String "03" erhalten verschiedene Codes.
+    """
+
+    def __init__(self):
+        self._codes = {}
+        self.symbols = []
+
+    def encode(self, value) -> int:
+        key = (type(value), value)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.symbols)
+            self._codes[key] = code
+            self.symbols.append(value)
+        return code
+
+    def decode(self, code: int):
+        return self.symbols[code]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+class PlayStore:
+    """
+    Spaltenweiser Speicher für die Plays vieler Spiele.
+
+    Quarter, Drive-Nummer, Team, Down&Distance und YardLine werden über eine
+    gemeinsame `SymbolTable` als int-Codes in `array`s abgelegt; nur die
+    Details bleiben Strings. Dekodiert wird erst beim Export (`drives`,
+    `columns`), das Ergebnis ist identisch zu dem, was mit `add` übergeben
+    wurde.
+
+    Verwendung::
+
+        store = PlayStore()
+        for path in paths:
+            store.add(path, doc["drives"])
+        store.drives(path)  # == doc["drives"]
+    """
+
+    def __init__(self, symbols: SymbolTable | None = None):
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.codes = {key: array(TYPECODE) for key in ENCODED_KEYS}
+        self.details = []
+        # Spiel -> Liste von (Drive-Schlüssel, erster Play, Ende)
+        self.games = {}
+
+    def __len__(self) -> int:
+        return len(self.details)
+
+    def add(self, game, drives: dict):
+        """
+        Übernimmt `doc["drives"]` eines Spiels.
+
+        :param game: Schlüssel des Spiels, z.B. der Pfad des Gamebooks
+        :param drives: Dictionary "Drive NN" -> Liste der Plays
+        """
+        encode = self.symbols.encode
+        ranges = []
+        for drive_key, plays in drives.items():
+            start = len(self.details)
+            for play in plays:
+                for key in ENCODED_KEYS:
+                    self.codes[key].append(encode(play[key]))
+                self.details.append(play["Details"])
+            ranges.append((drive_key, start, len(self.details)))
+        self.games[game] = ranges
+
+    def _play(self, position: int) -> dict:
+        symbols = self.symbols.symbols
+        play = {key: symbols[self.codes[key][position]] for key in ENCODED_KEYS}
+        play["Details"] = self.details[position]
+        return play
+
+    def drives(self, game) -> dict:
+        """Dekodiert die Drives eines Spiels in die Form von `doc["drives"]`."""
+        return {
+            drive_key: [self._play(position) for position in range(start, stop)]
+            for drive_key, start, stop in self.games[game]
+        }
+
+    def columns(self, game) -> dict:
+        """
+        Dekodiert die Plays eines Spiels spaltenweise, z.B. für `pd.DataFrame`.
+
+        :return: Dictionary Spalte -> Liste, mit einer zusätzlichen Spalte
+            "Drive" (Schlüssel des Drives)
+        """
+        ranges = self.games[game]
+        symbols = self.symbols.symbols
+        columns = {"Drive": []}
+        columns.update({key: [] for key in KEYS})
+        for drive_key, start, stop in ranges:
+            columns["Drive"].extend([drive_key] * (stop - start))
+            for key in ENCODED_KEYS:
+                columns[key].extend(
+                    symbols[code] for code in self.codes[key][start:stop]
+                )
+            columns["Details"].extend(self.details[start:stop])
+        return columns
@@ -0,0 +1,222 @@
+# Dependencies
+from contextlib import closing
+import hashlib
+import os
+import sqlite3
+import time
+
+# Const. Vars
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB Seitentext
+BUSY_TIMEOUT_SECONDS = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    pdf_hash    TEXT    NOT NULL,
+    extractor   TEXT    NOT NULL,
+    num_pages   INTEGER NOT NULL,
+    last_access REAL    NOT NULL,
+    PRIMARY KEY (pdf_hash, extractor)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    pdf_hash  TEXT    NOT NULL,
+    extractor TEXT    NOT NULL,
+    page_no   INTEGER NOT NULL,
+    text      TEXT    NOT NULL,
+    size      INTEGER NOT NULL,
+    PRIMARY KEY (pdf_hash, extractor, page_no)
+);
+-- Laufende Gesamtgröße aller Seiten, damit nicht bei jedem Schreiben summiert wird
+CREATE TABLE IF NOT EXISTS meta (
+    id         INTEGER PRIMARY KEY CHECK (id = 0),
+    total_size INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS pages_size_insert AFTER INSERT ON pages BEGIN
+    UPDATE meta SET total_size = total_size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS pages_size_delete AFTER DELETE ON pages BEGIN
+    UPDATE meta SET total_size = total_size - OLD.size;
+END;
+"""
+# Bestehende Caches ohne Zähler werden beim Öffnen einmalig nachgezählt
+INIT_META = """
+INSERT OR IGNORE INTO meta
+SELECT 0, COALESCE(SUM(size), 0) FROM pages WHERE NOT EXISTS (SELECT 1 FROM meta);
+"""
+
+
+def hash_pdf(pdf_bytes: bytes) -> str:
+    """
+    Berechnet den SHA-256-Hash eines PDF-Inhalts.
+
+    :param pdf_bytes: Inhalt der PDF-Datei
+    :return: Hex-Digest des Inhalts
+    """
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+class PageCache:
+    """
+    Persistenter Cache für extrahierten Seitentext auf Basis von SQLite.
+
+    Einträge sind über den Hash des PDF-Inhalts und die Version des Extraktors
+    adressiert, d.h. ein Update von PyPDF2 oder ein anderer Extraktor führt
+    automatisch zu neuen Einträgen. Übersteigt der gespeicherte Text
+    `max_bytes`, werden die am längsten nicht genutzten Dokumente entfernt.
+
+    Jede Operation öffnet eine eigene, kurzlebige Verbindung. Zusammen mit dem
+    WAL-Modus und `BEGIN IMMEDIATE` für Schreibzugriffe ist der Cache damit
+    sicher für parallele Leser und Schreiber aus mehreren Prozessen.
+
+    :param path: Pfad zur SQLite-Datei
+    :param max_bytes: Maximale Größe des gespeicherten Texts in Bytes
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(f"BEGIN IMMEDIATE;\n{SCHEMA}\n{INIT_META}\nCOMMIT;")
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        # Ersetzt INSERT OR REPLACE eine Seite, feuert der Delete-Trigger nur so
+        conn.execute("PRAGMA recursive_triggers = ON")
+        # closing(): der Context Manager von sqlite3 schließt die Verbindung nicht
+        return closing(conn)
+
+    def get_page(self, pdf_hash: str, extractor: str, page_no: int) -> str | None:
+        """Liefert den gecachten Text einer Seite oder None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT text FROM pages WHERE pdf_hash = ? AND extractor = ? AND page_no = ?",
+                (pdf_hash, extractor, page_no),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(conn, pdf_hash, extractor)
+            return row[0]
+
+    def get_pages(self, pdf_hash: str, extractor: str) -> list | None:
+        """Liefert den Text aller Seiten, falls das Dokument vollständig gecacht ist."""
+        with self._connect() as conn:
+            document = conn.execute(
+                "SELECT num_pages FROM documents WHERE pdf_hash = ? AND extractor = ?",
+                (pdf_hash, extractor),
+            ).fetchone()
+            if document is None:
+                return None
+
+            rows = conn.execute(
+                "SELECT text FROM pages WHERE pdf_hash = ? AND extractor = ? ORDER BY page_no",
+                (pdf_hash, extractor),
+            ).fetchall()
+            if len(rows) != document[0]:
+                return None
+
+            self._touch(conn, pdf_hash, extractor)
+            return [row[0] for row in rows]
+
+    def put_page(
+        self, pdf_hash: str, extractor: str, page_no: int, text: str, num_pages: int
+    ):
+        """Speichert den Text einer einzelnen Seite."""
+        self.put_pages(pdf_hash, extractor, {page_no: text}, num_pages)
+
+    def put_pages(
+        self,
+        pdf_hash: str,
+        extractor: str,
+        pages: list | dict,
+        num_pages: int | None = None,
+    ):
+        """
+        Speichert den Text mehrerer Seiten und räumt bei Bedarf den Cache auf.
+
+        :param pages: Liste mit dem Text pro Seite oder Dictionary Seitennummer -> Text
+        :param num_pages: Seitenanzahl des Dokuments (Default: `len(pages)`)
+        """
+        if not isinstance(pages, dict):
+            pages = dict(enumerate(pages))
+        if num_pages is None:
+            num_pages = len(pages)
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                    (pdf_hash, extractor, num_pages, time.time()),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (pdf_hash, extractor, page_no, text, len(text.encode("utf-8")))
+                        for page_no, text in pages.items()
+                    ],
+                )
+                self._evict(conn, keep=(pdf_hash, extractor))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def size(self) -> int:
+        """Gesamtgröße des gespeicherten Texts in Bytes."""
+        with self._connect() as conn:
+            return self._total_size(conn)
+
+    def clear(self):
+        """Entfernt alle Einträge."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM pages")
+            conn.execute("DELETE FROM documents")
+            conn.execute("COMMIT")
+
+    def _touch(self, conn: sqlite3.Connection, pdf_hash: str, extractor: str):
+        conn.execute(
+            "UPDATE documents SET last_access = ? WHERE pdf_hash = ? AND extractor = ?",
+            (time.time(), pdf_hash, extractor),
+        )
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT total_size FROM meta").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, keep: tuple):
+        """Entfernt die am längsten nicht genutzten Dokumente bis `max_bytes` eingehalten ist."""
+        total = self._total_size(conn)
+        if total <= self.max_bytes:
+            return
+
+        candidates = conn.execute(
+            """
+            SELECT d.pdf_hash, d.extractor, COALESCE(SUM(p.size), 0)
+            FROM documents d
+            LEFT JOIN pages p ON p.pdf_hash = d.pdf_hash AND p.extractor = d.extractor
+            GROUP BY d.pdf_hash, d.extractor
+            ORDER BY d.last_access
+            """
+        ).fetchall()
+
+        for pdf_hash, extractor, size in candidates:
+            if total <= self.max_bytes:
+                break
+            if (pdf_hash, extractor) == keep:
+                continue
+            conn.execute(
+                "DELETE FROM pages WHERE pdf_hash = ? AND extractor = ?",
+                (pdf_hash, extractor),
+            )
+            conn.execute(
+                "DELETE FROM documents WHERE pdf_hash = ? AND extractor = ?",
+                (pdf_hash, extractor),
+            )
+            total -= size
@@ -0,0 +1,231 @@
+# Dependencies
+import os
+import re
+import time
+
+from rich import print
+from rich.table import Table
+
+# Const. Vars
+# Methoden von `re.Pattern`, die über die Registry aufgerufen werden können
+METHODS = ("search", "match", "fullmatch", "findall", "finditer", "split", "sub")
+
+# Statistik beim Import einschalten, z.B. SCOUTER_REGEX_STATS=1 python src/scouter.py
+ENV_STATS = "SCOUTER_REGEX_STATS"
+
+
+# Classes
+class PatternStats:
+    """Aufrufe, Treffer und kumulierte Laufzeit eines Patterns."""
+
+    __slots__ = ("calls", "hits", "seconds")
+
+    def __init__(self, calls: int = 0, hits: int = 0, seconds: float = 0.0):
+        self.calls = calls
+        self.hits = hits
+        self.seconds = seconds
+
+    @property
+    def misses(self) -> int:
+        return self.calls - self.hits
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "hits": self.hits, "seconds": self.seconds}
+
+
+def _is_hit(method: str, result) -> bool:
+    if method == "split":
+        return len(result) > 1
+    if method == "findall":
+        return bool(result)
+    return result is not None
+
+
+def _timed_iteration(iterator, stats: PatternStats):
+    hit = False
+    while True:
+        started = time.perf_counter()
+        match = next(iterator, None)
+        stats.seconds += time.perf_counter() - started
+        if match is None:
+            return
+        if not hit:
+            hit = True
+            stats.hits += 1
+        yield match
+
+
+class RegisteredPattern:
+    """
+    Vorkompiliertes Pattern aus der `PatternRegistry`.
+
+    Bietet dieselben Methoden wie `re.Pattern` (`search`, `match`, `sub`, ...).
+    Ohne Statistik sind das direkt die Methoden des kompilierten Patterns, es
+    entsteht also kein Overhead. Mit Statistik werden sie durch Wrapper
+    ersetzt, die Aufrufe, Treffer und Laufzeit mitschreiben.
+    """
+
+    __slots__ = ("name", "compiled", "stats", *METHODS)
+
+    def __init__(self, name: str, compiled: re.Pattern):
+        self.name = name
+        self.compiled = compiled
+        self.stats = PatternStats()
+        self.instrument(False)
+
+    @property
+    def pattern(self) -> str:
+        return self.compiled.pattern
+
+    def instrument(self, enabled: bool):
+        for method in METHODS:
+            if enabled:
+                wrapper = self._timed(method)
+            else:
+                wrapper = getattr(self.compiled, method)
+            setattr(self, method, wrapper)
+
+    def _timed(self, method: str):
+        stats = self.stats
+
+        if method == "finditer":
+            finditer = self.compiled.finditer
+
+            # Die Arbeit passiert beim Iterieren, daher wird jeder Schritt gemessen
+            def timed_finditer(*args, **kwargs):
+                stats.calls += 1
+                started = time.perf_counter()
+                iterator = finditer(*args, **kwargs)
+                stats.seconds += time.perf_counter() - started
+                return _timed_iteration(iterator, stats)
+
+            return timed_finditer
+
+        if method == "sub":
+            subn = self.compiled.subn
+
+            def timed_sub(*args, **kwargs):
+                started = time.perf_counter()
+                result, count = subn(*args, **kwargs)
+                stats.seconds += time.perf_counter() - started
+                stats.calls += 1
+                stats.hits += count > 0
+                return result
+
+            return timed_sub
+
+        function = getattr(self.compiled, method)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            stats.seconds += time.perf_counter() - started
+            stats.calls += 1
+            stats.hits += _is_hit(method, result)
+            return result
+
+        return timed
+
+    def __repr__(self) -> str:
+        return f"RegisteredPattern({self.name!r}, {self.pattern!r})"
+
+
+class PatternRegistry:
+    """
+    Zentrale Registry aller vorkompilierten Regex-Patterns.
+
+    Patterns werden einmal beim Import registriert und kompiliert. Mit
+    `enable_stats` wird für jedes Pattern mitgezählt, wie oft es aufgerufen
+    wurde, wie oft es getroffen hat und wie viel Zeit es gekostet hat.
+    """
+
+    def __init__(self):
+        self._patterns = {}
+        self.stats_enabled = False
+
+    def register(self, name: str, pattern: str, flags: int = 0) -> RegisteredPattern:
+        if name in self._patterns:
+            raise ValueError(f"Pattern bereits registriert: {name}")
+        registered = RegisteredPattern(name, re.compile(pattern, flags))
+        registered.instrument(self.stats_enabled)
+        self._patterns[name] = registered
+        return registered
+
+    def __getitem__(self, name: str) -> RegisteredPattern:
+        return self._patterns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._patterns
+
+    def __iter__(self):
+        return iter(self._patterns.values())
+
+    def enable_stats(self):
+        self.stats_enabled = True
+        for registered in self:
+            registered.instrument(True)
+
+    def disable_stats(self):
+        self.stats_enabled = False
+        for registered in self:
+            registered.instrument(False)
+
+    def reset_stats(self):
+        for registered in self:
+            stats = registered.stats
+            stats.calls, stats.hits, stats.seconds = 0, 0, 0.0
+
+    def stats(self) -> dict:
+        """Statistik aller aufgerufenen Patterns als JSON-serialisierbares Dictionary."""
+        return {
+            registered.name: registered.stats.to_dict()
+            for registered in self
+            if registered.stats.calls
+        }
+
+    @staticmethod
+    def merge_stats(*snapshots: dict) -> dict:
+        """Fasst Statistiken mehrerer Läufe (z.B. aus Worker-Prozessen) zusammen."""
+        merged = {}
+        for snapshot in snapshots:
+            for name, values in snapshot.items():
+                total = merged.setdefault(name, {"calls": 0, "hits": 0, "seconds": 0.0})
+                for key in total:
+                    total[key] += values[key]
+        return merged
+
+    def print_stats(self, stats: dict | None = None):
+        """Gibt die Statistik absteigend nach Laufzeit als Tabelle aus."""
+        if stats is None:
+            stats = self.stats()
+        total_seconds = sum(values["seconds"] for values in stats.values()) or 1.0
+
+        table = Table(title="Regex-Statistik")
+        table.add_column("Pattern")
+        table.add_column("Aufrufe", justify="right")
+        table.add_column("Treffer", justify="right")
+        table.add_column("Kein Treffer", justify="right")
+        table.add_column("Trefferquote", justify="right")
+        table.add_column("Zeit (ms)", justify="right")
+        table.add_column("Anteil", justify="right")
+
+        ordered = sorted(
+            stats.items(), key=lambda item: item[1]["seconds"], reverse=True
+        )
+        for name, values in ordered:
+            calls, hits = values["calls"], values["hits"]
+            table.add_row(
+                name,
+                str(calls),
+                str(hits),
+                str(calls - hits),
+                f"{hits / calls:.0%}" if calls else "-",
+                f"{values['seconds'] * 1000:.2f}",
+                f"{values['seconds'] / total_seconds:.0%}",
+            )
+        print(table)
+
+
+REGISTRY = PatternRegistry()
+if os.environ.get(ENV_STATS, "").lower() in ("1", "true", "yes"):
+    REGISTRY.enable_stats()
@@ -1,35 +1,91 @@
 # Dependencies
+from concurrent.futures import ProcessPoolExecutor
 import functools
 import json
-import logging
+import os
 import re
 
 
 from pydantic import BaseModel, field_validator, ValidationError
-import PyPDF2
 from rich import print
 
-from models.PlayEvent import GameEvent
+from backends import DEFAULT_BACKEND, get_backend
+from lexer import (
+    PARTICIPATION as TOKEN_PARTICIPATION,
+    PLAY,
+    QUARTER,
+    RE_SPLIT_QUARTER,
+    SEGMENT,
+    SUMMARY as TOKEN_SUMMARY,
+    iter_plays,
+    tokenize,
+)
+from models.PlayEvent import validate_events
+from page_cache import PageCache, hash_pdf
+from patterns import REGISTRY
+from sections import (
+    DEFENSE,
+    DRIVE_SUMMARY,
+    INDIVIDUAL_STATS,
+    MARKER_PARTICIPATION,
+    PARTICIPATION,
+    PLAY_BY_PLAY,
+    SECTIONS,
+    SUMMARY,
+    TEAM_STATS,
+    SectionSplitter,
+    index_sections,
+)
+from tracing import TRACER, init_worker
 
 # Const. Vars
 PATH_PDF = "data/raw/stats_pwss2402.pdf"
 PATH_JSON = "data/interim/stats_pwss2402.json"
+PATH_PAGE_CACHE = "data/cache/pages.sqlite"
 CALL_COUNTS = {}
+PAGES_PER_WORKER = 4  # Seiten pro Worker bei paralleler Extraktion
 
 ## Patterns
-PATTERN_SPLIT_DRIVE = r"Spot:\s+\w+\s+Clock:\s+\d{2}:\d{2}\s+Drive:\s+"
-PATTERN_SPLIT_QUARTER = r"Play-by-Play Summary \([1-5] Quarter\)"
-PATTERN_SUMMARY = (
-    r"\s*Plays\s+\d+\s+Yards\s+[-]?\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
+PATTERN_DRIVE_START = (
+    r"^[A-Za-z\s]+(Spot:\s+\w+\s+Clock:\s+\d{2}:\d{2}\s+Drive:\s+\d+)\s*"
 )
+PATTERN_STR_PLAY = r"(?<=\s)([A-Z]{2,3})(?=\s)\s*([^@]*)?\s*(@\s*[A-Z]+\d+)\s*(.*?)(?=\s+[A-Z]{2,3}\s|$)"
 
-# Logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-file_handler = logging.FileHandler(f"{__name__}.log")
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+## Kompilierte Patterns (siehe patterns.REGISTRY)
+RE_DRIVE_START = REGISTRY.register("drive_start", PATTERN_DRIVE_START)
+RE_DRIVE_FIRST_PLAY = REGISTRY.register(
+    "drive_first_play", r"^[^A-Z]*([A-Z]{2}\s*\d+&\d+)"
+)
+RE_REPEATED_TEAM = REGISTRY.register("repeated_team", r"(\b[A-Z]{2}\b)(?=\s+\1)")
+RE_STR_PLAY = REGISTRY.register("str_play", PATTERN_STR_PLAY)
+RE_FOOTBALL_PLAY = REGISTRY.register(
+    "football_play",
+    r"""
+        ([A-Z]{2})\n         # Zwei Großbuchstaben gefolgt von einer neuen Zeile
+        (.+?&)\n          # Ein beliebiger String mit '&', dann neue Zeile
+        (@.+?)\n        # Ein String, der mit '@' beginnt, dann neue Zeile
+        ((?:.+\n)+?)  # Mehrere Zeilen bis zur nächsten Übereinstimmung
+        (?=[A-Z]{2}\n|$)  # Stopp bei zwei Großbuchstaben oder Ende des Textes
+    """,
+    re.VERBOSE,
+)
+RE_LOG_DOWN_DISTANCE = REGISTRY.register("log_down_distance", r"^\d+&\d+$")
+RE_LOG_TEAM = REGISTRY.register("log_team", r"^\s*([A-Z]{2})$")
+RE_TRAILING_TEAM = REGISTRY.register("trailing_team", r"\s+[A-Z]{2}$")
+RE_QUARTER_NUMBER = REGISTRY.register("quarter_number", r"\((\d+)\s+Quarter\)")
+RE_INTEGER = REGISTRY.register("integer", r"[-+]?\d+")
+RE_DECIMAL = REGISTRY.register("decimal", r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+## Überschriften innerhalb der Seiten
+PAGE_ONE_SECTIONS = SectionSplitter(
+    "page_one",
+    ["Score by Quarters", "Scoring Plays", "Field\nGoals", "Officials", "Weather\n"],
+)
+PAGE_THREE_SECTIONS = SectionSplitter(
+    "page_three", [("Passing", 2), ("Rushing", 2), ("Receiving", 2)]
+)
+PAGE_FOUR_SECTIONS = SectionSplitter("page_four", [("Defense", 2)])
+PAGE_FIVE_SECTIONS = SectionSplitter("page_five", [("How Given", 2)])
 
 
 # Funcs
@@ -58,15 +114,153 @@ def _is_letter_dominant(string: str) -> bool:
 #######################################################
 
 
-def extract_text_from_pdf(pdf_path):
-    with open(pdf_path, "rb") as file:
-        reader = PyPDF2.PdfReader(file)
-        text_per_page = []
-        for page in reader.pages:
-            text_per_page.append(page.extract_text())
+def _read_pdf(source) -> bytes:
+    """Liest eine PDF-Quelle (Pfad oder Bytes) vollständig als Bytes ein."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    with open(source, "rb") as file:
+        return file.read()
+
+
+def _extract_page_range(source, start: int, stop: int, backend: str) -> list:
+    """Extrahiert die Seiten [start, stop) – öffnet die PDF dafür genau einmal."""
+    return get_backend(backend).extract_pages(_read_pdf(source), start, stop)
+
+
+def _page_ranges(num_pages: int, pages_per_worker: int) -> list:
+    """Teilt die Seiten in zusammenhängende Blöcke [start, stop) auf."""
+    return [
+        (start, min(start + pages_per_worker, num_pages))
+        for start in range(0, num_pages, pages_per_worker)
+    ]
+
+
+def extract_text_from_pdf(
+    pdf_path,
+    parallel: bool = False,
+    pages_per_worker: int = PAGES_PER_WORKER,
+    max_workers: int | None = None,
+    cache: PageCache | None = None,
+    backend: str = DEFAULT_BACKEND,
+):
+    """
+    Extrahiert den Text aller Seiten einer PDF-Datei.
+
+    Im parallelen Modus werden die Seiten in Blöcke zu je `pages_per_worker`
+    Seiten aufgeteilt und auf einen Prozess-Pool verteilt. Jeder Worker öffnet
+    die Datei einmal und extrahiert seinen Block; die Reihenfolge der Seiten
+    bleibt erhalten.
+
+    :param pdf_path: Pfad zur PDF-Datei oder deren Inhalt als Bytes
+    :param parallel: Seiten im Prozess-Pool extrahieren (Default: False)
+    :param pages_per_worker: Anzahl Seiten pro Worker-Aufgabe
+    :param max_workers: Maximale Anzahl Prozesse (Default: Anzahl CPUs)
+    :param cache: Optionaler persistenter Seiten-Cache; bei einem Treffer
+        entfällt die Extraktion komplett
+    :param backend: Name des Extraktions-Backends (siehe `backends.BACKENDS`)
+    :return: Liste mit dem Text pro Seite
+    """
+    extractor = get_backend(backend)
+
+    if cache is not None:
+        pdf_path = _read_pdf(pdf_path)
+        pdf_hash = hash_pdf(pdf_path)
+        text_per_page = cache.get_pages(pdf_hash, extractor.version)
+        if text_per_page is None:
+            text_per_page = extract_text_from_pdf(
+                pdf_path, parallel, pages_per_worker, max_workers, backend=backend
+            )
+            cache.put_pages(pdf_hash, extractor.version, text_per_page)
+        return text_per_page
+
+    if not parallel:
+        return extractor.extract_pages(_read_pdf(pdf_path))
+
+    num_pages = len(extractor.open(_read_pdf(pdf_path)))
+    ranges = _page_ranges(num_pages, max(1, pages_per_worker))
+    max_workers = min(max_workers or os.cpu_count() or 1, len(ranges) or 1)
+
+    text_per_page = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(TRACER.worker_config(),),
+    ) as executor:
+        # map liefert die Ergebnisse in der Reihenfolge der Blöcke
+        chunks = executor.map(
+            _extract_page_range,
+            [pdf_path] * len(ranges),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges],
+            [backend] * len(ranges),
+        )
+        for chunk in chunks:
+            text_per_page.extend(chunk)
     return text_per_page
 
 
+class LazyPages:
+    """
+    Seitenquelle, die den Text einer Seite erst beim ersten Zugriff extrahiert.
+
+    Verhält sich wie eine Liste von Seitentexten (Index, Slice, `len`, Iteration),
+    extrahiert aber nur die Seiten, auf die tatsächlich zugegriffen wird, und
+    cached deren Text. Wer nur Seite 0 (Scoreboard, Metadaten) braucht, bezahlt
+    nicht für das Play-by-Play.
+
+    :param source: Pfad zur PDF-Datei oder deren Inhalt als Bytes
+    :param cache: Optionaler persistenter Seiten-Cache, der vor der
+        Extraktion einer Seite befragt und danach befüllt wird
+    :param backend: Name des Extraktions-Backends (siehe `backends.BACKENDS`)
+    """
+
+    def __init__(
+        self, source, cache: PageCache | None = None, backend: str = DEFAULT_BACKEND
+    ):
+        source = _read_pdf(source)
+        self._extractor = get_backend(backend)
+        self._document = self._extractor.open(source)
+        self._texts = {}
+        self._cache = cache
+        self._pdf_hash = hash_pdf(source) if cache is not None else None
+
+    def __len__(self) -> int:
+        return len(self._document)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("page index out of range")
+
+        if index not in self._texts:
+            self._texts[index] = self._load(index)
+        return self._texts[index]
+
+    def _load(self, index: int) -> str:
+        if self._cache is None:
+            return self._document.page_text(index)
+
+        version = self._extractor.version
+        text = self._cache.get_page(self._pdf_hash, version, index)
+        if text is None:
+            text = self._document.page_text(index)
+            self._cache.put_page(self._pdf_hash, version, index, text, len(self))
+        return text
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def extracted(self) -> list:
+        """Indizes der bereits extrahierten Seiten."""
+        return sorted(self._texts)
+
+
 def save_dict_to_json(data: dict, file_path: str, indent: int = 4):
     """
     Speichert ein Python-Dictionary als JSON-Datei.
@@ -116,98 +310,39 @@ def remove_drive_start_info(drive: str) -> str:
     """
 
     # Regular Expression zum Finden der ersten drei Key-Value-Paare und deren Werte
-    pattern = r"^[A-Za-z\s]+(Spot:\s+\w+\s+Clock:\s+\d{2}:\d{2}\s+Drive:\s+\d+)\s*"
-    match = re.match(pattern, drive)
+    match = RE_DRIVE_START.match(drive)
 
     if match:
         # Entfernen der erkannten Teile
         cleaned_string = drive[match.end() :].strip()
         # Sicherstellen, dass der String mit zwei Großbuchstaben und einer Zahl&Zahl beginnt
         cleaned_string = cleaned_string.lstrip()
-        cleaned_string = re.sub(r"^[^A-Z]*([A-Z]{2}\s*\d+&\d+)", r"\1", cleaned_string)
+        cleaned_string = RE_DRIVE_FIRST_PLAY.sub(r"\1", cleaned_string)
         return cleaned_string
     return drive.strip()
 
 
-def remove_drive_summary(drive: str) -> str:
-    """
-    Entfernt die Zusammenfassungsinformationen aus dem Drive-String.
-
-    Diese Funktion sucht nach einem vordefinierten Muster, das die
-    Zusammenfassungsinformationen wie "Plays", "Yards", "TOP",
-    und "SCORE" enthält, und entfernt diese aus dem gegebenen
-    Drive-String.
-
-    Parameters
-    ----------
-    drive : str
-        Der Input-Drive-String, der die Zusammenfassungsinformationen enthält,
-        die entfernt werden sollen.
-
-    Returns
-    -------
-    str
-        Der bereinigte Drive-String ohne die Zusammenfassungsinformationen.
-
-    Notes
-    -----
-    Diese Funktion erwartet, dass der Drive-String ein spezifisches Format
-    hat, das die Zusammenfassungsinformationen in der beschriebenen Weise
-    enthält.
-    """
-
-    # Regular Expression zum Finden der Summary und deren Werte
-    pattern = r"\s*Plays\s+\d+\s+Yards\s+\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
-    cleaned_string = re.sub(pattern, "", drive)
-    return cleaned_string.strip()
-
-
-def drive_summary_not_in_string(input_string: str) -> bool:
-    """
-    Überprüft, ob das definierte Muster im gegebenen String vorhanden ist.
-
-    :param input_string: Der zu überprüfende String
-    :return: True, wenn das Muster gefunden wird, sonst False
-    """
-    return bool(re.search(PATTERN_SUMMARY, input_string))
-
-
-def extract_plays_count(text):
-    PATTERN_SUMMARY = (
-        r"\s*Plays\s+(\d+)\s+Yards\s+[-]?\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
-    )
-    match = re.search(PATTERN_SUMMARY, text)
-    if match:
-        return int(match.group(1))
-    return None
+def drive_event_fields(input_string: str) -> list:
+    """Felder von `GameEvent` für jedes Play eines Drive-Strings, noch unvalidiert."""
+    # Entferne wiederholte Großbuchstaben (z.B. "VV VV" -> "VV")
+    input_string = RE_REPEATED_TEAM.sub("", input_string).strip()
+
+    return [
+        {
+            "possession": match[0],
+            "downanddistance": match[1].strip() if match[1] else "",
+            "yardline": match[2],
+            "details": match[3].strip(),
+        }
+        for match in RE_STR_PLAY.findall(input_string)
+    ]
 
 
 def parse_from_str_to_drive(input_string: str):
-    # Entferne wiederholte Großbuchstaben (z.B. "VV VV" -> "VV")
-    input_string = re.sub(r"(\b[A-Z]{2}\b)(?=\s+\1)", "", input_string).strip()
-
-    # Definiere das Muster für die Analyse
-    pattern = r"(?<=\s)([A-Z]{2,3})(?=\s)\s*([^@]*)?\s*(@\s*[A-Z]+\d+)\s*(.*?)(?=\s+[A-Z]{2,3}\s|$)"
-
-    matches = re.findall(pattern, input_string)
-
-    results = []
-    for match in matches:
-        possession = match[0]
-        down_and_distance = match[1].strip() if match[1] else ""
-        yardline = match[2]
-        details = match[3].strip()
-
-        # Erstelle das Pydantic-Modell mit Validierung
-        result = GameEvent(
-            possession=possession,
-            downanddistance=down_and_distance,
-            yardline=yardline,
-            details=details,
-        )
-        results.append(result.dump_model())
-
-    return results
+    # Alle Plays des Drives in einem Aufruf validieren (siehe validate_events);
+    # ungültige Plays werden gesammelt als ValidationError gemeldet
+    events = validate_events(drive_event_fields(input_string))
+    return [event.dump_model() for event in events]
 
 
 def parse_officials(officials_string):
@@ -392,18 +527,7 @@ def parse_football_plays(text: str):
     :param text: Der Eingabetext als String
     :return: Liste von extrahierten Abschnitten
     """
-    pattern = re.compile(
-        r"""
-        ([A-Z]{2})\n         # Zwei Großbuchstaben gefolgt von einer neuen Zeile
-        (.+?&)\n          # Ein beliebiger String mit '&', dann neue Zeile
-        (@.+?)\n        # Ein String, der mit '@' beginnt, dann neue Zeile
-        ((?:.+\n)+?)  # Mehrere Zeilen bis zur nächsten Übereinstimmung
-        (?=[A-Z]{2}\n|$)  # Stopp bei zwei Großbuchstaben oder Ende des Textes
-    """,
-        re.VERBOSE,
-    )
-
-    matches = pattern.findall(text)
+    matches = RE_FOOTBALL_PLAY.findall(text)
 
     result = ["\n".join(match) for match in matches]
     return result
@@ -412,10 +536,9 @@ def parse_football_plays(text: str):
 def process_game_log(log_list):
     processed = []
     temp_group = {}
-    pattern = re.compile(r"^\d+&\d+$")  # Muster für Down & Distance (z. B. 1&10)
-    team_pattern = re.compile(
-        r"^\s*([A-Z]{2})$"
-    )  # Erkennung von zweistelligen Team-Codes mit optionalem Leerzeichen davor
+    pattern = RE_LOG_DOWN_DISTANCE  # Muster für Down & Distance (z. B. 1&10)
+    # Zweistellige Team-Codes mit optionalem Leerzeichen davor
+    team_pattern = RE_LOG_TEAM
 
     i = 0
     while i < len(log_list):
@@ -441,8 +564,8 @@ def process_game_log(log_list):
 
         # Falls Spielbeschreibung kommt (oder weitere aneinanderhängende), hinzufügen
         elif "Details" in temp_group or len(temp_group) >= 3:
-            clean_entry = re.sub(
-                r"\s+[A-Z]{2}$", "", entry
+            clean_entry = RE_TRAILING_TEAM.sub(
+                "", entry
             )  # Entferne nachgestellte Team-Kürzel
             temp_group["Details"] = (
                 temp_group.get("Details", "") + " " + clean_entry
@@ -478,8 +601,25 @@ def parse_drives(drive: str) -> list:
     return game_logs
 
 
+def _to_numeric(column: list) -> list:
+    """
+    Wandelt eine Spalte in int bzw. float, falls alle Werte Ganz- bzw.
+    Dezimalzahlen sind; sonst unverändert. Nur Ziffern, damit Namen wie "Nan"
+    oder "Inf" nicht als float gelesen werden.
+    """
+    for pattern, convert in ((RE_INTEGER, int), (RE_DECIMAL, float)):
+        if all(pattern.fullmatch(value) for value in column):
+            return [convert(value) for value in column]
+    return column
+
+
 def parse_table_data(
-    string: str, no_columns: int, keys: list | None = None, offset: int | None = None
+    string: str,
+    no_columns: int,
+    keys: list | None = None,
+    offset: int | None = None,
+    columnar: bool = False,
+    numeric: bool = False,
 ):
     """
     Parses a string containing tabular data into a list of dictionaries.
@@ -494,14 +634,23 @@ def parse_table_data(
         A list of column headers to use as dictionary keys. If None, the first `offset` rows are used.
     offset : int, optional
         The number of initial rows to use as keys. Defaults to `num_columns` if not provided.
+    columnar : bool, optional
+        Return a dictionary of column -> list of values instead of one dictionary per row.
+        It can be passed straight to `pd.DataFrame` and yields the same frame as the
+        row format. An incomplete last row is dropped in both formats.
+    numeric : bool, optional
+        Only with `columnar`: convert columns in which every value is a number to int or float.
 
     Returns
     -------
-    list of dict
-        A list of dictionaries representing the parsed table data, where each dictionary corresponds to a row.
+    list of dict or dict of list
+        A list of dictionaries representing the parsed table data, where each dictionary corresponds to a row,
+        or with `columnar` a dictionary mapping each column header to its values.
     """
+    # Tracing (siehe tracing.TRACER): Größe und Laufzeit statt der Rohdaten
+    started = TRACER.start() if TRACER.enabled else None
+
     data = ("Index\n" + string.strip()).split("\n")
-    logger.info(data)
     if offset is None:
         offset = no_columns
 
@@ -510,6 +659,26 @@ def parse_table_data(
 
     values = data[offset:]
 
+    if columnar:
+        # Jede Spalte ist ein Slice mit Schrittweite no_columns; bei doppelten
+        # Überschriften gewinnt wie im Zeilenformat die letzte Spalte
+        stop = len(values) // no_columns * no_columns
+        columns = {}
+        for pointer in range(min(no_columns, len(values))):
+            column = values[pointer:stop:no_columns]
+            columns[str(keys[pointer])] = _to_numeric(column) if numeric else column
+        if started is not None:
+            TRACER.record(
+                "parse_table_data",
+                started,
+                chars=len(string),
+                values=len(values),
+                columns=no_columns,
+                rows=len(values) // no_columns,
+                columnar=True,
+            )
+        return columns
+
     records = []
     current_record = {}
 
@@ -520,6 +689,16 @@ def parse_table_data(
         if pointer == no_columns - 1:
             records.append(current_record)
             current_record = {}
+    if started is not None:
+        TRACER.record(
+            "parse_table_data",
+            started,
+            chars=len(string),
+            values=len(values),
+            columns=no_columns,
+            rows=len(records),
+            columnar=False,
+        )
     return records
 
 
@@ -528,18 +707,25 @@ def parse_table_data(
 #######################################################
 
 
-def parse_page_one(page_one: str, doc: dict) -> dict:
-    meta, rest = page_one.split("Score by Quarters")
-    score_quarters, rest = rest.split("Scoring Plays")
-    scoring_plays, rest = rest.split("Field\nGoals")
-    field_goals, rest = rest.split("Officials")
-    officials, weather = rest.split("Weather\n")
+def parse_page_one(page_one: str, doc: dict, columnar: bool = False) -> dict:
+    (
+        meta,
+        score_quarters,
+        scoring_plays,
+        field_goals,
+        officials,
+        weather,
+    ) = map(str, PAGE_ONE_SECTIONS.split(page_one))
 
     doc["meta"] = _parse_metadata(meta, weather)
     doc["score_board"] = parse_scoreboard(score_quarters)
     doc["officials"] = parse_officials(officials)
-    doc["touchdowns"] = parse_table_data(scoring_plays.split("Team")[1], 6)
-    doc["field_goals"] = parse_table_data(field_goals.split("Team")[1], 6)
+    doc["touchdowns"] = parse_table_data(
+        scoring_plays.split("Team")[1], 6, columnar=columnar
+    )
+    doc["field_goals"] = parse_table_data(
+        field_goals.split("Team")[1], 6, columnar=columnar
+    )
     return doc
 
 
@@ -549,10 +735,16 @@ def parse_page_two(page_two: str, doc: dict) -> dict:
     return doc
 
 
-def parse_page_three(page_three: str, doc: dict) -> dict:
-    _, passing_visitors, rest = page_three.split("Passing")
-    passing_home, rushing_visitors, rest = rest.split("Rushing")
-    rushing_home, receiving_visitors, receiving_home = rest.split("Receiving")
+def parse_page_three(page_three: str, doc: dict, columnar: bool = False) -> dict:
+    _, *tables = PAGE_THREE_SECTIONS.split(page_three)
+    (
+        passing_visitors,
+        passing_home,
+        rushing_visitors,
+        rushing_home,
+        receiving_visitors,
+        receiving_home,
+    ) = map(str, tables)
 
     doc["individual_stats"] = {
         "passing": {},
@@ -561,33 +753,45 @@ def parse_page_three(page_three: str, doc: dict) -> dict:
     }
 
     doc["individual_stats"]["passing"]["visitors"] = parse_table_data(
-        passing_visitors, 10
+        passing_visitors, 10, columnar=columnar, numeric=columnar
+    )
+    doc["individual_stats"]["passing"]["home"] = parse_table_data(
+        passing_home, 10, columnar=columnar, numeric=columnar
     )
-    doc["individual_stats"]["passing"]["home"] = parse_table_data(passing_home, 10)
 
     doc["individual_stats"]["rushing"]["visitors"] = parse_table_data(
-        rushing_visitors, 6
+        rushing_visitors, 6, columnar=columnar, numeric=columnar
+    )
+    doc["individual_stats"]["rushing"]["home"] = parse_table_data(
+        rushing_home, 6, columnar=columnar, numeric=columnar
     )
-    doc["individual_stats"]["rushing"]["home"] = parse_table_data(rushing_home, 6)
 
     doc["individual_stats"]["receiving"]["visitors"] = parse_table_data(
-        receiving_visitors, 6
+        receiving_visitors, 6, columnar=columnar, numeric=columnar
+    )
+    doc["individual_stats"]["receiving"]["home"] = parse_table_data(
+        receiving_home, 6, columnar=columnar, numeric=columnar
     )
-    doc["individual_stats"]["receiving"]["home"] = parse_table_data(receiving_home, 6)
     return doc
 
 
-def parse_page_four(page_four: str, doc: dict) -> dict:
-    _, visitors, home = page_four.split("Defense")
+def parse_page_four(page_four: str, doc: dict, columnar: bool = False) -> dict:
+    _, *tables = PAGE_FOUR_SECTIONS.split(page_four)
+    visitors, home = map(str, tables)
 
     doc["defense_stats"] = {"visitors": {}, "home": {}}
-    doc["defense_stats"]["visitors"] = parse_table_data(visitors, 13)
-    doc["defense_stats"]["home"] = parse_table_data(home, 13)
+    doc["defense_stats"]["visitors"] = parse_table_data(
+        visitors, 13, columnar=columnar, numeric=columnar
+    )
+    doc["defense_stats"]["home"] = parse_table_data(
+        home, 13, columnar=columnar, numeric=columnar
+    )
     return doc
 
 
-def parse_page_five(page_five: str, doc: dict) -> dict:
-    _, home, visitors = page_five.split("How Given")
+def parse_page_five(page_five: str, doc: dict, columnar: bool = False) -> dict:
+    _, *tables = PAGE_FIVE_SECTIONS.split(page_five)
+    home, visitors = map(str, tables)
     keys = [
         "index",
         "Start QTR",
@@ -605,10 +809,10 @@ def parse_page_five(page_five: str, doc: dict) -> dict:
 
     doc["drives"] = {"visitors": {}, "home": {}}
     doc["drives"]["visitors"] = parse_table_data(
-        string=visitors, no_columns=12, offset=11, keys=keys
+        string=visitors, no_columns=12, offset=11, keys=keys, columnar=columnar
     )
     doc["drives"]["home"] = parse_table_data(
-        string=home, no_columns=12, offset=11, keys=keys
+        string=home, no_columns=12, offset=11, keys=keys, columnar=columnar
     )
 
     return doc
@@ -626,62 +830,55 @@ def merge_lists(list1, list2):
     return merged
 
 
-def extract_entries(text, drive_no, quarter):
-    pattern_drive_summary = (
-        r"\s*Plays\s+\d+\s+Yards\s+-?\d+\s+TOP\s+\d{2}:\d{2}\s+SCORE\s*[\d-]*"
-    )
-    pattern_part_team = r"([A-Za-z]{2,3})"
-    pattern_part_down_distance = r"([0-9]{1,2}&[0-9]{1,2})?"
-    pattern_part_yardline = r"(@\s*[A-Za-z]+\d+)"
-    pattern_part_details = r"([^@]*)?"
-    pattern_part_lookahead = (
-        r"(?=\s+[A-Za-z]{2,3}\s|$|(?=.{0,29}$)|(?={pattern_drive_summary}))"
-    )
-
-    pattern_play = rf"(?<=\s){pattern_part_team}\s*{pattern_part_down_distance}\s*{pattern_part_yardline}\s*{pattern_part_details}\s*{pattern_part_lookahead}"
-
-    entries = []
+def play_entry(groups: tuple, drive_no, quarter) -> dict:
+    """Play-Dictionary aus den Gruppen (Team, Down&Distance, YardLine, Details) eines Treffers."""
+    index, down_distance, yardline, details = groups
+    return {
+        "Quarter": quarter,
+        "Series": drive_no,
+        "Index": index,
+        "Down&Distance": down_distance.strip() if down_distance else "",
+        "YardLine": yardline,
+        "Details": details.strip().replace("\n", " "),
+    }
 
-    for match in re.finditer(pattern_play, text, re.DOTALL):
-        match_text = (
-            match.group().strip()
-        )  # Entfernt führende und nachfolgende Leerzeichen
 
-        if not match_text:
-            continue
+def extract_entries(text, drive_no, quarter):
+    return [play_entry(groups, drive_no, quarter) for _, _, groups in iter_plays(text)]
 
-        entry = {
-            "Quarter": quarter,
-            "Series": drive_no,
-            "Index": match.group(1),
-            "Down&Distance": match.group(2).strip() if match.group(2) else "",
-            "YardLine": match.group(3),
-            "Details": match.group(4).strip().replace("\n", " "),
-        }
-        entries.append(entry)
 
-    return entries
+def is_valid_entry(entry) -> bool:
+    """Zählt der Play für die Summary? Kein No-Play, kein Timeout, mit Down&Distance."""
+    details = entry.get("Details", "").lower()
+    return bool(
+        "no-play" not in details
+        and entry.get("Down&Distance", "")
+        and "timeout" not in details
+    )
 
 
 def count_valid_entries(entries):
-    count = 0
-    for entry in entries:
-        details = entry.get("Details", "")
-        down_distance = entry.get("Down&Distance", "")
+    return sum(is_valid_entry(entry) for entry in entries)
 
-        if (
-            "no-play" not in details.lower()
-            and down_distance
-            and "timeout" not in details.lower()
-        ):
-            count += 1
 
-    return count
+def integrity_report(drives: dict) -> dict:
+    """
+    Fasst die Integrität der Drives für `doc["integrity"]` zusammen.
+
+    :param drives: "Drive NN" -> Integrität des Drives (siehe `iter_drives`)
+    :return: Dictionary mit `mismatch` (mindestens ein Drive weicht ab),
+        `mismatched_drives` und `drives`
+    """
+    mismatched = [key for key, drive in drives.items() if drive["mismatch"]]
+    return {
+        "mismatch": bool(mismatched),
+        "mismatched_drives": mismatched,
+        "drives": drives,
+    }
 
 
 def extract_number(text):
-    pattern = r"\((\d+)\s+Quarter\)"
-    match = re.search(pattern, text)
+    match = RE_QUARTER_NUMBER.search(text)
 
     if match:
         return match.group(1)  # Gibt die gefundene Zahl zurück
@@ -707,103 +904,406 @@ def get_drive_number(drive_index, quarter_no, drive, previous_drive_no):
     return drive_no
 
 
-def parse_last_pages(pages: str, doc: dict) -> dict:
-    last_sections = "\n".join(pages).split("Participation Report")
-    participation_report_is_in = len(last_sections) == 3
+def parse_participation(
+    home_pr: str, visitors_pr: str, doc: dict, columnar: bool = False
+) -> dict:
+    doc["participation"] = {"visitors": {}, "home": {}}
+
+    adj_home_pr_starter_string = "Last Name\nPosition\n#" + (home_pr.split("#")[1])
+    adj_home_pr_bench_string = "Last Name\nPosition\n#" + (home_pr.split("#")[2])
+
+    doc["participation"]["home"]["starter"] = parse_table_data(
+        adj_home_pr_starter_string, 4, columnar=columnar
+    )
+    doc["participation"]["home"]["bench"] = parse_table_data(
+        adj_home_pr_bench_string, 4, columnar=columnar
+    )
+
+    adj_visitors_pr_starter_string = "Last Name\nPosition\n#" + (
+        visitors_pr.split("#")[1]
+    )
+    adj_visitors_pr_bench_string = "Last Name\nPosition\n#" + (
+        visitors_pr.split("#")[2]
+    )
+    doc["participation"]["visitors"]["starter"] = parse_table_data(
+        adj_visitors_pr_starter_string, 4, columnar=columnar
+    )
+    doc["participation"]["visitors"]["bench"] = parse_table_data(
+        adj_visitors_pr_bench_string, 4, columnar=columnar
+    )
+    return doc
+
 
-    if participation_report_is_in:
-        doc["participation"] = {"visitors": {}, "home": {}}
+def split_quarters(drives: str) -> list:
+    """Teilt das Play-by-Play in Quarter auf (Text vor dem ersten Quarter entfällt)."""
+    return RE_SPLIT_QUARTER.split(drives)[1:]
 
-        drives, home_pr, visitors_pr = last_sections
 
-        adj_home_pr_starter_string = "Last Name\nPosition\n#" + (home_pr.split("#")[1])
-        adj_home_pr_bench_string = "Last Name\nPosition\n#" + (home_pr.split("#")[2])
+def build_segments(tokens, text: str, quarter_no: int | None = None):
+    """
+    Setzt aus dem Token-Strom von `lexer.tokenize` die Drive-Segmente zusammen.
+
+    Ein Segment ist ein Teil-Drive zwischen zwei Drive-Headern. Die einzige
+    Abhängigkeit zum vorherigen Quarter – die Drive-Nummer des ersten Segments
+    in Quarter 2 und 4, falls sie nicht im Text steht – bleibt als
+    `drive_no = None` offen und wird erst in `stitch_drives` aufgelöst.
+
+    :param tokens: Token des Play-by-Play
+    :param text: Text, auf den sich die Offsets der Token beziehen
+    :param quarter_no: Nummer des Quarters, falls der Text bereits darin
+        beginnt (`tokenize(..., in_quarter=True)`); sonst wird über die
+        Quarter-Überschriften gezählt
+    :return: Generator über die Segment-Listen je Quarter. Ein Segment hat
+        `drive_no`, `plays`, `summary`, `complete`, `documented_plays` und
+        `valid_plays` (Plays, die für die Summary zählen)
+    """
+    segments = None if quarter_no is None else []
+    quarter_no = quarter_no or 0
+    segment = None
+
+    for token in tokens:
+        kind = token.kind
+        if kind == PLAY:
+            entry = play_entry(token.value, segment["drive_no"], quarter_no)
+            segment["plays"].append(entry)
+            segment["valid_plays"] += is_valid_entry(entry)
+        elif kind == SEGMENT:
+            head = text[token.start : min(token.start + 2, token.end)]
+            segment = {
+                "drive_no": get_drive_number(len(segments), quarter_no, head, None),
+                "plays": [],
+                "summary": False,
+                # Ohne Summary (und ohne Kickoff) geht der Drive im nächsten Segment weiter
+                "complete": "kickoff" in token.value,
+                "documented_plays": None,
+                "valid_plays": 0,
+            }
+            segments.append(segment)
+        elif kind == TOKEN_SUMMARY:
+            segment["summary"] = True
+            segment["complete"] = True
+            segment["documented_plays"] = token.value
+        elif kind == QUARTER:
+            if segments is not None:
+                yield segments
+            segments = []
+            quarter_no += 1
+
+    if segments is not None:
+        yield segments
+
+
+def parse_quarter(quarter_no: int, quarter_str: str) -> list:
+    """
+    Parst ein Quarter in Drive-Segmente, unabhängig von den anderen Quartern.
 
-        doc["participation"]["home"]["starter"] = parse_table_data(
-            adj_home_pr_starter_string, 4
-        )
-        doc["participation"]["home"]["bench"] = parse_table_data(
-            adj_home_pr_bench_string, 4
-        )
+    :param quarter_str: Text eines Quarters aus `split_quarters`
+    :return: Liste der Segmente (siehe `build_segments`)
+    """
+    tokens = tokenize(quarter_str, in_quarter=True, participation=False)
+    return next(build_segments(tokens, quarter_str, quarter_no))
 
-        adj_visitors_pr_starter_string = "Last Name\nPosition\n#" + (
-            visitors_pr.split("#")[1]
-        )
-        adj_visitors_pr_bench_string = "Last Name\nPosition\n#" + (
-            visitors_pr.split("#")[2]
-        )
-        doc["participation"]["visitors"]["starter"] = parse_table_data(
-            adj_visitors_pr_starter_string, 4
-        )
-        doc["participation"]["visitors"]["bench"] = parse_table_data(
-            adj_visitors_pr_bench_string, 4
-        )
-    else:
-        drives = last_sections[0]
 
-    quarter_list = re.split(PATTERN_SPLIT_QUARTER, drives)
-    doc["drives"] = {}
+def iter_drives(quarters, integrity: dict | None = None):
+    """
+    Setzt die Segmente aller Quarter sequentiell zu Drives zusammen.
+
+    Löst offene Drive-Nummern über den vorherigen Drive auf und hängt Segmente
+    ohne Summary an den folgenden Drive an. Jeder Drive wird geliefert, sobald
+    er vollständig ist; `quarters` darf daher auch ein Generator sein. Die
+    Segmente selbst werden nicht verändert, so dass sie (z.B. für
+    inkrementelles Parsen) wiederverwendbar sind.
+
+    :param quarters: Ergebnisse von `parse_quarter` in Quarter-Reihenfolge
+    :param integrity: Optionales Dictionary, in das pro Drive die Anzahl der
+        laut Summary dokumentierten (`documented_plays`, None ohne Summary)
+        und der geparsten gültigen Plays (`parsed_plays`) sowie `mismatch`
+        eingetragen werden
+    :return: Generator über `("Drive NN", plays)`
+    """
     previous_drive_no = None  # Variable - vorherige Drive-Nummer speichern
 
     cache_plays = None
     cache_drive_no = None
-    for quarter_no, quarter_str in enumerate(quarter_list[1:], start=1):
-        drive_list = re.split(PATTERN_SPLIT_DRIVE, quarter_str)
-
-        for drive_index, drive in enumerate(drive_list):
-            drive_no = get_drive_number(
-                drive_index, quarter_no, drive, previous_drive_no
-            )
+    cache_valid_plays = 0
+    for segments in quarters:
+        for segment in segments:
+            drive_no = segment["drive_no"]
+            plays = segment["plays"]
+            parsed_plays = segment["valid_plays"]
+            if drive_no is None:
+                drive_no = previous_drive_no
+                plays = [{**play, "Series": drive_no} for play in plays]
 
             print(f"Drive: {drive_no}".center(79, "-"))
-            print(f"check for summary: {drive_summary_not_in_string(drive)}")
-            summary_in_drive = drive_summary_not_in_string(drive)
-            drive = drive.split("Plays")[0]
-            plays = extract_entries(drive, quarter=quarter_no, drive_no=drive_no)
-            if not summary_in_drive:
-                if "kickoff" not in drive:
-                    cache_plays = plays
-                    cache_drive_no = drive_no
-                    continue
-            documented_plays = extract_plays_count(drive)
-            drive = drive.split("Plays")[0]
+            print(f"check for summary: {segment['summary']}")
+            if not segment["complete"]:
+                cache_plays = plays
+                cache_drive_no = drive_no
+                cache_valid_plays = parsed_plays
+                continue
 
             if cache_plays is not None:
-                cache_plays.extend(plays)
-                plays = cache_plays
+                plays = [*cache_plays, *plays]
                 drive_no = cache_drive_no
+                parsed_plays += cache_valid_plays
                 cache_plays = None
             previous_drive_no = drive_no
 
             print(plays)
 
+            documented_plays = segment["documented_plays"]
             print(f"{documented_plays =}")
-            print(f"{count_valid_entries(plays) =}")
-            doc["drives"][f"Drive {str(drive_no).zfill(2)}"] = plays
+            print(f"{parsed_plays =}")
+            key = f"Drive {str(drive_no).zfill(2)}"
+            if integrity is not None:
+                integrity[key] = {
+                    "documented_plays": documented_plays,
+                    "parsed_plays": parsed_plays,
+                    "mismatch": documented_plays is not None
+                    and documented_plays != parsed_plays,
+                }
+            yield key, plays
+
+
+def stitch_drives(quarters, integrity: dict | None = None) -> dict:
+    """
+    Wie `iter_drives`, sammelt die Drives aber in einem Dictionary.
+
+    :return: Dictionary "Drive NN" -> Liste der Plays
+    """
+    drives = {}
+    for key, plays in iter_drives(quarters, integrity):
+        drives[key] = plays
+    return drives
+
+
+def iter_quarters(drives: str):
+    """Generator über die Segmente jedes Quarters, in einem Durchlauf über den Text."""
+    return build_segments(tokenize(drives, participation=False), drives)
+
 
+def parse_quarters(drives: str, max_workers: int | None = None) -> list:
+    """
+    Parst die Quarter des Play-by-Play parallel im Prozess-Pool.
+
+    Erste Phase des zweiphasigen Parsens: jedes Quarter wird in einem eigenen
+    Worker tokenisiert und in Segmente zerlegt (`parse_quarter`). Die
+    Abhängigkeiten zwischen den Quartern (Drive-Nummern, über die
+    Quarter-Grenze laufende Drives) löst danach `stitch_drives` sequentiell
+    auf. Lohnt sich erst bei langen Texten, da jeder Worker erst gestartet
+    werden muss.
+
+    :param drives: Play-by-Play-Text
+    :param max_workers: Maximale Anzahl Prozesse (Default: Anzahl CPUs)
+    :return: Segment-Listen je Quarter, wie von `iter_quarters`
+    """
+    quarters = split_quarters(drives)
+    if not quarters:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(quarters))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(TRACER.worker_config(),),
+    ) as executor:
+        # map liefert die Ergebnisse in der Reihenfolge der Quarter
+        return list(executor.map(parse_quarter, range(1, len(quarters) + 1), quarters))
+
+
+def parse_play_by_play(
+    drives: str, doc: dict, parallel: bool = False, max_workers: int | None = None
+) -> dict:
+    """
+    Parst das Play-by-Play nach `doc["drives"]`.
+
+    :param parallel: Quarter im Prozess-Pool parsen (siehe `parse_quarters`);
+        das Ergebnis ist identisch
+    :param max_workers: Maximale Anzahl Prozesse im parallelen Modus
+    """
+    if parallel:
+        quarters = parse_quarters(drives, max_workers)
+    else:
+        quarters = iter_quarters(drives)
+    integrity = {}
+    doc["drives"] = stitch_drives(quarters, integrity)
+    doc["integrity"] = integrity_report(integrity)
     return doc
 
 
-def main():
-    pages = extract_text_from_pdf(PATH_PDF)
+def parse_last_pages(
+    pages: str, doc: dict, parallel: bool = False, max_workers: int | None = None
+) -> dict:
+    text = "\n".join(pages)
 
-    doc = {}
+    if parallel:
+        # Das Play-by-Play endet an der ersten Report-Überschrift, genau wie
+        # in `tokenize`; danach folgen die Reports
+        drives, marker, report = text.partition(MARKER_PARTICIPATION)
+        report_parts = report.split(MARKER_PARTICIPATION) if marker else []
+        if len(report_parts) == 2:
+            doc = parse_participation(*report_parts, doc)
+        return parse_play_by_play(drives, doc, parallel, max_workers)
 
-    parsers = [
-        parse_page_one,
-        parse_page_two,
-        parse_page_three,
-        parse_page_four,
-        parse_page_five,
+    tokens = list(tokenize(text))
+
+    report_parts = [
+        token.value for token in tokens if token.kind == TOKEN_PARTICIPATION
     ]
+    if len(report_parts) == 2:
+        doc = parse_participation(*report_parts, doc)
+
+    integrity = {}
+    doc["drives"] = stitch_drives(build_segments(tokens, text), integrity)
+    doc["integrity"] = integrity_report(integrity)
+    return doc
+
+
+def play_by_play_text(pages, index: dict) -> str:
+    """Text des Play-by-Play bis zum Beginn des Participation Reports."""
+    play_by_play = index[PLAY_BY_PLAY]
+    participation = index.get(PARTICIPATION)
+    stop = play_by_play.stop
+    if participation:
+        stop = min(stop, participation.start)
+    drive_pages = pages[play_by_play.start : stop]
+
+    if participation:
+        # Der Report kann auf der letzten Play-by-Play-Seite beginnen
+        drive_pages.append(
+            pages[participation.start].partition(MARKER_PARTICIPATION)[0]
+        )
+    return "\n".join(drive_pages)
 
-    # Parse the first five pages using corresponding functions
-    for i, parser in enumerate(parsers):
-        doc = parser(pages[i], doc)
 
-    # Parse the remaining pages
-    doc = parse_last_pages(pages[5:], doc)
+def participation_report_parts(pages, index: dict) -> list:
+    """Text der Participation Reports, aufgeteilt an den Überschriften (Home, Visitors)."""
+    participation = index.get(PARTICIPATION)
+    if not participation:
+        return []
 
+    tail = pages[participation.start].partition(MARKER_PARTICIPATION)[2]
+    report = "\n".join([tail, *pages[participation.start + 1 : participation.stop]])
+    return report.split(MARKER_PARTICIPATION)
+
+
+SECTION_PARSERS = {
+    SUMMARY: parse_page_one,
+    TEAM_STATS: parse_page_two,
+    INDIVIDUAL_STATS: parse_page_three,
+    DEFENSE: parse_page_four,
+    DRIVE_SUMMARY: parse_page_five,
+}
+# Parser mit Tabellen aus parse_table_data; nur sie bekommen `columnar`
+COLUMNAR_PARSERS = {parse_page_one, parse_page_three, parse_page_four, parse_page_five}
+
+
+def parse_gamebook(
+    pages, sections=None, columnar: bool = False, parallel: bool = False
+) -> dict:
+    """
+    Parst die Seiten eines Gamebooks in ein Dictionary.
+
+    Die Seiten werden über `index_sections` den Abschnitten zugeordnet, statt
+    eine feste Seitenreihenfolge anzunehmen. Mit `sections` lassen sich
+    Abschnitte überspringen; bei `LazyPages` werden deren Seiten dann gar
+    nicht erst extrahiert.
+
+    :param pages: Text pro Seite (Liste oder `LazyPages`)
+    :param sections: Zu parsende Abschnitte (Default: alle, siehe `sections.SECTIONS`)
+    :param columnar: Tabellen spaltenweise statt als Liste von Zeilen (siehe
+        `parse_table_data`), z.B. für `pd.DataFrame`; für den JSON-Export `False`
+    :param parallel: Quarter des Play-by-Play im Prozess-Pool parsen (siehe `parse_quarters`)
+    :return: Dictionary mit allen extrahierten Abschnitten
+    """
+    if sections is None:
+        sections = SECTIONS
+    needed = [name for name in SECTIONS if name in sections]
+    if not needed:
+        return {}
+
+    index = index_sections(pages, stop_after=needed[-1])
+    doc = {}
+
+    for name, parser in SECTION_PARSERS.items():
+        if name in needed:
+            page_range = index[name]
+            options = {"columnar": columnar} if parser in COLUMNAR_PARSERS else {}
+            doc = parser(
+                "\n".join(pages[page_range.start : page_range.stop]), doc, **options
+            )
+
+    if PARTICIPATION in needed:
+        report_parts = participation_report_parts(pages, index)
+        if len(report_parts) == 2:
+            doc = parse_participation(*report_parts, doc, columnar=columnar)
+
+    if PLAY_BY_PLAY in needed:
+        doc = parse_play_by_play(play_by_play_text(pages, index), doc, parallel)
+
+    return doc
+
+
+def iter_gamebook(pages, sections=None):
+    """
+    Parst ein Gamebook wie `parse_gamebook`, liefert das Ergebnis aber
+    stückweise, sobald es vorliegt.
+
+    Jeder Eintrag ist ein Paar `(path, value)`: `path` ist der Schlüsselpfad im
+    Dokument, z.B. `("meta",)` für einen Abschnitt oder `("drives", "Drive 03")`
+    für einen einzelnen Drive des Play-by-Play. Wer die Einträge direkt in eine
+    Datei schreibt (siehe `streaming.JsonLinesSink`), hält nie das ganze
+    Dokument im Speicher; `streaming.assemble_doc` baut es bei Bedarf wieder auf.
+
+    :param pages: Text pro Seite (Liste oder `LazyPages`)
+    :param sections: Zu parsende Abschnitte (Default: alle, siehe `sections.SECTIONS`)
+    :return: Generator über `(path, value)`
+    """
+    if sections is None:
+        sections = SECTIONS
+    needed = [name for name in SECTIONS if name in sections]
+    if not needed:
+        return
+
+    index = index_sections(pages, stop_after=needed[-1])
+
+    for name, parser in SECTION_PARSERS.items():
+        if name in needed:
+            page_range = index[name]
+            part = parser("\n".join(pages[page_range.start : page_range.stop]), {})
+            if PLAY_BY_PLAY in needed:
+                # Wird wie in parse_gamebook vom Play-by-Play ersetzt
+                part.pop("drives", None)
+            for key, value in part.items():
+                yield (key,), value
+
+    # Reihenfolge der Schlüssel wie in parse_gamebook: Drives, Participation
+    # Report, Integrität
+    if PLAY_BY_PLAY in needed:
+        quarters = iter_quarters(play_by_play_text(pages, index))
+        integrity = {}
+        empty = True
+        for key, plays in iter_drives(quarters, integrity):
+            empty = False
+            yield ("drives", key), plays
+        if empty:
+            yield ("drives",), {}
+
+    if PARTICIPATION in needed:
+        report_parts = participation_report_parts(pages, index)
+        if len(report_parts) == 2:
+            part = parse_participation(*report_parts, {})
+            for key, value in part.items():
+                yield (key,), value
+
+    if PLAY_BY_PLAY in needed:
+        yield ("integrity",), integrity_report(integrity)
+
+
+def main():
+    pages = LazyPages(PATH_PDF, cache=PageCache(PATH_PAGE_CACHE))
+    doc = parse_gamebook(pages)
     save_dict_to_json(doc, PATH_JSON)
 
 
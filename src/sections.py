@@ -0,0 +1,180 @@
+# Dependencies
+import re
+
+from patterns import REGISTRY
+
+# Const. Vars
+SUMMARY = "summary"
+TEAM_STATS = "team_stats"
+INDIVIDUAL_STATS = "individual_stats"
+DEFENSE = "defense"
+DRIVE_SUMMARY = "drive_summary"
+PLAY_BY_PLAY = "play_by_play"
+PARTICIPATION = "participation"
+
+MARKER_PARTICIPATION = "Participation Report"
+
+# Abschnitte in Dokumentreihenfolge mit der Überschrift, an der sie erkannt
+# werden. Die Teamstatistik hat keine eindeutige Überschrift und umfasst die
+# Seiten zwischen Summary und Einzelstatistik.
+SECTION_MARKERS = [
+    (SUMMARY, "Score by Quarters"),
+    (TEAM_STATS, None),
+    (INDIVIDUAL_STATS, "Passing"),
+    (DEFENSE, "Defense"),
+    (DRIVE_SUMMARY, "How Given"),
+    (PLAY_BY_PLAY, "Play-by-Play Summary"),
+    (PARTICIPATION, MARKER_PARTICIPATION),
+]
+SECTIONS = [name for name, _ in SECTION_MARKERS]
+
+
+# Funcs
+def index_sections(pages, stop_after: str | None = None) -> dict:
+    """
+    Ordnet jedem Abschnitt des Gamebooks seinen Seitenbereich zu.
+
+    Die Seiten werden einmal in Dokumentreihenfolge durchlaufen; eine Seite
+    beginnt den nächsten noch nicht gefundenen Abschnitt, dessen Überschrift
+    sie enthält, und ggf. weitere, deren Überschriften danach folgen (z.B.
+    Play-by-Play und Participation Report auf einer Seite). Abschnitte können
+    so nur vorwärts erkannt werden, z.B. zählt ein "Passing" auf der
+    Teamstatistik-Seite nicht als Einzelstatistik.
+    Fehlt eine Überschrift, wird die klassische Position (Seite 0-4, danach
+    Play-by-Play) angenommen.
+
+    Parameters
+    ----------
+    pages : Sequence[str]
+        Text pro Seite, z.B. eine Liste oder `LazyPages`.
+    stop_after : str, optional
+        Letzter benötigter Abschnitt. Der Scan endet, sobald dessen Ende
+        feststeht, so dass bei `LazyPages` spätere Seiten nicht extrahiert werden.
+
+    Returns
+    -------
+    dict
+        Abschnittsname -> `range` der Seiten; Abschnitte, die auf derselben
+        Seite beginnen, enthalten diese beide. `participation` fehlt, wenn das
+        Gamebook keinen Participation Report enthält.
+    """
+    starts = {}
+    position = 0  # Index in SECTION_MARKERS des nächsten gesuchten Abschnitts
+    last_needed = SECTIONS.index(stop_after) if stop_after else len(SECTIONS) - 1
+
+    for page_no in range(len(pages)):
+        if position > last_needed + 1:
+            break
+
+        text = pages[page_no]
+        offset = 0  # weitere Abschnitte nur hinter der letzten Überschrift
+        for marker_index in range(position, len(SECTION_MARKERS)):
+            name, marker = SECTION_MARKERS[marker_index]
+            if marker is None:
+                continue
+            found = text.find(marker, offset)
+            if found == -1:
+                continue
+            # Die Teamstatistik belegt mindestens eine Seite
+            if name == INDIVIDUAL_STATS and page_no < starts.get(SUMMARY, 0) + 2:
+                continue
+            starts[name] = page_no
+            position = marker_index + 1
+            offset = found + len(marker)
+
+    # Fallback auf die klassische Position
+    previous = -1
+    for name in SECTIONS:
+        if name == PARTICIPATION:
+            break
+        if name not in starts:
+            starts[name] = previous + 1
+        previous = starts[name]
+
+    # Abschnitt reicht bis zum Beginn des nächsten gefundenen Abschnitts
+    ordered = sorted(starts.items(), key=lambda item: SECTIONS.index(item[0]))
+    index = {}
+    for i, (name, start) in enumerate(ordered):
+        stop = ordered[i + 1][1] if i + 1 < len(ordered) else len(pages)
+        # Beginnt der nächste Abschnitt auf derselben Seite, gehört sie beiden
+        if stop == start < len(pages):
+            stop += 1
+        index[name] = range(start, max(start, stop))
+    return index
+
+
+# Classes
+class SectionView:
+    """
+    Ausschnitt `[start, end)` eines Texts, ohne ihn zu kopieren.
+
+    Erst `str(view)` erzeugt den Teilstring; so wird jeder Abschnitt nur
+    einmal kopiert, statt bei jedem `split` den ganzen Rest zu kopieren.
+    """
+
+    __slots__ = ("text", "start", "end")
+
+    def __init__(self, text: str, start: int = 0, end: int | None = None):
+        self.text = text
+        self.start = start
+        self.end = len(text) if end is None else end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __str__(self) -> str:
+        return self.text[self.start : self.end]
+
+    def __repr__(self) -> str:
+        return f"SectionView({self.start}, {self.end})"
+
+
+class SectionSplitter:
+    """
+    Teilt einen Text an einer festen Folge von Überschriften, in einem Durchlauf.
+
+    Entspricht der Kette `a, rest = text.split(d1)`, `b, rest = rest.split(d2)`,
+    ...: Jede Überschrift muss nach der vorherigen genau `count` mal vorkommen,
+    sonst wird wie beim Entpacken ein `ValueError` geworfen. Alle Überschriften
+    werden mit einem gemeinsamen, in der Registry vorkompilierten Pattern
+    gesucht; sie dürfen sich daher nicht gegenseitig überlappen.
+
+    :param name: Name des Patterns in `patterns.REGISTRY`
+    :param delimiters: Überschriften in Textreihenfolge, jeweils als String
+        (genau ein Vorkommen) oder `(string, count)`
+    """
+
+    def __init__(self, name: str, delimiters: list):
+        self.delimiters = [
+            (delimiter, 1) if isinstance(delimiter, str) else tuple(delimiter)
+            for delimiter in delimiters
+        ]
+        alternatives = dict.fromkeys(delimiter for delimiter, _ in self.delimiters)
+        self.pattern = REGISTRY.register(
+            f"sections_{name}", "|".join(map(re.escape, alternatives))
+        )
+
+    def split(self, text: str, start: int = 0, end: int | None = None) -> list:
+        """
+        :return: `1 + sum(count)` SectionViews auf `text`
+        """
+        if end is None:
+            end = len(text)
+
+        positions = {delimiter: [] for delimiter, _ in self.delimiters}
+        for match in self.pattern.finditer(text, start, end):
+            positions[match.group()].append(match.start())
+
+        parts = []
+        part_start = start
+        for delimiter, count in self.delimiters:
+            found = [
+                position for position in positions[delimiter] if position >= part_start
+            ]
+            if len(found) != count:
+                raise ValueError(f"{delimiter!r}: {len(found)} statt {count} Vorkommen")
+            for position in found:
+                parts.append(SectionView(text, part_start, position))
+                part_start = position + len(delimiter)
+        parts.append(SectionView(text, part_start, end))
+        return parts
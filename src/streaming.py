@@ -0,0 +1,78 @@
+# Dependencies
+import json
+
+from scouter import iter_gamebook
+
+
+# Classes
+class JsonLinesSink:
+    """
+    Schreibt die Einträge von `iter_gamebook` als JSON Lines.
+
+    Jede Zeile enthält einen Eintrag `{"path": [...], "value": ...}` und wird
+    sofort geschrieben, d.h. ein Drive ist nach dem Schreiben nicht mehr im
+    Speicher. Verwendbar als Context Manager.
+
+    :param path: Zieldatei (`.jsonl`)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, path: tuple, value):
+        record = {"path": list(path), "value": value}
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+        self.records += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Funcs
+def stream_gamebook(pages, sink, sections=None) -> int:
+    """
+    Parst ein Gamebook und übergibt jeden Abschnitt und jeden Drive direkt an `sink`.
+
+    :param pages: Text pro Seite (Liste oder `LazyPages`)
+    :param sink: Objekt mit `write(path, value)`, z.B. `JsonLinesSink`
+    :param sections: Zu parsende Abschnitte (Default: alle)
+    :return: Anzahl geschriebener Einträge
+    """
+    count = 0
+    for path, value in iter_gamebook(pages, sections):
+        sink.write(path, value)
+        count += 1
+    return count
+
+
+def read_jsonl(path: str):
+    """Generator über die `(path, value)`-Einträge einer mit `JsonLinesSink` geschriebenen Datei."""
+    with open(path, encoding="utf-8") as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                record = json.loads(line)
+                yield tuple(record["path"]), record["value"]
+
+
+def assemble_doc(records) -> dict:
+    """
+    Setzt `(path, value)`-Einträge wieder zu einem Dokument zusammen.
+
+    Das Ergebnis entspricht `parse_gamebook` für dieselben Seiten.
+    """
+    doc = {}
+    for path, value in records:
+        target = doc
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+    return doc
@@ -0,0 +1,194 @@
+# Dependencies
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import random
+import time
+
+# Const. Vars
+# Tracing beim Import einschalten, z.B. SCOUTER_TRACE=DEBUG python src/scouter.py
+ENV_LEVEL = "SCOUTER_TRACE"
+ENV_SAMPLE = "SCOUTER_TRACE_SAMPLE"  # Anteil der aufgezeichneten Aufrufe, 0.0 - 1.0
+ENV_PATH = "SCOUTER_TRACE_FILE"
+DEFAULT_PATH = "scouter.trace.jsonl"
+# Werte wie bei SCOUTER_REGEX_STATS=1: alles aufzeichnen bzw. aus
+TRUTHY = ("1", "true", "yes", "on")
+FALSY = ("0", "false", "no", "off")
+
+
+# Classes
+class JsonFormatter(logging.Formatter):
+    """Eine Zeile JSON pro Ereignis."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": record.created,
+            "level": record.levelname,
+            "pid": record.process,
+            "event": record.msg,
+        }
+        entry.update(record.fields)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class Tracer:
+    """
+    Strukturiertes Tracing für Hot Paths.
+
+    Ohne Tracing prüft der Aufrufer nur das Attribut `enabled`, es entsteht
+    also kein weiterer Aufwand. Mit Tracing werden pro Aufruf Größen und
+    Laufzeit als JSON-Zeile aufgezeichnet; geschrieben wird in einem eigenen
+    Thread (`QueueListener`), der Aufrufer legt den Eintrag nur in eine Queue.
+    Die Queue ist eine `multiprocessing.Queue`: Worker eines Prozess-Pools
+    schicken ihre Einträge an den Thread im Hauptprozess, wenn der Pool mit
+    `initializer=init_worker, initargs=(TRACER.worker_config(),)` erzeugt wird.
+
+    Verwendung::
+
+        started = TRACER.start() if TRACER.enabled else None
+        ...
+        if started is not None:
+            TRACER.record("parse_table_data", started, rows=len(records))
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.level = logging.DEBUG
+        self.sample_rate = 1.0
+        self._logger = logging.getLogger("scouter.trace")
+        self._logger.propagate = False
+        self._handler = None
+        self._listener = None
+        self._owner = None  # Prozess, in dem der Listener läuft
+
+    def enable(
+        self,
+        level: int | str = logging.DEBUG,
+        sample_rate: float = 1.0,
+        path: str = DEFAULT_PATH,
+        handler: logging.Handler | None = None,
+    ):
+        """
+        Schaltet das Tracing ein.
+
+        :param level: Mindest-Level der aufgezeichneten Ereignisse (z.B. "INFO")
+        :param sample_rate: Anteil der aufgezeichneten Aufrufe (1.0 = alle)
+        :param path: Zieldatei (JSON Lines), wird fortgeschrieben
+        :param handler: Eigener Ziel-Handler statt der Datei
+        """
+        level = parse_level(level)
+        self.disable()
+        if handler is None:
+            handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(JsonFormatter())
+
+        # Mit fork erzeugte Queues lassen sich nicht an spawn-Worker übergeben,
+        # umgekehrt schon
+        records = multiprocessing.get_context("spawn").Queue()
+        self._handler = QueueHandler(records)
+        self._listener = QueueListener(records, handler)
+        self._listener.start()
+        self._owner = os.getpid()
+        self._logger.addHandler(self._handler)
+        self._logger.setLevel(level)
+
+        self.level = level
+        self.sample_rate = sample_rate
+        self.enabled = True
+
+    def disable(self):
+        """Schaltet das Tracing aus und schreibt alle ausstehenden Einträge."""
+        self.enabled = False
+        if self._handler is not None:
+            self._logger.removeHandler(self._handler)
+        # Ein Worker hat nur eine Kopie des Listeners; stoppen würde den des
+        # Hauptprozesses über die gemeinsame Queue beenden
+        if self._listener is not None and self._owner == os.getpid():
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener.queue.close()
+        self._handler, self._listener, self._owner = None, None, None
+
+    def worker_config(self) -> tuple | None:
+        """Einstellungen für `init_worker`, oder None, wenn das Tracing aus ist."""
+        if not self.enabled or self._listener is None:
+            return None
+        return self._listener.queue, self.level, self.sample_rate
+
+    def attach(self, records, level: int, sample_rate: float):
+        """Schreibt Einträge in die Queue des Hauptprozesses (siehe `worker_config`)."""
+        self.disable()
+        self._handler = QueueHandler(records)
+        self._logger.addHandler(self._handler)
+        self._logger.setLevel(level)
+        self.level = level
+        self.sample_rate = sample_rate
+        self.enabled = True
+
+    def start(self, level: int = logging.DEBUG) -> float | None:
+        """
+        Startzeit für `record`, oder None, wenn der Aufruf nicht aufgezeichnet wird.
+
+        Über das Level und die Sampling-Rate wird hier einmal pro Aufruf
+        entschieden, so dass nicht aufgezeichnete Aufrufe auch die Messung sparen.
+        """
+        if not self.enabled or level < self.level:
+            return None
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return time.perf_counter()
+
+    def record(self, event: str, started: float, level: int = logging.DEBUG, **fields):
+        """Zeichnet ein Ereignis mit Laufzeit seit `started` und weiteren Feldern auf."""
+        fields["ms"] = (time.perf_counter() - started) * 1000
+        self._logger.log(level, event, extra={"fields": fields})
+
+
+# Funcs
+def parse_level(level: int | str) -> int:
+    """
+    Level als int, z.B. aus "DEBUG", "info" oder "1" (= DEBUG).
+
+    :raises ValueError: bei unbekannten Namen
+    """
+    if isinstance(level, int):
+        return level
+    name = level.strip().upper()
+    if name.lower() in TRUTHY:
+        return logging.DEBUG
+    value = logging.getLevelName(name)
+    if not isinstance(value, int):
+        raise ValueError(f"Unbekanntes Tracing-Level: {level!r}")
+    return value
+
+
+def init_worker(config: tuple | None):
+    """
+    Initializer für Prozess-Pools: Tracing im Worker wie im Hauptprozess.
+
+    Ohne Initializer gehen die Einträge eines Workers verloren (fork: der
+    Listener-Thread läuft nur im Hauptprozess) bzw. werden nicht aufgezeichnet
+    (spawn: Tracing nur über die Umgebungsvariablen).
+
+    :param config: `TRACER.worker_config()` des Hauptprozesses
+    """
+    if config is not None:
+        TRACER.attach(*config)
+
+
+TRACER = Tracer()
+if os.environ.get(ENV_LEVEL, "").strip().lower() not in ("", *FALSY):
+    try:
+        env_level = parse_level(os.environ[ENV_LEVEL])
+    except ValueError as error:
+        raise ValueError(f"{ENV_LEVEL}: {error}") from None
+    TRACER.enable(
+        env_level,
+        float(os.environ.get(ENV_SAMPLE, 1.0)),
+        os.environ.get(ENV_PATH, DEFAULT_PATH),
+    )
+atexit.register(TRACER.disable)
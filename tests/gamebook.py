@@ -0,0 +1,209 @@
+# Dependencies
+import contextlib
+import io
+import random
+
+# Const. Vars
+# Synthetische Gamebooks für die Tests: gleiche Überschriften und
+# Tabellenformen wie die ELF-Gamebooks, Inhalte zufällig (mit festem Seed).
+TEAMS = [("Rhein Fire", "RF"), ("Vienna Vikings", "VV")]
+NAMES = ["J. Doe", "A. Smith", "B. Miller", "C. Brown", "D. Wilson", "E. Moore"]
+LAST_NAMES = ["Doe", "Smith", "Miller"]
+PLAY_DETAILS = [
+    "{n} rush for {y} yards to the {t}{l}, tackled by {m}.",
+    "{n} pass complete to {m} for {y} yards to the {t}{l}.",
+    "{n} pass incomplete intended for {m}.",
+    "{n} kickoff for {y} yards returned by {m}.",
+    "Timeout {t}.",
+    "{n} punt for {y} yards, fair catch by {m}.",
+    "Penalty on {t}: False Start, no-play.",
+    "{n} rush for {y} yards, TOUCHDOWN. {m} attempts an extra point, is good.",
+    "{n} gets sacked for loss of {y} yards\nat the {t}{l}.",
+]
+
+
+# Funcs
+def quiet():
+    """Unterdrückt die Debug-Ausgaben der Parser (print)."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _table(rows: int, columns: int, rnd: random.Random) -> list:
+    cells = []
+    for _ in range(rows):
+        cells += [
+            str(rnd.randint(0, 99)) if column else rnd.choice(LAST_NAMES)
+            for column in range(columns)
+        ]
+    return cells
+
+
+def _page_one(rnd: random.Random) -> str:
+    visitors, home = TEAMS
+    lines = [
+        "European League of Football",
+        "Date: 01.06.2024",
+        "Stadium: Arena",
+        "Attendance: 1000",
+        "Score by Quarters",
+        *["1", "2", "3", "4", "OT", "Total"],
+        "Visitor",
+        visitors[0],
+        *[str(rnd.randint(0, 14)) for _ in range(6)],
+        "Home",
+        home[0],
+        *[str(rnd.randint(0, 14)) for _ in range(6)],
+        *["Scoring Plays", "Team", "Qtr", "Time", "Play", "Score", "Drive"],
+    ]
+    for _ in range(rnd.randint(0, 4)):
+        lines += [
+            rnd.choice(["RF", "VF"]),
+            str(rnd.randint(1, 4)),
+            "10:00",
+            "J. Doe 5 yd run",
+            "7-0",
+            str(rnd.randint(1, 20)),
+        ]
+    lines += ["Field", "Goals", "Team", "Qtr", "Time", "Kicker", "Dist", "Result"]
+    for _ in range(rnd.randint(0, 2)):
+        lines += ["RF", "2", "05:00", "K. Leg", "35", "good"]
+    lines += [
+        *["Officials", "Referee:", "John Ref", "Umpire:", "Jane Ump"],
+        *["Head of Statistics:", "Weather", "Temp: 20C, Wind: 5 km/h", "Sky: Clear"],
+    ]
+    return "\n".join(lines)
+
+
+def _page_two(rnd: random.Random) -> str:
+    lines = ["Team Statistics"] + [f"hdr{i}" for i in range(7)]
+    for stat in ["FIRST DOWNS", "NET YARDS RUSHING", "Passing yards", "PUNTS"]:
+        lines += [stat, str(rnd.randint(0, 30)), str(rnd.randint(0, 30))]
+    return "\n".join(lines)
+
+
+def _page_three(rnd: random.Random) -> str:
+    parts = ["Individual Statistics"]
+    for name, columns in [("Passing", 10), ("Rushing", 6), ("Receiving", 6)]:
+        for _ in range(2):
+            parts.append(name)
+            parts += [f"c{i}" for i in range(columns - 1)]
+            parts += _table(rnd.randint(1, 3), columns, rnd)
+    return "\n".join(parts)
+
+
+def _page_four(rnd: random.Random) -> str:
+    parts = ["Defensive Statistics"]
+    for _ in range(2):
+        parts.append("Defense")
+        parts += [f"c{i}" for i in range(12)] + _table(rnd.randint(1, 3), 13, rnd)
+    return "\n".join(parts)
+
+
+def _page_five(rnd: random.Random) -> str:
+    parts = ["Drive Chart"]
+    for _ in range(2):
+        parts.append("How Given")
+        parts += ["Up"] + _table(rnd.randint(1, 3), 12, rnd)
+    return "\n".join(parts)
+
+
+def _play(rnd: random.Random, team: str) -> str:
+    details = rnd.choice(PLAY_DETAILS).format(
+        n=rnd.choice(NAMES),
+        m=rnd.choice(NAMES),
+        y=rnd.randint(-5, 60),
+        t=rnd.choice(["RF", "VV"]),
+        l=rnd.randint(1, 50),
+    )
+    down_distance = rnd.choice(["1&10", "2&7", "3&1", "4&12", ""])
+    yardline = rnd.choice(["@ RF", "@ VV", "@RF"]) + str(rnd.randint(1, 50))
+    separator = rnd.choice(["\n", " "])
+    return separator.join(
+        part for part in [team, down_distance, yardline, details] if part
+    )
+
+
+def _summary(rnd: random.Random) -> str:
+    return (
+        f"Plays {rnd.randint(1, 9)} Yards {rnd.randint(-10, 80)} "
+        f"TOP 0{rnd.randint(0, 9)}:{rnd.randint(0, 59):02d} "
+        f"SCORE {rnd.randint(0, 30)}-{rnd.randint(0, 30)}"
+    )
+
+
+def _play_by_play_pages(rnd: random.Random) -> list:
+    chunks = []
+    drive_no = 1
+    for quarter in range(1, rnd.choice([4, 4, 5]) + 1):
+        chunks.append(
+            f"Rhein Fire at Vienna Vikings\nPlay-by-Play Summary ({quarter} Quarter)"
+        )
+        if rnd.random() < 0.6:
+            # Drive aus dem vorherigen Quarter, ohne Drive-Header
+            team = rnd.choice(["RF", "VV"])
+            segment = [_play(rnd, team) for _ in range(rnd.randint(0, 3))]
+            if rnd.random() < 0.7:
+                segment.append(_summary(rnd))
+            chunks.append(f"{drive_no:02d} " + "\n".join(segment))
+        for _ in range(rnd.randint(1, 4)):
+            drive_no += 1
+            team = rnd.choice(["RF", "VV"])
+            header = (
+                f"{team} Drive\nSpot: {team}{rnd.randint(1, 50)} "
+                f"Clock: {rnd.randint(0, 15):02d}:{rnd.randint(0, 59):02d} Drive: "
+            )
+            segment = [_play(rnd, team) for _ in range(rnd.randint(0, 6))]
+            if rnd.random() < 0.75:
+                segment.append(_summary(rnd))
+            chunks.append(f"{header}{drive_no:02d}\n" + "\n".join(segment))
+
+    lines = "\n".join(chunks).split("\n")
+    step = rnd.randint(15, 60)
+    return ["\n".join(lines[i : i + step]) for i in range(0, len(lines), step)]
+
+
+def _participation(rnd: random.Random) -> list:
+    reports = []
+    for side in range(2):
+        rows = []
+        for _ in range(rnd.randint(1, 4)):
+            rows += [
+                rnd.choice(["Jon", "Al"]),
+                rnd.choice(LAST_NAMES),
+                "QB",
+                str(rnd.randint(1, 99)),
+            ]
+        reports.append(
+            f"Participation Report\nTeam {side}\n#\nFirst\nLast\nPos\n"
+            + "\n".join(rows)
+            + "\n#\n"
+            + "\n".join(rows[:8])
+        )
+    return reports
+
+
+def build_gamebook(seed: int, participation: bool = True) -> list:
+    """
+    Text pro Seite eines synthetischen Gamebooks.
+
+    :param seed: Startwert des Zufallsgenerators; gleicher Seed, gleiche Seiten
+    :param participation: Participation Reports anhängen (der erste beginnt
+        je nach Seed auf der letzten Play-by-Play-Seite)
+    """
+    rnd = random.Random(seed)
+    pages = [
+        _page_one(rnd),
+        _page_two(rnd),
+        _page_three(rnd),
+        _page_four(rnd),
+        _page_five(rnd),
+    ]
+    play_by_play = _play_by_play_pages(rnd)
+    if not participation:
+        return pages + play_by_play
+
+    home, visitors = _participation(rnd)
+    if rnd.random() < 0.4:
+        play_by_play[-1] += "\n" + home
+        return pages + play_by_play + [visitors]
+    return pages + play_by_play + [home + "\n" + visitors]
@@ -0,0 +1,146 @@
+# Dependencies
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import app
+
+# Const. Vars
+DETAILS = [
+    "J. Doe pass complete to A. Smith for 7 yards, tackled by B. Miller.",
+    "C. Brown rush left for 3 yards (D. Wilson; E. Moore).",
+    "K. Kick kickoff for 60 yards, returned by J. Doe for 20 yards.",
+    "J. Doe pass intercepted by A. Smith at the RF30.",
+    "Timeout Rhein Fire.",
+    None,
+]
+WRAPPERS = {
+    "Passer": app.add_passer_column,
+    "Rusher": app.add_rusher_column,
+    "Receiver": app.add_receiver_column,
+    "Tackler": app.add_tackler_column,
+    "Kicker": app.add_kicker_column,
+    "Recovered": app.add_recovered_column,
+    "Intercepted": app.add_intercepted_column,
+    "Tackler 2": app.add_tackler2_column,
+    "Returner": app.add_returner_column,
+}
+# Wrapper, die (wie bisher) auf einer Kopie arbeiten
+COPYING = ("Kicker", "Recovered", "Intercepted", "Tackler 2", "Returner")
+
+
+# Classes
+class TestPlayerColumns(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({"Details": DETAILS})
+
+    def test_wrappers_match_all_roles(self):
+        expected = app.add_player_columns(self.df.copy())
+        for role, wrapper in WRAPPERS.items():
+            with self.subTest(role=role):
+                result = wrapper(self.df.copy())
+                self.assertEqual(list(result.columns), ["Details", role])
+                pd.testing.assert_series_equal(result[role], expected[role])
+
+    def test_extract_players_only_requested_roles(self):
+        details = DETAILS[0]
+        everything = dict(zip(app.PLAYER_ROLES, app.extract_players(details)))
+        self.assertEqual(
+            app.extract_players(details, ["Receiver", "Passer"]),
+            [everything["Receiver"], everything["Passer"]],
+        )
+
+    def test_copying_wrappers_leave_input_unchanged(self):
+        for role in COPYING:
+            with self.subTest(role=role):
+                df = self.df.copy()
+                WRAPPERS[role](df)
+                self.assertEqual(list(df.columns), ["Details"])
+
+
+class TestVerifyFumble(unittest.TestCase):
+    def test_fumble_without_change_of_possession(self):
+        df = pd.DataFrame(
+            {
+                "POSS": ["RF", "RF", "RF", "VV", "VV", None, None, "RF"],
+                "RESULT": [
+                    "Fumble",
+                    "Sack, Fumble",
+                    "Complete, Fumble",
+                    "Complete, Fumble",
+                    "Rush",
+                    "Fumble",
+                    "Rush",
+                    "Fumble",
+                ],
+            }
+        )
+        result = app.verify_fumble(df)
+        self.assertEqual(
+            list(result["RESULT"]),
+            [
+                "Rush",
+                "Sack",
+                # Ballbesitzwechsel: Fumble bleibt
+                "Complete, Fumble",
+                "Complete",
+                "Rush",
+                # Kein Team in beiden Plays gilt wie None == None als gleich
+                "Rush",
+                "Rush",
+                # Letzter Play: kein nächster Ballbesitz
+                "Fumble",
+            ],
+        )
+        self.assertEqual(list(result["POSS"]), list(df["POSS"]))
+
+    def test_without_fumbles(self):
+        df = pd.DataFrame({"POSS": ["RF", "RF"], "RESULT": ["Rush", "Complete"]})
+        self.assertEqual(list(app.verify_fumble(df)["RESULT"]), ["Rush", "Complete"])
+
+
+class TestScoreTimeline(unittest.TestCase):
+    def setUp(self):
+        # Index wie nach einem Filter, nicht fortlaufend
+        self.df = pd.DataFrame(
+            {
+                "POSS": ["RF", "RF", "VV", "VV", "RF", "XX", "VV"],
+                "PLAY TYPE": ["Run", "Extra Pt.", "FG", "Pass", "Run", "Run", "Run"],
+                "RESULT": [
+                    "Rush, TD",
+                    "Good",
+                    "Good",
+                    "Complete, TD",
+                    "Safety",
+                    "Rush, TD",
+                    "Rush, TPC",
+                ],
+            },
+            index=[3, 5, 8, 9, 12, 13, 20],
+        )
+
+    def test_points_and_score(self):
+        timeline = app.score_timeline(self.df, "RF", "VV")
+        self.assertEqual(list(timeline.index), list(self.df.index))
+        self.assertEqual(list(timeline["POINTS SCOUT"]), [6, 1, 0, 0, 2, 0, 0])
+        # Punkte von Teams außer den beiden zählen nicht
+        self.assertEqual(list(timeline["POINTS OPP"]), [0, 0, 3, 6, 0, 0, 2])
+        self.assertEqual(list(timeline["SCORE SCOUT"]), [6, 7, 7, 7, 9, 9, 9])
+        self.assertEqual(list(timeline["SCORE OPP"]), [0, 0, 3, 9, 9, 9, 11])
+        self.assertEqual(list(timeline["SCORE DIFF"]), [6, 7, 4, -2, 0, 0, -2])
+
+    def test_add_score_column_reuses_timeline(self):
+        timeline = app.score_timeline(self.df, "VV", "RF")
+        computed = app.add_score_column(self.df.copy(), "VV", "RF")
+        reused = app.add_score_column(self.df.copy(), "VV", "RF", timeline)
+        pd.testing.assert_frame_equal(computed, reused)
+        self.assertEqual(list(computed["SCORE DIFF"]), [-6, -7, -4, 2, 0, 0, 2])
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Dependencies
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook, quiet
+from incremental import parse_gamebook_incremental
+from scouter import parse_gamebook
+from sections import PLAY_BY_PLAY, TEAM_STATS, index_sections
+
+# Const. Vars
+SEEDS = range(8)
+
+
+# Funcs
+def _edit_play_by_play(pages: list) -> list:
+    """Ändert das erste Play der letzten Play-by-Play-Seite."""
+    pages = list(pages)
+    last = index_sections(pages)[PLAY_BY_PLAY].stop - 1
+    pages[last] = pages[last].replace(" yards", " yds", 1).replace("Timeout", "Time")
+    return pages
+
+
+# Classes
+class TestIncremental(unittest.TestCase):
+    """Inkrementelles Parsen liefert dasselbe Dokument wie `parse_gamebook`."""
+
+    def _update(self, old_pages: list, new_pages: list) -> dict:
+        with quiet():
+            doc, manifest = parse_gamebook_incremental(old_pages)
+            # Das Manifest wird als JSON gespeichert
+            manifest = json.loads(json.dumps(manifest))
+            doc, manifest = parse_gamebook_incremental(new_pages, doc, manifest)
+            expected = parse_gamebook(new_pages)
+        self.assertEqual(list(doc), list(expected))
+        self.assertEqual(json.dumps(doc), json.dumps(expected))
+        return manifest
+
+    def test_unchanged(self):
+        for seed in SEEDS:
+            pages = build_gamebook(seed)
+            manifest = self._update(pages, pages)
+            self.assertEqual(manifest["changed"], [])
+            self.assertEqual(manifest["reparsed_quarters"], [])
+
+    def test_team_stats_changed(self):
+        for seed in SEEDS:
+            pages = build_gamebook(seed)
+            new_pages = list(pages)
+            new_pages[1] = new_pages[1].replace("PUNTS", "PUNTS\n99\n99")
+            manifest = self._update(pages, new_pages)
+            self.assertEqual(manifest["changed"], [TEAM_STATS])
+
+    def test_play_by_play_changed(self):
+        for seed in SEEDS:
+            pages = build_gamebook(seed)
+            new_pages = _edit_play_by_play(pages)
+            manifest = self._update(pages, new_pages)
+            if new_pages == pages:
+                continue
+            self.assertEqual(manifest["changed"], [PLAY_BY_PLAY])
+            self.assertLess(
+                len(manifest["reparsed_quarters"]), len(manifest["quarters"])
+            )
+
+    def test_participation_added_and_removed(self):
+        for seed in SEEDS:
+            with_report = build_gamebook(seed)
+            without_report = build_gamebook(seed, participation=False)
+            self._update(without_report, with_report)
+            self._update(with_report, without_report)
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
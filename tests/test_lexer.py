@@ -0,0 +1,55 @@
+# Dependencies
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook
+from lexer import RE_PLAY, iter_plays
+
+# Const. Vars
+# Bausteine für zufällige Drive-Texte, inkl. Leerraum-Folgen und "@" ohne YardLine
+FRAGMENTS = [" RF", " VV", " 1&10", " @VV12", "@ RF3", " @", " ", "\n", "x", "Plays"]
+SAMPLES = [
+    "",
+    " RF 1&10 @VV12 J.Doe pass to M.Roe for 7 yards\n",
+    " RF 1&10 @VV12" + " " * 50 + "abcd @" + "x" * 40,
+    " RF" + " " * 50 + "x" * 40,
+    " RF @VV12 short",
+    " RF 1&10 @VV12 a {pattern_drive_summary} VV 2&3 @RF40 b",
+]
+
+
+# Funcs
+def _regex_plays(text: str) -> list:
+    return [(m.start(), m.end(), m.groups()) for m in RE_PLAY.finditer(text)]
+
+
+# Classes
+class TestIterPlays(unittest.TestCase):
+    """`iter_plays` liefert dieselben Treffer wie `RE_PLAY.finditer`."""
+
+    def assertSamePlays(self, text: str):
+        self.assertEqual(list(iter_plays(text)), _regex_plays(text), repr(text))
+
+    def test_samples(self):
+        for text in SAMPLES:
+            self.assertSamePlays(text)
+
+    def test_gamebooks(self):
+        for seed in range(10):
+            self.assertSamePlays("\n".join(build_gamebook(seed)[5:]))
+
+    def test_random_fragments(self):
+        rnd = random.Random(0)
+        for _ in range(500):
+            self.assertSamePlays(
+                "".join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(1, 30)))
+            )
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Dependencies
+from contextlib import closing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from page_cache import PageCache
+
+# Const. Vars
+EXTRACTOR = "test-1.0"
+PAGE = "x" * 100
+
+
+# Classes
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "pages.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _cached(self, cache: PageCache) -> set:
+        return {
+            pdf_hash
+            for pdf_hash in "abc"
+            if cache.get_pages(pdf_hash, EXTRACTOR) is not None
+        }
+
+    def test_size_follows_inserts_replaces_and_clear(self):
+        cache = PageCache(self.path)
+        cache.put_pages("a", EXTRACTOR, [PAGE, "ä"])
+        self.assertEqual(cache.size(), 102)
+
+        # Ersetzte Seite zählt nur einmal
+        cache.put_page("a", EXTRACTOR, 1, "yy", num_pages=2)
+        self.assertEqual(cache.size(), 102)
+
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_existing_cache_is_counted_on_open(self):
+        PageCache(self.path).put_pages("a", EXTRACTOR, [PAGE, PAGE])
+        # Cache aus einer Version ohne Zähler
+        with closing(sqlite3.connect(self.path, isolation_level=None)) as conn:
+            conn.execute("DROP TABLE meta")
+
+        self.assertEqual(PageCache(self.path).size(), 200)
+        self.assertEqual(PageCache(self.path).size(), 200)
+
+    def test_least_recently_used_document_is_evicted(self):
+        cache = PageCache(self.path, max_bytes=250)
+        cache.put_pages("a", EXTRACTOR, [PAGE])
+        time.sleep(0.01)
+        cache.put_pages("b", EXTRACTOR, [PAGE])
+        time.sleep(0.01)
+        cache.get_pages("a", EXTRACTOR)
+        time.sleep(0.01)
+
+        cache.put_pages("c", EXTRACTOR, [PAGE])
+        self.assertEqual(self._cached(cache), {"a", "c"})
+        self.assertEqual(cache.size(), 200)
+
+    def test_new_document_is_kept(self):
+        cache = PageCache(self.path, max_bytes=150)
+        cache.put_pages("a", EXTRACTOR, [PAGE])
+        cache.put_pages("b", EXTRACTOR, [PAGE, PAGE])
+        self.assertEqual(self._cached(cache), {"b"})
+        self.assertEqual(cache.size(), 200)
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
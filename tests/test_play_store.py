@@ -0,0 +1,68 @@
+# Dependencies
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook, quiet
+from models.Play import KEYS
+from models.PlayStore import PlayStore, SymbolTable
+from scouter import parse_gamebook
+from sections import PLAY_BY_PLAY
+
+# Const. Vars
+SEEDS = range(6)
+SECTIONS = [PLAY_BY_PLAY]
+
+
+# Classes
+class TestSymbolTable(unittest.TestCase):
+    def test_codes_distinguish_types(self):
+        symbols = SymbolTable()
+        codes = [symbols.encode(value) for value in (3, "03", 3, "3", True, 1)]
+        self.assertEqual(codes, [0, 1, 0, 2, 3, 4])
+        self.assertEqual([symbols.decode(code) for code in codes[:2]], [3, "03"])
+        self.assertEqual(len(symbols), 5)
+
+
+class TestPlayStore(unittest.TestCase):
+    """Mehrere Spiele in einem Store; der Export liefert die Eingabe zurück."""
+
+    @classmethod
+    def setUpClass(cls):
+        with quiet():
+            cls.games = {
+                seed: parse_gamebook(build_gamebook(seed), sections=SECTIONS)["drives"]
+                for seed in SEEDS
+            }
+        cls.store = PlayStore()
+        for seed, drives in cls.games.items():
+            cls.store.add(seed, drives)
+
+    def test_drives_round_trip(self):
+        for seed, drives in self.games.items():
+            decoded = self.store.drives(seed)
+            self.assertEqual(list(decoded), list(drives))
+            # json.dumps unterscheidet auch 3 und "03" sowie die Schlüsselreihenfolge
+            self.assertEqual(json.dumps(decoded), json.dumps(drives))
+
+    def test_columns(self):
+        for seed, drives in self.games.items():
+            expected = {"Drive": [], **{key: [] for key in KEYS}}
+            for drive_key, plays in drives.items():
+                for play in plays:
+                    expected["Drive"].append(drive_key)
+                    for key in KEYS:
+                        expected[key].append(play[key])
+            self.assertEqual(self.store.columns(seed), expected)
+
+    def test_len(self):
+        plays = sum(len(p) for drives in self.games.values() for p in drives.values())
+        self.assertEqual(len(self.store), plays)
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
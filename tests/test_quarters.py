@@ -0,0 +1,80 @@
+# Dependencies
+import json
+import os
+import sys
+import unittest
+
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook, quiet
+from models.PlayEvent import MAX_REPORTED_ERRORS, GameEvent, validate_events
+from scouter import iter_quarters, parse_gamebook, parse_quarters
+from sections import PLAY_BY_PLAY, index_sections
+
+# Const. Vars
+SEEDS = range(4)
+EVENT = {
+    "possession": "RF",
+    "downanddistance": "1&10",
+    "yardline": "@ VV12",
+    "details": "J. Doe rush for 3 yards",
+}
+
+
+# Classes
+class TestParallelQuarters(unittest.TestCase):
+    """Die Quarter im Prozess-Pool zu parsen ändert das Ergebnis nicht."""
+
+    def test_segments(self):
+        for seed in SEEDS:
+            pages = build_gamebook(seed, participation=False)
+            text = "\n".join(pages[index_sections(pages)[PLAY_BY_PLAY].start :])
+            with quiet():
+                self.assertEqual(
+                    parse_quarters(text, max_workers=2), list(iter_quarters(text))
+                )
+
+    def test_parse_gamebook(self):
+        for seed in SEEDS:
+            pages = build_gamebook(seed)
+            with quiet():
+                serial = parse_gamebook(pages)
+                parallel = parse_gamebook(pages, parallel=True)
+            self.assertEqual(json.dumps(parallel), json.dumps(serial))
+
+    def test_empty(self):
+        self.assertEqual(parse_quarters(""), [])
+
+
+class TestValidateEvents(unittest.TestCase):
+    def test_valid(self):
+        events = validate_events([EVENT, dict(EVENT, downanddistance="")])
+        self.assertEqual([type(event) for event in events], [GameEvent] * 2)
+        self.assertEqual(events[1].downanddistance, "")
+
+    def test_errors_are_truncated(self):
+        events = [dict(EVENT, possession="rf") for _ in range(MAX_REPORTED_ERRORS + 5)]
+        with self.assertRaises(ValidationError) as context:
+            validate_events(events)
+        errors = context.exception.errors()
+        self.assertEqual(len(errors), MAX_REPORTED_ERRORS)
+        self.assertEqual(
+            [error["loc"] for error in errors],
+            [(index, "possession") for index in range(MAX_REPORTED_ERRORS)],
+        )
+
+    def test_all_errors_of_an_event(self):
+        event = dict(EVENT, downanddistance="first", yardline="VV12")
+        with self.assertRaises(ValidationError) as context:
+            validate_events([EVENT, event], max_errors=5)
+        self.assertEqual(
+            [error["loc"] for error in context.exception.errors()],
+            [(1, "downanddistance"), (1, "yardline")],
+        )
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
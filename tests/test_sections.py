@@ -0,0 +1,61 @@
+# Dependencies
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from scouter import parse_gamebook, participation_report_parts, play_by_play_text
+from sections import PARTICIPATION, PLAY_BY_PLAY, index_sections
+
+# Const. Vars
+# Fünf Platzhalterseiten, danach Play-by-Play und beide Reports auf einer Seite
+STUB_PAGES = ["Score by Quarters", "Team Statistics", "Passing", "Defense", "How Given"]
+PLAY_BY_PLAY_PAGE = (
+    "Rhein Fire at Vienna Vikings\n"
+    "Play-by-Play Summary (1 Quarter)\n"
+    "RF Drive\n"
+    "Spot: RF25 Clock: 15:00 Drive: 01\n"
+    " RF 1&10 @ RF25 J. Doe rush left for 3 yards\n"
+    "Plays 1 Yards 3 TOP 00:30 SCORE 0-0\n"
+)
+REPORT_HOME = (
+    "Participation Report\nHome\n#\nFirst\nLast\nPos\n"
+    "Jon\nDoe\nQB\n12\n#\nAl\nSmith\nRB\n22\n"
+)
+REPORT_VISITORS = (
+    "Participation Report\nVisitors\n#\nFirst\nLast\nPos\n"
+    "Al\nMiller\nQB\n7\n#\nJon\nBrown\nWR\n81\n"
+)
+
+
+# Classes
+class TestReportOnPlayByPlayPage(unittest.TestCase):
+    """Participation Report beginnt auf der (einzigen) Play-by-Play-Seite."""
+
+    def setUp(self):
+        self.pages = STUB_PAGES + [PLAY_BY_PLAY_PAGE + REPORT_HOME + REPORT_VISITORS]
+
+    def test_index_contains_both_sections(self):
+        index = index_sections(self.pages)
+        self.assertEqual(index[PLAY_BY_PLAY], range(5, 6))
+        self.assertEqual(index[PARTICIPATION], range(5, 6))
+
+    def test_texts_are_split_at_the_report(self):
+        index = index_sections(self.pages)
+        self.assertEqual(play_by_play_text(self.pages, index), PLAY_BY_PLAY_PAGE)
+        home, visitors = participation_report_parts(self.pages, index)
+        self.assertIn("Home", home)
+        self.assertIn("Visitors", visitors)
+
+    def test_parse_gamebook_keeps_participation(self):
+        doc = parse_gamebook(self.pages, sections=[PLAY_BY_PLAY, PARTICIPATION])
+        self.assertIn("participation", doc)
+        (plays,) = doc["drives"].values()
+        self.assertEqual(len(plays), 1)
+        self.assertNotIn("Participation", plays[0]["Details"])
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# Dependencies
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook, quiet
+from scouter import iter_gamebook, parse_gamebook
+from streaming import JsonLinesSink, assemble_doc, read_jsonl, stream_gamebook
+
+# Const. Vars
+SEEDS = range(20)
+
+
+# Classes
+class TestAssembleDoc(unittest.TestCase):
+    """`assemble_doc(iter_gamebook(p))` entspricht `parse_gamebook(p)`, inkl. Reihenfolge."""
+
+    def assert_same_doc(self, streamed: dict, parsed: dict):
+        self.assertEqual(list(streamed), list(parsed))
+        self.assertEqual(json.dumps(streamed), json.dumps(parsed))
+
+    def test_keys_and_values(self):
+        for seed in SEEDS:
+            for participation in (True, False):
+                pages = build_gamebook(seed, participation)
+                with self.subTest(seed=seed, participation=participation), quiet():
+                    self.assert_same_doc(
+                        assemble_doc(iter_gamebook(pages)), parse_gamebook(pages)
+                    )
+
+    def test_round_trip_through_jsonl(self):
+        pages = build_gamebook(0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.jsonl")
+            with quiet():
+                with JsonLinesSink(path) as sink:
+                    stream_gamebook(pages, sink)
+                parsed = parse_gamebook(pages)
+            self.assert_same_doc(assemble_doc(read_jsonl(path)), parsed)
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+# Dependencies
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from gamebook import build_gamebook, quiet
+from scouter import _to_numeric, parse_gamebook
+from sections import TEAM_STATS
+
+
+# Classes
+class TestToNumeric(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(_to_numeric(["1", "-2", "30"]), [1, -2, 30])
+        self.assertEqual(_to_numeric(["1.5", "2"]), [1.5, 2.0])
+
+    def test_words_stay_strings(self):
+        for column in (["nan", "1"], ["Inf", "2"], ["1e3"], ["1", "Doe"]):
+            self.assertEqual(_to_numeric(column), column)
+
+
+class TestColumnar(unittest.TestCase):
+    def test_team_stats_ignore_columnar(self):
+        pages = build_gamebook(0)
+        with quiet():
+            rows = parse_gamebook(pages, sections=[TEAM_STATS])
+            columns = parse_gamebook(pages, sections=[TEAM_STATS], columnar=True)
+        self.assertEqual(rows, columns)
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()
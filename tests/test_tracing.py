@@ -0,0 +1,106 @@
+# Dependencies
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+sys.path.insert(0, SRC)
+
+from tracing import ENV_LEVEL, ENV_PATH, TRACER, init_worker, parse_level
+
+# Const. Vars
+WORKERS = 4
+
+
+# Funcs
+def _record_in_worker(number: int) -> int:
+    TRACER.record("worker", TRACER.start(), number=number)
+    return os.getpid()
+
+
+def _import_with_level(value: str, path: str) -> subprocess.CompletedProcess:
+    environment = dict(os.environ, **{ENV_LEVEL: value, ENV_PATH: path})
+    return subprocess.run(
+        [sys.executable, "-c", "import tracing; print(tracing.TRACER.level)"],
+        cwd=SRC,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+
+
+# Classes
+class TestParseLevel(unittest.TestCase):
+    def test_names_and_truthy_values(self):
+        self.assertEqual(parse_level("info"), logging.INFO)
+        self.assertEqual(parse_level("DEBUG"), logging.DEBUG)
+        self.assertEqual(parse_level("1"), logging.DEBUG)
+        self.assertEqual(parse_level("true"), logging.DEBUG)
+        self.assertEqual(parse_level(logging.WARNING), logging.WARNING)
+
+    def test_unknown_name_raises(self):
+        with self.assertRaises(ValueError):
+            parse_level("Level 1")
+
+    def test_environment(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.jsonl")
+
+            enabled = _import_with_level("1", path)
+            self.assertEqual(enabled.returncode, 0, enabled.stderr)
+            self.assertEqual(enabled.stdout.strip(), str(logging.DEBUG))
+
+            invalid = _import_with_level("bogus", path)
+            self.assertNotEqual(invalid.returncode, 0)
+            self.assertIn(ENV_LEVEL, invalid.stderr)
+
+
+class TestWorkerRecords(unittest.TestCase):
+    """Einträge aus den Workern eines Prozess-Pools landen in der Datei."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.jsonl")
+
+    def tearDown(self):
+        TRACER.disable()
+        self.directory.cleanup()
+
+    def _run_pool(self, method: str) -> tuple:
+        TRACER.enable(logging.DEBUG, path=self.path)
+        with ProcessPoolExecutor(
+            max_workers=WORKERS,
+            mp_context=multiprocessing.get_context(method),
+            initializer=init_worker,
+            initargs=(TRACER.worker_config(),),
+        ) as executor:
+            pids = set(executor.map(_record_in_worker, range(WORKERS * 2)))
+        TRACER.disable()
+
+        with open(self.path, encoding="utf-8") as trace_file:
+            entries = [json.loads(line) for line in trace_file]
+        return pids, entries
+
+    def _assert_all_records(self, method: str):
+        pids, entries = self._run_pool(method)
+        self.assertEqual(
+            sorted(entry["number"] for entry in entries), list(range(WORKERS * 2))
+        )
+        self.assertEqual({entry["pid"] for entry in entries}, pids)
+
+    def test_fork(self):
+        self._assert_all_records("fork")
+
+    def test_spawn(self):
+        self._assert_all_records("spawn")
+
+
+# Program
+if __name__ == "__main__":
+    unittest.main()